@@ -27,6 +27,29 @@ class CameraController:
         """
         return self.camera.capture_image(position, orientation, scene_description)
         
+    def capture_batch(self, poses, scene_descriptions, workers: Optional[int] = None):
+        """
+        Simulate capturing images at several poses in one call.
+        
+        Args:
+            poses: N camera poses, e.g. an (N, 6) array of [x, y, z, rx, ry, rz]
+            scene_descriptions: N scene descriptions
+            workers: Threads used for drawing the scenes (None draws serially)
+        Returns:
+            Tuple of (frames, results): an (N, height, width, 3) uint8 stack
+            and one inspection result per frame
+        """
+        return self.camera.capture_batch(poses, scene_descriptions, workers=workers)
+        
+    def release_image(self, image: np.ndarray):
+        """
+        Hand a captured image back to the camera for reuse.
+        
+        Args:
+            image: Image from capture_image; it must not be used afterwards
+        """
+        self.camera.release_frame(image)
+        
     def set_exposure(self, exposure_time: float):
         """
         Set the camera exposure time.
@@ -53,8 +76,7 @@ class CameraController:
             width: Image width in pixels
             height: Image height in pixels
         """
-        self.camera.width = width
-        self.camera.height = height
+        self.camera.set_resolution(width, height)
         
     def get_status(self) -> dict:
         """
@@ -1,6 +1,8 @@
 from typing import List, Tuple, Optional
 import numpy as np
 from app.models.robotic_arm import RoboticArm
+from app.models.trajectory import JointTrajectory, TimeOptimalTrajectory
+from app.models.motion_planner import MotionPlanner
 
 class RoboticArmController:
     """Controller for the robotic arm."""
@@ -16,6 +18,23 @@ class RoboticArmController:
         self.is_moving = False
         self.current_sequence = None
         
+        # Motion timing: profile used for planned moves, the last planned
+        # trajectory and the accumulated motion time since reset
+        self.motion_profile = "trapezoidal"
+        self.last_trajectory = None
+        self.total_motion_time = 0.0
+        
+        # Optional CollisionChecker; when set, every planned move is
+        # sampled every collision_check_dt seconds and rejected if any
+        # sample collides
+        self.collision_checker = None
+        self.collision_check_dt = 0.02
+        
+        # Sampling-based planner for moves the straight path cannot make;
+        # created from the collision checker on first use
+        self.motion_planner = None
+        self.last_plan_stats = None
+        
     def move_to_pose(self, position: List[float], orientation: List[float]) -> bool:
         """
         Move the arm to a specific position and orientation.
@@ -43,6 +62,74 @@ class RoboticArmController:
             print(f"Error during arm movement: {str(e)}")
             return False
         
+    def solve_poses(self, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Solve inverse kinematics for a whole set of poses in one batch.
+        
+        Args:
+            targets: (N, 6) array of [x, y, z, rx, ry, rz] poses
+            
+        Returns:
+            tuple: (solutions, converged) - (N, 6) joint angles and an (N,)
+            boolean mask of the rows that reached their pose
+        """
+        solutions, converged = self.arm.calculate_inverse_kinematics_batch(targets)
+        print(f"Solved inverse kinematics for {int(converged.sum())} of {len(converged)} poses")
+        return solutions, converged
+        
+    def plan_joint_motion(self, joint_angles: List[float],
+                          start: Optional[List[float]] = None) -> JointTrajectory:
+        """
+        Plan a synchronized joint-space move under the arm's motion limits.
+        
+        Args:
+            joint_angles: Target joint angles (in radians)
+            start: Start joint angles (defaults to the current joint angles)
+            
+        Returns:
+            JointTrajectory: Time-parameterized move; its duration is the
+            motion time in seconds
+        """
+        return JointTrajectory(
+            self.arm.joint_angles if start is None else start, joint_angles,
+            self.arm.max_joint_velocity, self.arm.max_joint_acceleration,
+            self.arm.max_joint_jerk, profile=self.motion_profile)
+        
+    def plan_path_motion(self, path: List[List[float]]) -> TimeOptimalTrajectory:
+        """
+        Time-optimal timing of a joint-space path under the arm's motion limits.
+        
+        Args:
+            path: Joint-space waypoints (in radians); the path starts at the
+                first waypoint, not at the current joint angles
+            
+        Returns:
+            TimeOptimalTrajectory: Fastest feasible traversal of the path
+        """
+        return TimeOptimalTrajectory(path, self.arm.max_joint_velocity,
+                                     self.arm.max_joint_acceleration)
+        
+    def trajectory_is_clear(self, trajectory) -> bool:
+        """
+        Check a planned trajectory against the collision checker.
+        
+        Args:
+            trajectory: JointTrajectory or TimeOptimalTrajectory
+            
+        Returns:
+            bool: True if no checker is set or every sample is collision free
+        """
+        if self.collision_checker is None:
+            return True
+        _, samples = trajectory.sample_uniform(self.collision_check_dt)
+        return bool(self.collision_checker.check_trajectory(samples).all())
+        
+    def _record_motion(self, trajectory):
+        """Account for an executed move on the arm's clock and motion totals."""
+        self.last_trajectory = trajectory
+        self.total_motion_time += trajectory.duration
+        self.arm.clock.advance(trajectory.duration)
+        
     def move_joint(self, joint_idx: int, target_angle: float) -> float:
         """
         Move a specific joint to a target angle.
@@ -79,6 +166,8 @@ class RoboticArmController:
         self.arm.reset()
         self.is_moving = False
         self.current_sequence = None
+        self.last_trajectory = None
+        self.total_motion_time = 0.0
         
     def is_busy(self) -> bool:
         """
@@ -118,14 +207,112 @@ class RoboticArmController:
             bool: True if all joints moved successfully, False otherwise
         """
         try:
-            for i, angle in enumerate(joint_angles):
-                print(f"Moving joint {i} to angle {angle}")
-                success = self.arm.move_joint(i, angle)
-                if not success:
-                    print(f"Failed to move joint {i}")
-                    return False
-            print("All joints moved successfully")
+            print(f"Moving joints to angles {list(joint_angles)}")
+            trajectory = self.plan_joint_motion(joint_angles)
+            if not self.trajectory_is_clear(trajectory):
+                print("Planned move collides with the part or the arm itself")
+                return False
+            # Apply the whole configuration in one update so the arm's
+            # cached kinematic state is rebuilt once, not once per joint.
+            if not self.arm.set_joint_angles(joint_angles):
+                for i, angle in enumerate(joint_angles):
+                    lo, hi = self.arm.joint_limits[i]
+                    if not lo <= angle <= hi:
+                        print(f"Failed to move joint {i}")
+                        break
+                return False
+            self._record_motion(trajectory)
+            print(f"All joints moved successfully (motion time {trajectory.duration:.3f} s)")
             return True
         except Exception as e:
             print(f"Error in move_to_joint_angles: {str(e)}")
-            return False 
\ No newline at end of file
+            return False
+
+    def move_along_path(self, path: List[List[float]]) -> bool:
+        """
+        Move the robotic arm through a joint-space path from its current angles.
+        
+        Args:
+            path: Joint-space waypoints (in radians) after the current angles
+        Returns:
+            bool: True if the whole path is within joint limits and was executed
+        """
+        try:
+            waypoints = np.vstack([self.arm.joint_angles, np.atleast_2d(path)])
+            for waypoint in waypoints[1:]:
+                if not self.arm._check_joint_limits(waypoint):
+                    print("Path leaves the joint limits")
+                    return False
+            trajectory = self.plan_path_motion(waypoints)
+            if not self.trajectory_is_clear(trajectory):
+                print("Planned path collides with the part or the arm itself")
+                return False
+            if not self.arm.set_joint_angles(list(waypoints[-1])):
+                return False
+            self._record_motion(trajectory)
+            print(f"Path of {len(waypoints) - 1} waypoints executed (motion time {trajectory.duration:.3f} s)")
+            return True
+        except Exception as e:
+            print(f"Error in move_along_path: {str(e)}")
+            return False
+
+    def move_around_obstacles(self, joint_angles: List[float], time_budget: float = 1.0) -> bool:
+        """
+        Move to joint angles, planning around collisions when needed.
+        
+        The straight joint-space move is tried first. If it collides, a
+        path is planned with the motion planner and followed as one
+        time-optimal trajectory; should the smoothed trajectory leave the
+        planned segments and collide, the segments are executed one by one.
+        
+        Args:
+            joint_angles: Target joint angles (in radians)
+            time_budget: Planning time budget in seconds
+        Returns:
+            bool: True if the arm reached the target
+        """
+        try:
+            if self.collision_checker is None or self.collision_checker.check_motion(
+                    self.arm.joint_angles, joint_angles):
+                return self.move_to_joint_angles(joint_angles)
+            if self.motion_planner is None:
+                self.motion_planner = MotionPlanner(self.arm, self.collision_checker)
+            path, self.last_plan_stats = self.motion_planner.plan(
+                self.arm.joint_angles, joint_angles, time_budget=time_budget)
+            if path is None:
+                print(f"No collision-free path found ({self.last_plan_stats['iterations']} iterations, "
+                      f"{self.last_plan_stats['planning_time']:.3f} s)")
+                return False
+            print(f"Planned collision-free path with {len(path)} waypoints "
+                  f"in {self.last_plan_stats['planning_time']:.3f} s")
+            if self.move_along_path(path[1:]):
+                return True
+            return all(self.move_to_joint_angles(list(waypoint)) for waypoint in path[1:])
+        except Exception as e:
+            print(f"Error in move_around_obstacles: {str(e)}")
+            return False
+
+    def execute_trajectory(self, trajectory, goal: Optional[List[float]] = None) -> bool:
+        """
+        Execute a precomputed trajectory without any planning.
+        
+        Args:
+            trajectory: Trajectory that starts at the current joint angles,
+                e.g. a SampledTrajectory loaded from a compiled plan
+            goal: Exact final joint angles (defaults to the trajectory's goal)
+        Returns:
+            bool: True if the trajectory was executed
+        """
+        try:
+            if not np.allclose(self.arm.joint_angles, trajectory.start, atol=1e-5):
+                print("Arm is not at the start of the trajectory")
+                return False
+            target = trajectory.goal if goal is None else goal
+            if not self.arm.set_joint_angles(list(target)):
+                print("Trajectory ends outside the joint limits")
+                return False
+            self._record_motion(trajectory)
+            return True
+        except Exception as e:
+            print(f"Error in execute_trajectory: {str(e)}")
+            return False
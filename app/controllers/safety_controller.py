@@ -1,6 +1,5 @@
 from typing import List, Dict, Optional
 from app.models.safety_system import SafetySystem
-import time
 
 class SafetyController:
     """Controller for the safety system."""
@@ -60,7 +59,7 @@ class SafetyController:
         self.safety_system.trigger_emergency_stop()
         self.safety_events.append({
             'type': 'emergency_stop',
-            'timestamp': time.time()
+            'timestamp': self.safety_system.clock.time()
         })
         
     def reset_emergency_stop(self):
@@ -68,7 +67,7 @@ class SafetyController:
         self.safety_system.reset_emergency_stop()
         self.safety_events.append({
             'type': 'emergency_stop_reset',
-            'timestamp': time.time()
+            'timestamp': self.safety_system.clock.time()
         })
         
     def set_light_curtain_state(self, is_clear: bool):
@@ -85,7 +84,7 @@ class SafetyController:
         self.safety_events.append({
             'type': 'light_curtain',
             'state': is_clear,
-            'timestamp': time.time()
+            'timestamp': self.safety_system.clock.time()
         })
         
     def set_door_state(self, is_closed: bool):
@@ -102,7 +101,7 @@ class SafetyController:
         self.safety_events.append({
             'type': 'door',
             'state': is_closed,
-            'timestamp': time.time()
+            'timestamp': self.safety_system.clock.time()
         })
         
     def get_safety_events(self) -> List[Dict]:
@@ -131,7 +130,7 @@ class SafetyController:
         
     def reset(self):
         """Reset safety system to default state."""
-        self.safety_system = SafetySystem()
+        self.safety_system = SafetySystem(self.safety_system.clock)
         self.safety_events = []
         
     def reset_safety_system(self) -> bool:
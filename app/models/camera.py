@@ -1,19 +1,140 @@
 import numpy as np
 import cv2
-from typing import Tuple, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Optional, Dict, Any, List, Sequence
+
+from app.models.frame_pool import FramePool
+from app.models.render_cache import RenderCache
+from app.models.sensor_noise import SensorNoise
+
+# Exposure (ms) at which rendered scenes have their nominal brightness
+REFERENCE_EXPOSURE_MS = 10.0
 
 class Camera:
-    def __init__(self, resolution: Tuple[int, int] = (640, 480)):
+    def __init__(self, resolution: Tuple[int, int] = (640, 480),
+                 noise_seed: Optional[int] = None):
         """
         Initialize simulated camera.
         
         Args:
             resolution: Camera resolution (width, height)
+            noise_seed: Seed for the sensor noise, for reproducible frames
         """
-        self.resolution = resolution
+        self.resolution = tuple(resolution)
         self.focal_length = 500  # pixels
         self.principal_point = (resolution[0] // 2, resolution[1] // 2)
         
+        # Sensor settings, applied to rendered scenes through a 256-entry
+        # lookup table that is rebuilt only when one of them changes
+        self.exposure_time = REFERENCE_EXPOSURE_MS  # ms
+        self.gain = 1.0
+        self.black_level = 0   # DN
+        self.gamma = 1.0
+        self._lut = None
+        self._lut_for = None
+        
+        # Captured frames come from a pool; release them with release_frame
+        # once analyzed so the next capture reuses the buffer.
+        self.frame_pool = FramePool(self._frame_shape())
+        self.noise = SensorNoise(seed=noise_seed)
+        self.noise.configure(self._frame_shape())
+        
+        # Base frames of deterministic scenes, reused across captures
+        self.render_cache = RenderCache()
+        
+    @property
+    def width(self) -> int:
+        return self.resolution[0]
+        
+    @property
+    def height(self) -> int:
+        return self.resolution[1]
+        
+    def set_resolution(self, width: int, height: int):
+        """
+        Change the resolution, resizing the buffers and intrinsics once.
+        
+        Args:
+            width: Image width in pixels
+            height: Image height in pixels
+            
+        Raises:
+            ValueError: If either dimension is not positive
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Invalid resolution {width}x{height}")
+        self.resolution = (int(width), int(height))
+        self._ensure_buffers()
+        
+    def set_exposure(self, exposure_time: float):
+        """
+        Set the exposure time.
+        
+        Args:
+            exposure_time: Exposure time in milliseconds
+            
+        Raises:
+            ValueError: If the exposure time is negative
+        """
+        if exposure_time < 0:
+            raise ValueError(f"Invalid exposure time {exposure_time} ms")
+        self.exposure_time = float(exposure_time)
+        
+    def set_gain(self, gain: float):
+        """
+        Set the analog gain; it also scales the sensor noise.
+        
+        Args:
+            gain: Gain factor (1.0 is unity)
+            
+        Raises:
+            ValueError: If the gain is not positive
+        """
+        if gain <= 0:
+            raise ValueError(f"Invalid gain {gain}")
+        self.gain = float(gain)
+        
+    def _frame_shape(self) -> Tuple[int, int, int]:
+        return (self.resolution[1], self.resolution[0], 3)
+        
+    def _ensure_buffers(self):
+        """Resize the frame pool, noise tiles and intrinsics after a resolution change."""
+        shape = self._frame_shape()
+        if self.frame_pool.shape != shape:
+            self.frame_pool.resize(shape)
+            self.noise.configure(shape)
+            self.principal_point = (self.resolution[0] // 2, self.resolution[1] // 2)
+            
+    def sensor_lut(self) -> Optional[np.ndarray]:
+        """
+        Lookup table from rendered scene values to sensor output.
+        
+        Scales the scene by exposure_time / REFERENCE_EXPOSURE_MS and the
+        gain, clips at full scale, applies the gamma and maps the result
+        onto [black_level, 255].
+        
+        Returns:
+            (256,) uint8 table, or None if the settings make it the identity
+        """
+        settings = (self.exposure_time, self.gain, self.black_level, self.gamma)
+        if settings != self._lut_for:
+            exposure = self.exposure_time / REFERENCE_EXPOSURE_MS * self.gain
+            signal = np.clip(np.arange(256) / 255.0 * exposure, 0.0, 1.0) ** (1.0 / self.gamma)
+            lut = np.rint(self.black_level + (255 - self.black_level) * signal).astype(np.uint8)
+            self._lut = None if np.array_equal(lut, np.arange(256)) else lut
+            self._lut_for = settings
+        return self._lut
+            
+    def release_frame(self, image: np.ndarray):
+        """
+        Return a frame from capture_image to the pool.
+        
+        Args:
+            image: Frame returned by capture_image; it must not be used
+                afterwards
+        """
+        self.frame_pool.release(image)
+        
     def capture_image(self, position: np.ndarray, orientation: np.ndarray,
                      scene_description: Dict[str, Any]) -> Tuple[np.ndarray, Dict[str, Any]]:
         """
@@ -25,36 +146,117 @@ class Camera:
             scene_description: Dictionary describing the scene to simulate
             
         Returns:
-            Tuple of (image, inspection_results)
+            Tuple of (image, inspection_results). The image is a pooled
+            buffer; pass it to release_frame when done with it.
+        """
+        self._ensure_buffers()
+        image = self.frame_pool.acquire()
+        _, results = self.capture_batch([(position, orientation)], [scene_description],
+                                        out=image[None])
+        return image, results[0]
+    
+    def capture_batch(self, poses: Sequence, scene_descriptions: List[Dict[str, Any]],
+                      out: Optional[np.ndarray] = None,
+                      workers: Optional[int] = None) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """
+        Simulate capturing N images into one contiguous frame stack.
+        
+        Scenes in the render cache are copied in; the rest are drawn once
+        per distinct scene, optionally on a thread pool (cv2 drawing
+        releases the GIL). Noise is then added over the whole stack.
+        
+        Args:
+            poses: N camera poses; the simulation does not depend on them
+            scene_descriptions: N dictionaries describing the scenes
+            out: Optional preallocated (N, height, width, 3) uint8 array
+            workers: Threads used for drawing; None or 1 draws serially
+            
+        Returns:
+            Tuple of (frames, inspection_results): the (N, height, width, 3)
+            stack and one result dict per frame
         """
-        # Create a blank image
-        image = np.zeros((self.resolution[1], self.resolution[0], 3), dtype=np.uint8)
+        self._ensure_buffers()
+        shape = (len(scene_descriptions),) + self._frame_shape()
+        if out is None:
+            frames = np.empty(shape, dtype=np.uint8)
+        elif out.shape != shape or out.dtype != np.uint8:
+            raise ValueError(f"Frame stack must be uint8 with shape {shape}, got {out.dtype} {out.shape}")
+        else:
+            frames = out
         
-        # Simulate different types of scenes based on description
-        if 'type' in scene_description:
-            if scene_description['type'] == 'color_check':
-                image = self._simulate_color_check(scene_description)
-            elif scene_description['type'] == 'shape_detection':
-                image = self._simulate_shape_detection(scene_description)
-            elif scene_description['type'] == 'text_reading':
-                image = self._simulate_text_reading(scene_description)
+        # Deterministic scenes are drawn once and copied afterwards
+        to_render, drawn, duplicates = [], {}, []
+        for i, description in enumerate(scene_descriptions):
+            key = self._scene_key(description)
+            base = self.render_cache.get(key) if key is not None else None
+            if base is not None:
+                np.copyto(frames[i], base)
+            elif key in drawn:
+                duplicates.append((i, drawn[key]))
             else:
-                image = self._simulate_random_scene()
+                to_render.append(i)
+                if key is not None:
+                    drawn[key] = i
+        
+        def render(i: int):
+            self._render_scene(scene_descriptions[i], frames[i])
+        
+        if workers is not None and workers > 1 and len(to_render) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(render, to_render))
         else:
-            image = self._simulate_random_scene()
+            for i in to_render:
+                render(i)
+        for key, i in drawn.items():
+            self.render_cache.put(key, frames[i])
+        for i, source in duplicates:
+            np.copyto(frames[i], frames[source])
             
-        # Add some noise to make it more realistic
-        noise = np.random.normal(0, 10, image.shape).astype(np.uint8)
-        image = cv2.add(image, noise)
+        # Sensor response, then noise at the current gain
+        lut = self.sensor_lut()
+        if lut is not None:
+            for frame in frames:
+                cv2.LUT(frame, lut, dst=frame)
+        self.noise.gain = self.gain
+        self.noise.apply_batch(frames)
         
         # Simulate inspection results
-        results = self._simulate_inspection(image, scene_description)
+        results = [self._simulate_inspection(frame, description)
+                   for frame, description in zip(frames, scene_descriptions)]
         
-        return image, results
-    
-    def _simulate_color_check(self, description: Dict[str, Any]) -> np.ndarray:
-        """Simulate a color check scene."""
-        image = np.zeros((self.resolution[1], self.resolution[0], 3), dtype=np.uint8)
+        return frames, results
+        
+    def _scene_key(self, description: Dict[str, Any]) -> Optional[str]:
+        """
+        Render cache key of a scene, or None if it must be drawn every time.
+        
+        Color checks and text are always the same for the same description;
+        shapes and random scenes only when the description has a 'seed'.
+        """
+        if not isinstance(description, dict):
+            return None
+        if description.get('type') in ('color_check', 'text_reading') or 'seed' in description:
+            return RenderCache.key(description, self.resolution)
+        return None
+        
+    def _render_scene(self, description: Dict[str, Any], image: np.ndarray) -> np.ndarray:
+        """Draw the scene for a description into a blank image."""
+        image.fill(0)
+        rng = np.random.default_rng(description.get('seed') if isinstance(description, dict) else None)
+        
+        # Simulate different types of scenes based on description
+        if 'type' in description:
+            if description['type'] == 'color_check':
+                return self._simulate_color_check(description, image)
+            elif description['type'] == 'shape_detection':
+                return self._simulate_shape_detection(description, image, rng)
+            elif description['type'] == 'text_reading':
+                return self._simulate_text_reading(description, image)
+        return self._simulate_random_scene(image, rng)
+        
+    def _simulate_color_check(self, description: Dict[str, Any],
+                              image: np.ndarray) -> np.ndarray:
+        """Simulate a color check scene into image."""
         
         # Draw color patches
         colors = description.get('expected_colors', [
@@ -71,41 +273,41 @@ class Camera:
             
         return image
     
-    def _simulate_shape_detection(self, description: Dict[str, Any]) -> np.ndarray:
-        """Simulate a shape detection scene."""
-        image = np.zeros((self.resolution[1], self.resolution[0], 3), dtype=np.uint8)
+    def _simulate_shape_detection(self, description: Dict[str, Any],
+                                  image: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Simulate a shape detection scene into image."""
         
         # Draw random shapes
         shapes = description.get('expected_shapes', ['circle', 'square', 'triangle'])
         for shape in shapes:
             if shape == 'circle':
                 cv2.circle(image, 
-                          (np.random.randint(100, self.resolution[0]-100),
-                           np.random.randint(100, self.resolution[1]-100)),
+                          (int(rng.integers(100, self.resolution[0]-100)),
+                           int(rng.integers(100, self.resolution[1]-100))),
                           50, (0, 255, 0), -1)
             elif shape == 'square':
                 cv2.rectangle(image,
-                            (np.random.randint(100, self.resolution[0]-150),
-                             np.random.randint(100, self.resolution[1]-150)),
-                            (np.random.randint(200, self.resolution[0]-50),
-                             np.random.randint(200, self.resolution[1]-50)),
+                            (int(rng.integers(100, self.resolution[0]-150)),
+                             int(rng.integers(100, self.resolution[1]-150))),
+                            (int(rng.integers(200, self.resolution[0]-50)),
+                             int(rng.integers(200, self.resolution[1]-50))),
                             (255, 0, 0), -1)
             elif shape == 'triangle':
                 pts = np.array([
-                    [np.random.randint(100, self.resolution[0]-100),
-                     np.random.randint(100, self.resolution[1]-100)],
-                    [np.random.randint(100, self.resolution[0]-100),
-                     np.random.randint(100, self.resolution[1]-100)],
-                    [np.random.randint(100, self.resolution[0]-100),
-                     np.random.randint(100, self.resolution[1]-100)]
+                    [int(rng.integers(100, self.resolution[0]-100)),
+                     int(rng.integers(100, self.resolution[1]-100))],
+                    [int(rng.integers(100, self.resolution[0]-100)),
+                     int(rng.integers(100, self.resolution[1]-100))],
+                    [int(rng.integers(100, self.resolution[0]-100)),
+                     int(rng.integers(100, self.resolution[1]-100))]
                 ])
                 cv2.fillPoly(image, [pts], (0, 0, 255))
                 
         return image
     
-    def _simulate_text_reading(self, description: Dict[str, Any]) -> np.ndarray:
-        """Simulate a text reading scene."""
-        image = np.zeros((self.resolution[1], self.resolution[0], 3), dtype=np.uint8)
+    def _simulate_text_reading(self, description: Dict[str, Any],
+                               image: np.ndarray) -> np.ndarray:
+        """Simulate a text reading scene into image."""
         
         # Draw text
         text = description.get('expected_text', 'TEST123')
@@ -116,19 +318,18 @@ class Camera:
                    
         return image
     
-    def _simulate_random_scene(self) -> np.ndarray:
-        """Generate a random scene for testing."""
-        image = np.zeros((self.resolution[1], self.resolution[0], 3), dtype=np.uint8)
+    def _simulate_random_scene(self, image: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Generate a random scene into image for testing."""
         
         # Add some random shapes and colors
         for _ in range(5):
-            color = (np.random.randint(0, 255),
-                    np.random.randint(0, 255),
-                    np.random.randint(0, 255))
+            color = (int(rng.integers(0, 255)),
+                    int(rng.integers(0, 255)),
+                    int(rng.integers(0, 255)))
             cv2.circle(image,
-                      (np.random.randint(0, self.resolution[0]),
-                       np.random.randint(0, self.resolution[1])),
-                      np.random.randint(10, 50),
+                      (int(rng.integers(0, self.resolution[0])),
+                       int(rng.integers(0, self.resolution[1]))),
+                      int(rng.integers(10, 50)),
                       color, -1)
                       
         return image
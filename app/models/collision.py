@@ -0,0 +1,418 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+# Golden-section iterations for the capsule-box distance; each shrinks the
+# search interval along the segment by 0.618.
+_GOLDEN_ITERATIONS = 40
+_INV_PHI = (np.sqrt(5.0) - 1.0) / 2.0
+
+
+class Capsule:
+    """Segment with a radius, fixed in one of the arm's DH frames."""
+
+    def __init__(self, frame: int, start: Sequence[float], end: Sequence[float], radius: float):
+        """
+        Define a capsule.
+
+        Args:
+            frame: Index into the arm's frames (0 = base, i = after joint i)
+            start: Segment start in frame coordinates (m)
+            end: Segment end in frame coordinates (m)
+            radius: Capsule radius (m)
+        """
+        self.frame = frame
+        self.start = np.asarray(start, dtype=float)
+        self.end = np.asarray(end, dtype=float)
+        self.radius = float(radius)
+
+
+class OrientedBox:
+    """Box with a center, half extents and rotation, e.g. the inspected part."""
+
+    def __init__(self, center: Sequence[float], half_extents: Sequence[float],
+                 rotation: Optional[np.ndarray] = None):
+        """
+        Define a box.
+
+        Args:
+            center: Box center in the arm base frame (m)
+            half_extents: Half of the box size along its own axes (m)
+            rotation: 3x3 rotation from box axes to the base frame
+        """
+        self.center = np.asarray(center, dtype=float)
+        self.half_extents = np.asarray(half_extents, dtype=float)
+        self.rotation = np.eye(3) if rotation is None else np.asarray(rotation, dtype=float)
+
+    @classmethod
+    def from_dimensions(cls, dimensions: Dict[str, float], center: Sequence[float],
+                        yaw: float = 0.0) -> "OrientedBox":
+        """
+        Box for a part from its configured dimensions.
+
+        Args:
+            dimensions: Part 'length', 'width' and 'height' in mm, as in the
+                inspection configuration
+            center: Part center in the arm base frame (m)
+            yaw: Rotation of the part about the vertical axis (radians)
+
+        Returns:
+            OrientedBox in metres
+        """
+        size = np.array([dimensions["length"], dimensions["width"], dimensions["height"]], dtype=float)
+        c, s = np.cos(yaw), np.sin(yaw)
+        rotation = np.array([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]])
+        return cls(center, size * 1e-3 / 2.0, rotation)
+
+    def aabb(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Axis-aligned bounds in the base frame."""
+        extent = np.abs(self.rotation) @ self.half_extents
+        return self.center - extent, self.center + extent
+
+    def signed_distance(self, points: np.ndarray) -> np.ndarray:
+        """
+        Signed distance from points to the box surface, negative inside.
+
+        Args:
+            points: (..., 3) points in the base frame
+
+        Returns:
+            Array of distances with shape points.shape[:-1]
+        """
+        local = np.abs((points - self.center) @ self.rotation) - self.half_extents
+        outside = np.linalg.norm(np.maximum(local, 0.0), axis=-1)
+        inside = np.minimum(local.max(axis=-1), 0.0)
+        return outside + inside
+
+
+def arm_capsules(arm, radii: Optional[Sequence[float]] = None,
+                 tool_length: float = 0.1, tool_radius: float = 0.04) -> List[Capsule]:
+    """
+    Capsules along the arm's links, derived from its DH parameters.
+
+    Each joint's offset d runs along the z-axis of the frame before it and
+    its length a along the x-axis of the frame after it, so a link with
+    both gets two capsules. The camera is a capsule along the tool z-axis.
+
+    Args:
+        arm: RoboticArm providing dh_params
+        radii: Capsule radius per DH row (m)
+        tool_length: Length of the tool capsule (m)
+        tool_radius: Radius of the tool capsule (m)
+
+    Returns:
+        Capsules in order from the base to the tool
+    """
+    if radii is None:
+        radii = [0.075, 0.075, 0.06, 0.05, 0.045, 0.045]
+    capsules = []
+    for i, ((a, _, d, _), radius) in enumerate(zip(arm.dh_params, radii)):
+        if d:
+            capsules.append(Capsule(i, (0.0, 0.0, 0.0), (0.0, 0.0, d), radius))
+        if a:
+            capsules.append(Capsule(i + 1, (-a, 0.0, 0.0), (0.0, 0.0, 0.0), radius))
+    if tool_length > 0:
+        capsules.append(Capsule(len(arm.dh_params), (0.0, 0.0, 0.0),
+                                (0.0, 0.0, tool_length), tool_radius))
+    return capsules
+
+
+def segment_segment_distance(p0: np.ndarray, p1: np.ndarray,
+                             q0: np.ndarray, q1: np.ndarray) -> np.ndarray:
+    """
+    Closest distance between segments p0-p1 and q0-q1, vectorized.
+
+    Args:
+        p0, p1, q0, q1: (..., 3) segment endpoints
+
+    Returns:
+        Distances with shape p0.shape[:-1]
+    """
+    d1 = p1 - p0
+    d2 = q1 - q0
+    r = p0 - q0
+    a = np.einsum("...i,...i", d1, d1)
+    e = np.einsum("...i,...i", d2, d2)
+    f = np.einsum("...i,...i", d2, r)
+    c = np.einsum("...i,...i", d1, r)
+    b = np.einsum("...i,...i", d1, d2)
+    eps = 1e-12
+    denom = a * e - b * b
+
+    # Closest point on the infinite lines, clamped to the first segment;
+    # parallel and degenerate segments fall back to s = 0.
+    s = np.where(denom > eps, np.clip((b * f - c * e) / np.where(denom > eps, denom, 1.0), 0.0, 1.0), 0.0)
+    # A degenerate second segment is a point: project it onto the first.
+    s = np.where(e > eps, s, np.clip(-c / np.where(a > eps, a, 1.0), 0.0, 1.0))
+    s = np.where(a > eps, s, 0.0)
+    t = np.where(e > eps, (b * s + f) / np.where(e > eps, e, 1.0), 0.0)
+    # If t leaves [0, 1], clamp it and recompute s for the clamped t.
+    t_clamped = np.clip(t, 0.0, 1.0)
+    s = np.where((t != t_clamped) & (a > eps),
+                 np.clip((b * t_clamped - c) / np.where(a > eps, a, 1.0), 0.0, 1.0), s)
+    closest_p = p0 + d1 * s[..., None]
+    closest_q = q0 + d2 * t_clamped[..., None]
+    return np.linalg.norm(closest_p - closest_q, axis=-1)
+
+
+def segment_box_distance(p0: np.ndarray, p1: np.ndarray, box: OrientedBox) -> np.ndarray:
+    """
+    Signed distance from segments to a box, vectorized.
+
+    The signed distance to a convex box is a convex function of the
+    position along the segment, so a golden-section search over the
+    segment parameter finds its minimum for all segments at once.
+
+    Args:
+        p0, p1: (..., 3) segment endpoints
+        box: OrientedBox to measure against
+
+    Returns:
+        Distances with shape p0.shape[:-1], negative if the segment
+        passes through the box
+    """
+    d = p1 - p0
+    lo = np.zeros(p0.shape[:-1])
+    hi = np.ones(p0.shape[:-1])
+    x1 = hi - _INV_PHI * (hi - lo)
+    x2 = lo + _INV_PHI * (hi - lo)
+    f1 = box.signed_distance(p0 + d * x1[..., None])
+    f2 = box.signed_distance(p0 + d * x2[..., None])
+    for _ in range(_GOLDEN_ITERATIONS):
+        # Keep the side of the interval holding the smaller value.
+        left = f1 < f2
+        hi = np.where(left, x2, hi)
+        lo = np.where(left, lo, x1)
+        x_new = np.where(left, hi - _INV_PHI * (hi - lo), lo + _INV_PHI * (hi - lo))
+        f_new = box.signed_distance(p0 + d * x_new[..., None])
+        x1, x2 = np.where(left, x_new, x2), np.where(left, x1, x_new)
+        f1, f2 = np.where(left, f_new, f2), np.where(left, f1, f_new)
+    ends = np.minimum(box.signed_distance(p0), box.signed_distance(p1))
+    return np.minimum(np.minimum(f1, f2), ends)
+
+
+class TimeBVH:
+    """
+    Bounding-volume hierarchy over the samples of a trajectory.
+
+    Leaves are the per-sample axis-aligned bounds of every item (capsule);
+    each level above merges pairs of consecutive samples, so a node bounds
+    an item over a contiguous stretch of the trajectory. Queries descend
+    only into nodes whose bounds overlap, which prunes whole time spans of
+    a move that stays clear of an obstacle with a handful of box tests.
+    """
+
+    def __init__(self, mins: np.ndarray, maxs: np.ndarray):
+        """
+        Build the hierarchy.
+
+        Args:
+            mins: (N, K, 3) per-sample, per-item lower bounds
+            maxs: (N, K, 3) per-sample, per-item upper bounds
+        """
+        self.levels = [(mins, maxs)]
+        while len(self.levels[-1][0]) > 1:
+            lo, hi = self.levels[-1]
+            if len(lo) % 2:
+                lo = np.concatenate([lo, lo[-1:]])
+                hi = np.concatenate([hi, hi[-1:]])
+            self.levels.append((np.minimum(lo[0::2], lo[1::2]), np.maximum(hi[0::2], hi[1::2])))
+
+    def _descend(self, n_queries: int, overlap) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Collect the leaves that pass the overlap test at every level.
+
+        Args:
+            n_queries: Number of queries, each starting at the root
+            overlap: Function (lo, hi, nodes, queries) -> bool mask, given
+                the bounds of one level
+
+        Returns:
+            Tuple of (samples, queries) index arrays of candidate leaves
+        """
+        top = len(self.levels) - 1
+        nodes = np.zeros(n_queries, dtype=int)
+        queries = np.arange(n_queries)
+        for level in range(top, -1, -1):
+            lo, hi = self.levels[level]
+            if level < top:
+                # Expand each surviving node into its two children.
+                nodes = np.concatenate([2 * nodes, 2 * nodes + 1])
+                queries = np.concatenate([queries, queries])
+                valid = nodes < len(lo)
+                nodes, queries = nodes[valid], queries[valid]
+            keep = overlap(lo, hi, nodes, queries)
+            nodes, queries = nodes[keep], queries[keep]
+            if not len(nodes):
+                break
+        return nodes, queries
+
+    def query_box(self, box_min: np.ndarray, box_max: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (sample, item) pairs whose bounds overlap an axis-aligned box.
+
+        Args:
+            box_min: Lower corner of the box
+            box_max: Upper corner of the box
+
+        Returns:
+            Tuple of (samples, items) index arrays
+        """
+        def overlap(lo, hi, nodes, items):
+            return np.all((lo[nodes, items] <= box_max) & (hi[nodes, items] >= box_min), axis=-1)
+        return self._descend(self.levels[0][0].shape[1], overlap)
+
+    def query_pairs(self, pairs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (sample, pair) combinations where two items' bounds overlap.
+
+        Args:
+            pairs: (P, 2) item index pairs
+
+        Returns:
+            Tuple of (samples, pair indices) index arrays
+        """
+        first, second = pairs[:, 0], pairs[:, 1]
+
+        def overlap(lo, hi, nodes, queries):
+            i, j = first[queries], second[queries]
+            return np.all((lo[nodes, i] <= hi[nodes, j]) & (lo[nodes, j] <= hi[nodes, i]), axis=-1)
+        return self._descend(len(pairs), overlap)
+
+
+class CollisionChecker:
+    """
+    Clearance queries for the arm against itself and fixed obstacles.
+
+    Links are capsules attached to the arm's DH frames and obstacles, such
+    as the inspected part, are oriented boxes. Queries take whole batches
+    of configurations, e.g. every sample of a planned move, and evaluate
+    them with one batched FK call: a time BVH over the samples picks the
+    (sample, capsule) candidates whose bounds touch an obstacle or another
+    capsule, and only those get an exact distance.
+    """
+
+    def __init__(self, arm, obstacles: Optional[List[OrientedBox]] = None,
+                 capsules: Optional[List[Capsule]] = None, margin: float = 0.0,
+                 self_collision: bool = True):
+        """
+        Initialize the checker.
+
+        Args:
+            arm: RoboticArm whose kinematics place the capsules
+            obstacles: Boxes the arm must not touch
+            capsules: Link geometry; defaults to arm_capsules(arm)
+            margin: Extra clearance required from obstacles (m); the
+                wrist capsules sit within millimetres of each other by
+                design, so self-collision only requires them not to overlap
+            self_collision: Also check capsules against each other
+        """
+        self.arm = arm
+        self.obstacles = list(obstacles) if obstacles else []
+        self.capsules = capsules if capsules is not None else arm_capsules(arm)
+        self.margin = margin
+
+        self._frames = np.array([c.frame for c in self.capsules])
+        self._starts = np.array([c.start for c in self.capsules])
+        self._ends = np.array([c.end for c in self.capsules])
+        self._radii = np.array([c.radius for c in self.capsules])
+        # Consecutive capsules share an endpoint and always touch.
+        n = len(self.capsules)
+        self.self_pairs = np.array([(i, j) for i in range(n) for j in range(i + 2, n)]
+                                   if self_collision else [], dtype=int).reshape(-1, 2)
+
+    def capsule_segments(self, joint_angles: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        World-frame capsule endpoints for N configurations.
+
+        Args:
+            joint_angles: (N, 6) joint angles in radians
+
+        Returns:
+            Tuple of (starts, ends), each (N, n_capsules, 3)
+        """
+        _, frames = self.arm.forward_kinematics_batch(joint_angles, return_frames=True)
+        F = frames[:, self._frames]
+        R, origin = F[..., :3, :3], F[..., :3, 3]
+        starts = origin + np.einsum("nkij,kj->nki", R, self._starts)
+        ends = origin + np.einsum("nkij,kj->nki", R, self._ends)
+        return starts, ends
+
+    def clearances(self, joint_angles: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Exact clearances for every sample, capsule and pair (no pruning).
+
+        Args:
+            joint_angles: (N, 6) joint angles in radians
+
+        Returns:
+            dict with 'obstacles' (N, n_obstacles, n_capsules) and 'self'
+            (N, n_pairs) clearances in metres, negative when penetrating
+        """
+        Q = np.atleast_2d(np.asarray(joint_angles, dtype=float))
+        starts, ends = self.capsule_segments(Q)
+        obstacle = np.stack([segment_box_distance(starts, ends, box) - self._radii
+                             for box in self.obstacles], axis=1) \
+            if self.obstacles else np.zeros((len(Q), 0, len(self.capsules)))
+        i, j = self.self_pairs[:, 0], self.self_pairs[:, 1]
+        pair = (segment_segment_distance(starts[:, i], ends[:, i], starts[:, j], ends[:, j]) -
+                self._radii[i] - self._radii[j])
+        return {"obstacles": obstacle, "self": pair}
+
+    def check_trajectory(self, joint_angles: np.ndarray) -> np.ndarray:
+        """
+        Collision-free flags for every sample of a trajectory.
+
+        Args:
+            joint_angles: (N, 6) joint angles in radians, e.g. the samples
+                of a planned move
+
+        Returns:
+            (N,) boolean array, True where the configuration keeps the
+            margin from every obstacle and no two capsules overlap
+        """
+        Q = np.atleast_2d(np.asarray(joint_angles, dtype=float))
+        starts, ends = self.capsule_segments(Q)
+        pad = (self._radii + self.margin)[None, :, None]
+        bvh = TimeBVH(np.minimum(starts, ends) - pad, np.maximum(starts, ends) + pad)
+        free = np.ones(len(Q), dtype=bool)
+
+        for box in self.obstacles:
+            samples, items = bvh.query_box(*box.aabb())
+            if len(samples):
+                d = segment_box_distance(starts[samples, items], ends[samples, items], box)
+                hit = d - self._radii[items] < self.margin
+                free[samples[hit]] = False
+
+        if len(self.self_pairs):
+            # The margin-padded bounds are conservative for pairs.
+            samples, pairs = bvh.query_pairs(self.self_pairs)
+            if len(samples):
+                i, j = self.self_pairs[pairs, 0], self.self_pairs[pairs, 1]
+                d = segment_segment_distance(starts[samples, i], ends[samples, i],
+                                             starts[samples, j], ends[samples, j])
+                hit = d - self._radii[i] - self._radii[j] < 0.0
+                free[samples[hit]] = False
+        return free
+
+    def is_collision_free(self, joint_angles: np.ndarray) -> bool:
+        """True if a single configuration keeps the required clearance."""
+        return bool(self.check_trajectory(np.asarray(joint_angles, dtype=float)[None])[0])
+
+    def check_motion(self, start: np.ndarray, goal: np.ndarray,
+                     resolution: float = 0.05) -> bool:
+        """
+        Check the straight joint-space motion between two configurations.
+
+        Args:
+            start: Start joint angles (radians)
+            goal: Goal joint angles (radians)
+            resolution: Largest joint step between checked samples (radians)
+
+        Returns:
+            bool: True if every sample along the motion is collision free
+        """
+        start = np.asarray(start, dtype=float)
+        goal = np.asarray(goal, dtype=float)
+        steps = max(int(np.ceil(np.max(np.abs(goal - start)) / resolution)), 1)
+        t = np.linspace(0.0, 1.0, steps + 1)[:, None]
+        return bool(self.check_trajectory(start + t * (goal - start)).all())
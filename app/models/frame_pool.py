@@ -0,0 +1,99 @@
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+import numpy as np
+
+
+class FramePool:
+    """
+    Reusable image buffers of one shape and dtype.
+
+    acquire() hands out a free buffer, or allocates one if none is free,
+    with a reference count of 1; retain() and release() raise and lower
+    the count, and a buffer whose count drops to zero goes back on the
+    free list. Frames that are dropped without being released are simply
+    garbage collected. Resizing the pool discards the free buffers, and
+    outstanding buffers of the old shape are not taken back.
+    """
+
+    def __init__(self, shape: Tuple[int, ...], dtype=np.uint8, max_free: int = 4):
+        """
+        Initialize an empty pool.
+
+        Args:
+            shape: Shape of every buffer, e.g. (height, width, 3)
+            dtype: Buffer dtype
+            max_free: Most released buffers kept for reuse
+        """
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.max_free = max_free
+        self._free: List[np.ndarray] = []
+        # id(buffer) -> [weak reference, reference count] for frames handed out
+        self._outstanding: Dict[int, list] = {}
+        self.stats = {"allocated": 0, "reused": 0}
+
+    def __len__(self) -> int:
+        """Number of frames currently handed out."""
+        return len(self._outstanding)
+
+    def resize(self, shape: Tuple[int, ...]) -> None:
+        """Switch to a new buffer shape, dropping the free buffers."""
+        shape = tuple(shape)
+        if shape != self.shape:
+            self.shape = shape
+            self._free.clear()
+
+    def acquire(self) -> np.ndarray:
+        """
+        Take a buffer from the pool.
+
+        Returns:
+            Buffer of the pool's shape and dtype with undefined contents
+        """
+        if self._free:
+            frame = self._free.pop()
+            self.stats["reused"] += 1
+        else:
+            frame = np.empty(self.shape, dtype=self.dtype)
+            self.stats["allocated"] += 1
+        key = id(frame)
+        self._outstanding[key] = [weakref.ref(frame, lambda _, key=key: self._outstanding.pop(key, None)), 1]
+        return frame
+
+    def _entry(self, frame: np.ndarray) -> list:
+        entry = self._outstanding.get(id(frame))
+        if entry is None or entry[0]() is not frame:
+            raise ValueError("Frame was not acquired from this pool or is already released")
+        return entry
+
+    def retain(self, frame: np.ndarray) -> np.ndarray:
+        """Add a reference to an acquired frame; each retain needs a release."""
+        self._entry(frame)[1] += 1
+        return frame
+
+    def release(self, frame: np.ndarray) -> None:
+        """
+        Drop a reference to an acquired frame.
+
+        The frame must not be used after its last reference is released.
+
+        Raises:
+            ValueError: If the frame is not held from this pool
+        """
+        entry = self._entry(frame)
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del self._outstanding[id(frame)]
+        if frame.shape == self.shape and len(self._free) < self.max_free:
+            self._free.append(frame)
+
+    @contextmanager
+    def frame(self) -> Iterator[np.ndarray]:
+        """Acquire a buffer for the duration of a with block."""
+        frame = self.acquire()
+        try:
+            yield frame
+        finally:
+            self.release(frame)
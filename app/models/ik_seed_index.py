@@ -0,0 +1,108 @@
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+import numpy as np
+
+
+class IKSeedIndex:
+    """
+    Voxel-hash index of previously solved pose -> joint-angle solutions.
+
+    Poses are bucketed by their position voxel; each entry is keyed by its
+    position voxel plus orientation bin so near-identical targets overwrite
+    one another instead of piling up. A lookup scans the 27 voxels around
+    the query and returns the solution whose pose is closest, which makes a
+    good warm start for iterative IK on the repeated viewpoints of an
+    inspection cell. The index holds at most max_entries solutions and
+    evicts the least recently used one when full.
+    """
+
+    def __init__(self, voxel_size: float = 0.05, angle_bin: float = np.pi / 8,
+                 max_entries: int = 4096, orientation_weight: float = 0.1):
+        """
+        Initialize the seed index.
+
+        Args:
+            voxel_size: Edge length of a position voxel (m)
+            angle_bin: Width of an orientation bin (radians)
+            max_entries: Maximum number of stored solutions
+            orientation_weight: Metres of position error treated as
+                equivalent to one radian of orientation error when ranking
+        """
+        self.voxel_size = voxel_size
+        self.angle_bin = angle_bin
+        self.max_entries = max_entries
+        self.orientation_weight = orientation_weight
+
+        self._entries: "OrderedDict[Tuple[int, ...], Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+        self._cells: Dict[Tuple[int, int, int], Set[Tuple[int, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _cell(self, position: np.ndarray) -> Tuple[int, int, int]:
+        return tuple(np.floor(position / self.voxel_size).astype(int))
+
+    def _key(self, pose: np.ndarray) -> Tuple[int, ...]:
+        wrapped = (pose[3:] + np.pi) % (2.0 * np.pi)
+        return self._cell(pose[:3]) + tuple(np.floor(wrapped / self.angle_bin).astype(int))
+
+    def insert(self, position, orientation, joint_angles) -> None:
+        """
+        Record a solved pose.
+
+        Args:
+            position: Target position [x, y, z]
+            orientation: Target orientation [roll, pitch, yaw] (radians)
+            joint_angles: Joint angles that reach the pose
+        """
+        pose = np.concatenate([np.asarray(position, dtype=float),
+                               np.asarray(orientation, dtype=float)])
+        key = self._key(pose)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        else:
+            self._cells.setdefault(key[:3], set()).add(key)
+        self._entries[key] = (pose, np.array(joint_angles, dtype=float))
+
+        while len(self._entries) > self.max_entries:
+            old_key, _ = self._entries.popitem(last=False)
+            cell = self._cells[old_key[:3]]
+            cell.discard(old_key)
+            if not cell:
+                del self._cells[old_key[:3]]
+
+    def nearest(self, position, orientation) -> Optional[np.ndarray]:
+        """
+        Find the stored solution whose pose is closest to the query.
+
+        Args:
+            position: Query position [x, y, z]
+            orientation: Query orientation [roll, pitch, yaw] (radians)
+
+        Returns:
+            Copy of the nearest solution's joint angles, or None if no
+            solution is stored within one voxel of the query
+        """
+        pose = np.concatenate([np.asarray(position, dtype=float),
+                               np.asarray(orientation, dtype=float)])
+        cx, cy, cz = self._cell(pose[:3])
+        best_key, best_cost = None, np.inf
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    for key in self._cells.get((cx + dx, cy + dy, cz + dz), ()):
+                        stored = self._entries[key][0]
+                        angle_err = (stored[3:] - pose[3:] + np.pi) % (2.0 * np.pi) - np.pi
+                        cost = (np.linalg.norm(stored[:3] - pose[:3]) +
+                                self.orientation_weight * np.linalg.norm(angle_err))
+                        if cost < best_cost:
+                            best_key, best_cost = key, cost
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key][1].copy()
+
+    def clear(self) -> None:
+        """Drop every stored solution."""
+        self._entries.clear()
+        self._cells.clear()
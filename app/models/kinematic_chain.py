@@ -0,0 +1,167 @@
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+
+
+class KinematicChain:
+    """
+    Serial chain compiled from standard DH parameters.
+
+    The twist terms cos(alpha)/sin(alpha), link lengths and offsets are
+    constant, so they are written into the link-transform buffers once at
+    compile time; evaluating a configuration only fills in the joint-angle
+    entries and chains the links with in-place matmuls. Frames, joint
+    positions and the Jacobian are computed into buffers owned by the chain:
+    the arrays returned by frames(), forward_kinematics(), joint_positions()
+    and jacobian() are overwritten by the next call, so copy them if they
+    must outlive it. The batched methods allocate fresh outputs.
+    """
+
+    def __init__(self, dh_params: Sequence[Tuple[float, float, float, float]]):
+        """
+        Compile a chain.
+
+        Args:
+            dh_params: (a, alpha, d, theta) per joint; theta is unused since
+                the joint angle supplies the rotation
+        """
+        self.dh_params: List[Tuple[float, ...]] = [tuple(p) for p in dh_params]
+        self.n_joints = len(self.dh_params)
+        a, alpha, d, _ = (np.array(col, dtype=float) for col in zip(*self.dh_params))
+        self._a = a
+        self._d = d
+        self._ca = np.cos(alpha)
+        self._sa = np.sin(alpha)
+
+        n = self.n_joints
+        self._links = np.zeros((n, 4, 4))
+        self._links[:, 2, 1] = self._sa
+        self._links[:, 2, 2] = self._ca
+        self._links[:, 2, 3] = d
+        self._links[:, 3, 3] = 1.0
+        self._frames = np.empty((n + 1, 4, 4))
+        self._frames[0] = np.eye(4)
+        self._ct = np.empty(n)
+        self._st = np.empty(n)
+        self._jacobian = np.empty((6, n))
+        self._lever = np.empty((n, 3))
+        self._scratch = np.empty(n)
+
+    def frames(self, joint_angles: np.ndarray) -> np.ndarray:
+        """
+        Base frame followed by the frame after each joint.
+
+        Args:
+            joint_angles: Array of n_joints angles in radians
+
+        Returns:
+            (n_joints + 1, 4, 4) view of the chain's frame buffer
+        """
+        ct, st, links = self._ct, self._st, self._links
+        np.cos(joint_angles, out=ct)
+        np.sin(joint_angles, out=st)
+        links[:, 0, 0] = ct
+        np.multiply(st, -self._ca, out=links[:, 0, 1])
+        np.multiply(st, self._sa, out=links[:, 0, 2])
+        np.multiply(ct, self._a, out=links[:, 0, 3])
+        links[:, 1, 0] = st
+        np.multiply(ct, self._ca, out=links[:, 1, 1])
+        np.multiply(ct, -self._sa, out=links[:, 1, 2])
+        np.multiply(st, self._a, out=links[:, 1, 3])
+        frames = self._frames
+        for i in range(self.n_joints):
+            np.matmul(frames[i], links[i], out=frames[i + 1])
+        return frames
+
+    def forward_kinematics(self, joint_angles: np.ndarray) -> np.ndarray:
+        """End-effector pose as a 4x4 view of the frame buffer."""
+        return self.frames(joint_angles)[-1]
+
+    def joint_positions(self, joint_angles: np.ndarray) -> np.ndarray:
+        """(n_joints + 1, 3) view of the base and joint-frame origins."""
+        return self.frames(joint_angles)[:, :3, 3]
+
+    def jacobian(self, joint_angles: np.ndarray,
+                 frames: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Geometric Jacobian: column i is [z_i x (p_e - o_i), z_i].
+
+        Args:
+            joint_angles: Array of n_joints angles in radians
+            frames: Frames already computed by frames() for the same
+                joint angles, to skip a second FK pass
+
+        Returns:
+            (6, n_joints) view of the chain's Jacobian buffer
+        """
+        if frames is None:
+            frames = self.frames(joint_angles)
+        axes = frames[:-1, :3, 2]
+        lever = self._lever
+        np.subtract(frames[-1, :3, 3], frames[:-1, :3, 3], out=lever)
+        J, tmp = self._jacobian, self._scratch
+        # Cross product written component-wise into the Jacobian rows.
+        for row, (i, k) in enumerate(((1, 2), (2, 0), (0, 1))):
+            np.multiply(axes[:, i], lever[:, k], out=J[row])
+            np.multiply(axes[:, k], lever[:, i], out=tmp)
+            J[row] -= tmp
+        J[3:] = axes.T
+        return J
+
+    def forward_kinematics_batch(self, joint_angles: np.ndarray,
+                                 return_frames: bool = False):
+        """
+        Vectorized forward kinematics over N configurations.
+
+        Args:
+            joint_angles: (N, n_joints) array of joint angles in radians
+            return_frames: If True, also return every intermediate frame
+
+        Returns:
+            (N, 4, 4) end-effector poses, or a tuple of (poses, frames) with
+            frames of shape (N, n_joints + 1, 4, 4)
+        """
+        Q = np.atleast_2d(np.asarray(joint_angles, dtype=float))
+        n = Q.shape[0]
+        ct, st = np.cos(Q), np.sin(Q)
+
+        links = np.empty((n, self.n_joints, 4, 4))
+        links[..., 0, 0] = ct
+        links[..., 0, 1] = -st * self._ca
+        links[..., 0, 2] = st * self._sa
+        links[..., 0, 3] = self._a * ct
+        links[..., 1, 0] = st
+        links[..., 1, 1] = ct * self._ca
+        links[..., 1, 2] = -ct * self._sa
+        links[..., 1, 3] = self._a * st
+        links[..., 2:, :] = self._links[:, 2:, :]
+
+        frames = np.empty((n, self.n_joints + 1, 4, 4))
+        frames[:, 0] = np.eye(4)
+        for i in range(self.n_joints):
+            np.matmul(frames[:, i], links[:, i], out=frames[:, i + 1])
+
+        if return_frames:
+            return frames[:, -1], frames
+        return frames[:, -1]
+
+    def jacobian_batch(self, joint_angles: np.ndarray,
+                       frames: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Geometric Jacobians for N configurations.
+
+        Args:
+            joint_angles: (N, n_joints) array of joint angles in radians
+            frames: Frames from forward_kinematics_batch for the same
+                configurations, to skip the FK pass
+
+        Returns:
+            (N, 6, n_joints) Jacobians
+        """
+        if frames is None:
+            _, frames = self.forward_kinematics_batch(joint_angles, return_frames=True)
+        axes = frames[:, :-1, :3, 2]
+        lever = frames[:, -1:, :3, 3] - frames[:, :-1, :3, 3]
+        J = np.empty((frames.shape[0], 6, self.n_joints))
+        J[:, :3] = np.cross(axes, lever).transpose(0, 2, 1)
+        J[:, 3:] = axes.transpose(0, 2, 1)
+        return J
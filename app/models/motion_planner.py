@@ -0,0 +1,283 @@
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+class NearestNeighborIndex:
+    """
+    Incremental nearest-neighbor index over joint configurations.
+
+    A scipy KD-tree cannot take insertions, so new configurations go to a
+    small buffer that is scanned directly, and the tree is rebuilt over
+    everything once the buffer outgrows rebuild_size. Queries check both
+    the tree and the buffer.
+    """
+
+    def __init__(self, dimension: int, rebuild_size: int = 64):
+        """
+        Initialize an empty index.
+
+        Args:
+            dimension: Number of joints
+            rebuild_size: Buffered configurations that trigger a rebuild
+        """
+        self.rebuild_size = rebuild_size
+        self._points = np.empty((256, dimension))
+        self._count = 0
+        self._indexed = 0
+        self._tree = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def points(self) -> np.ndarray:
+        """(n, dimension) view of the stored configurations."""
+        return self._points[:self._count]
+
+    def add(self, point: np.ndarray) -> int:
+        """
+        Store a configuration.
+
+        Args:
+            point: Joint configuration
+
+        Returns:
+            int: Index of the stored configuration
+        """
+        if self._count == len(self._points):
+            self._points = np.concatenate([self._points, np.empty_like(self._points)])
+        self._points[self._count] = point
+        self._count += 1
+        if self._count - self._indexed > self.rebuild_size:
+            self._tree = cKDTree(self._points[:self._count])
+            self._indexed = self._count
+        return self._count - 1
+
+    def nearest(self, point: np.ndarray) -> int:
+        """Index of the stored configuration closest to point."""
+        best, best_dist = -1, np.inf
+        if self._tree is not None:
+            best_dist, best = self._tree.query(point)
+        if self._count > self._indexed:
+            recent = self._points[self._indexed:self._count]
+            dists = np.linalg.norm(recent - point, axis=1)
+            k = int(np.argmin(dists))
+            if dists[k] < best_dist:
+                best = self._indexed + k
+        return int(best)
+
+
+class _Tree:
+    """Search tree: configurations plus parent links."""
+
+    def __init__(self, root: np.ndarray):
+        self.index = NearestNeighborIndex(len(root))
+        self.parents: List[int] = []
+        self.add(root, -1)
+
+    def add(self, point: np.ndarray, parent: int) -> int:
+        self.parents.append(parent)
+        return self.index.add(point)
+
+    def path_to_root(self, node: int) -> List[np.ndarray]:
+        path = []
+        while node >= 0:
+            path.append(self.index.points[node].copy())
+            node = self.parents[node]
+        return path
+
+
+class MotionPlanner:
+    """
+    RRT-Connect joint-space planner with shortcut smoothing.
+
+    Two trees grow from the start and the goal. Each iteration extends one
+    tree a step toward a random configuration and then greedily connects
+    the other tree toward the new node, swapping roles every iteration.
+    Nearest neighbors come from an incremental KD-tree index, and every
+    edge is validated with one batched collision check over its samples;
+    a connect move keeps the collision-free prefix of its edge. The raw
+    path is then shortened by replacing random sub-paths with straight
+    edges that are collision free.
+    """
+
+    def __init__(self, arm, collision_checker, step_size: float = 0.5,
+                 resolution: float = 0.05, seed: Optional[int] = None):
+        """
+        Initialize the planner.
+
+        Args:
+            arm: RoboticArm providing the joint limits
+            collision_checker: CollisionChecker used to validate edges
+            step_size: Longest joint-space extension per iteration (radians)
+            resolution: Largest joint step between checked edge samples (radians)
+            seed: Random seed for reproducible plans
+        """
+        self.arm = arm
+        self.collision_checker = collision_checker
+        self.step_size = step_size
+        self.resolution = resolution
+        self.rng = np.random.default_rng(seed)
+        limits = np.asarray(arm.joint_limits, dtype=float)
+        self.lower, self.upper = limits[:, 0], limits[:, 1]
+
+    def _edge_samples(self, start: np.ndarray, goal: np.ndarray) -> np.ndarray:
+        steps = max(int(np.ceil(np.max(np.abs(goal - start)) / self.resolution)), 1)
+        t = np.linspace(0.0, 1.0, steps + 1)[1:, None]
+        return start + t * (goal - start)
+
+    def _free_prefix(self, start: np.ndarray, goal: np.ndarray,
+                     stats: Dict[str, Any]) -> Tuple[Optional[np.ndarray], bool]:
+        """
+        Furthest collision-free sample on the edge from start toward goal.
+
+        Returns:
+            Tuple of (last free sample or None, whether goal was reached)
+        """
+        samples = self._edge_samples(start, goal)
+        free = self.collision_checker.check_trajectory(samples)
+        stats["edge_samples_checked"] += len(samples)
+        if free.all():
+            return samples[-1], True
+        first_hit = int(np.argmin(free))
+        return (samples[first_hit - 1] if first_hit > 0 else None), False
+
+    def _extend(self, tree: _Tree, target: np.ndarray, stats: Dict[str, Any],
+                connect: bool) -> Tuple[int, bool]:
+        """
+        Grow a tree toward target.
+
+        A single extension moves at most step_size; a connect move goes the
+        whole way and keeps the collision-free prefix.
+
+        Returns:
+            Tuple of (new node index or -1, whether target was reached)
+        """
+        near = tree.index.nearest(target)
+        origin = tree.index.points[near]
+        goal = target
+        if not connect:
+            distance = np.linalg.norm(target - origin)
+            if distance > self.step_size:
+                goal = origin + (target - origin) * (self.step_size / distance)
+        reached_point, reached = self._free_prefix(origin, goal, stats)
+        if reached_point is None:
+            return -1, False
+        node = tree.add(reached_point, near)
+        return node, reached and goal is target
+
+    def plan(self, start: np.ndarray, goal: np.ndarray, time_budget: float = 1.0,
+             max_iterations: int = 5000,
+             smoothing_iterations: int = 100) -> Tuple[Optional[np.ndarray], Dict[str, Any]]:
+        """
+        Plan a collision-free joint-space path.
+
+        Args:
+            start: Start joint angles (radians)
+            goal: Goal joint angles (radians)
+            time_budget: Wall-clock seconds allowed for tree growth;
+                smoothing gets whatever remains of the same budget
+            max_iterations: Upper bound on tree-growth iterations
+            smoothing_iterations: Shortcut attempts on the raw path
+
+        Returns:
+            Tuple of (path, stats). path is a (K, 6) array of waypoints from
+            start to goal whose straight segments are collision free, or
+            None if no path was found. stats reports success, iterations,
+            tree sizes, collision samples checked, raw and smoothed
+            waypoint counts and path lengths, and planning/smoothing times.
+        """
+        started = time.perf_counter()
+        start = np.asarray(start, dtype=float)
+        goal = np.asarray(goal, dtype=float)
+        stats: Dict[str, Any] = {
+            "success": False,
+            "iterations": 0,
+            "tree_sizes": (0, 0),
+            "edge_samples_checked": 0,
+            "raw_waypoints": 0,
+            "waypoints": 0,
+            "raw_path_length": None,
+            "path_length": None,
+            "planning_time": 0.0,
+            "smoothing_time": 0.0,
+            "budget_exhausted": False,
+        }
+        if not (self.collision_checker.is_collision_free(start) and
+                self.collision_checker.is_collision_free(goal)):
+            stats["planning_time"] = time.perf_counter() - started
+            return None, stats
+
+        start_tree, goal_tree = _Tree(start), _Tree(goal)
+        trees = [start_tree, goal_tree]
+        path = None
+        # A direct edge is the common case between nearby inspection points.
+        _, direct = self._free_prefix(start, goal, stats)
+        if direct:
+            path = np.array([start, goal])
+
+        while path is None and stats["iterations"] < max_iterations:
+            if time.perf_counter() - started > time_budget:
+                stats["budget_exhausted"] = True
+                break
+            stats["iterations"] += 1
+            grow, other = trees
+            sample = self.rng.uniform(self.lower, self.upper)
+            node, _ = self._extend(grow, sample, stats, connect=False)
+            if node >= 0:
+                target = grow.index.points[node].copy()
+                other_node, reached = self._extend(other, target, stats, connect=True)
+                if reached:
+                    # other_node duplicates the grown node, so drop it once.
+                    joined = grow.path_to_root(node)[::-1] + other.path_to_root(other_node)[1:]
+                    path = np.array(joined if grow is start_tree else joined[::-1])
+            trees.reverse()
+
+        stats["tree_sizes"] = (len(start_tree.index), len(goal_tree.index))
+        stats["planning_time"] = time.perf_counter() - started
+        if path is None:
+            return None, stats
+
+        stats["success"] = True
+        stats["raw_waypoints"] = len(path)
+        stats["raw_path_length"] = self.path_length(path)
+        smoothing_started = time.perf_counter()
+        path = self.shortcut(path, smoothing_iterations, stats,
+                             deadline=started + time_budget)
+        stats["smoothing_time"] = time.perf_counter() - smoothing_started
+        stats["waypoints"] = len(path)
+        stats["path_length"] = self.path_length(path)
+        return path, stats
+
+    def shortcut(self, path: np.ndarray, iterations: int, stats: Dict[str, Any],
+                 deadline: Optional[float] = None) -> np.ndarray:
+        """
+        Shorten a path by replacing sub-paths with straight edges.
+
+        Args:
+            path: (K, 6) waypoints with collision-free straight segments
+            iterations: Number of shortcut attempts
+            stats: Statistics dict; collision samples are counted in it
+            deadline: perf_counter() time after which smoothing stops
+
+        Returns:
+            Shortened (K', 6) path with the same endpoints
+        """
+        path = list(path)
+        for _ in range(iterations):
+            if len(path) <= 2 or (deadline is not None and time.perf_counter() > deadline):
+                break
+            i, j = sorted(self.rng.choice(len(path), size=2, replace=False))
+            if j - i < 2:
+                continue
+            _, clear = self._free_prefix(path[i], path[j], stats)
+            if clear:
+                path = path[:i + 1] + path[j:]
+        return np.array(path)
+
+    @staticmethod
+    def path_length(path: np.ndarray) -> float:
+        """Total joint-space length of a path (radians)."""
+        return float(np.linalg.norm(np.diff(path, axis=0), axis=1).sum())
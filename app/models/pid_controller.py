@@ -1,8 +1,9 @@
-import time
 import numpy as np
+from app.utils.clock import Clock, RealClock
 
 class PIDController:
-    def __init__(self, kp: float, ki: float, kd: float, output_limits: tuple = (-float('inf'), float('inf'))):
+    def __init__(self, kp: float, ki: float, kd: float, output_limits: tuple = (-float('inf'), float('inf')),
+                 clock: Clock = None):
         """
         Initialize PID controller.
 
@@ -11,7 +12,10 @@ class PIDController:
             ki: Integral gain
             kd: Derivative gain
             output_limits: Tuple of (min, max) output limits
+            clock: Time source used when compute() is called without dt;
+                defaults to the wall clock
         """
+        self.clock = clock if clock is not None else RealClock()
         self.kp = kp
         self.ki = ki
         self.kd = kd
@@ -29,14 +33,14 @@ class PIDController:
             setpoint: Target value
             process_variable: Current value
             dt: Timestep in seconds. Pass explicitly in simulation for
-                deterministic results; if omitted, falls back to wall-clock
-                time between calls.
+                deterministic results; if omitted, falls back to the time
+                between calls on the controller's clock.
 
         Returns:
             Control output
         """
         if dt is None:
-            current_time = time.time()
+            current_time = self.clock.time()
             if self.last_time is None:
                 self.last_time = current_time
                 return 0.0
@@ -71,3 +75,122 @@ class PIDController:
         self.previous_error = 0.0
         self.integral = 0.0
         self.last_time = None
+
+
+class PIDBank:
+    """
+    Array-backed bank of independent PID controllers.
+
+    Gains, limits, integrals and previous errors are arrays shaped like the
+    bank, e.g. (joints,) for one arm or (arms, joints) for many, and one
+    compute() call steps every axis with the same semantics as
+    PIDController.compute, including the integral anti-windup clamp.
+    """
+
+    def __init__(self, kp, ki, kd, output_limits: tuple = (-float('inf'), float('inf')),
+                 shape: tuple = None, clock: Clock = None):
+        """
+        Initialize the PID bank.
+
+        Args:
+            kp: Proportional gain(s), scalar or array broadcastable to shape
+            ki: Integral gain(s)
+            kd: Derivative gain(s)
+            output_limits: Tuple of (min, max) output limits, each a scalar
+                or an array broadcastable to shape
+            shape: Shape of the bank; defaults to the broadcast shape of
+                the gains and limits
+            clock: Time source used when compute() is called without dt;
+                defaults to the wall clock
+        """
+        self.clock = clock if clock is not None else RealClock()
+        lo, hi = output_limits
+        if shape is None:
+            shape = np.broadcast_shapes(*(np.shape(v) for v in (kp, ki, kd, lo, hi)))
+        self.shape = tuple(shape)
+        self.kp = np.broadcast_to(np.asarray(kp, dtype=float), self.shape).copy()
+        self.ki = np.broadcast_to(np.asarray(ki, dtype=float), self.shape).copy()
+        self.kd = np.broadcast_to(np.asarray(kd, dtype=float), self.shape).copy()
+        self.output_limits = (np.broadcast_to(np.asarray(lo, dtype=float), self.shape).copy(),
+                              np.broadcast_to(np.asarray(hi, dtype=float), self.shape).copy())
+
+        self.previous_error = np.zeros(self.shape)
+        self.integral = np.zeros(self.shape)
+        self.last_time = None
+        self._update_integral_limits()
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def _update_integral_limits(self):
+        # Anti-windup bounds lo/ki and hi/ki, unbounded where ki == 0.
+        lo, hi = self.output_limits
+        active = self.ki != 0
+        safe_ki = np.where(active, self.ki, 1.0)
+        self._integral_lo = np.where(active, lo / safe_ki, -np.inf)
+        self._integral_hi = np.where(active, hi / safe_ki, np.inf)
+
+    def set_gains(self, kp=None, ki=None, kd=None):
+        """
+        Update gains in place; omitted gains are left unchanged.
+
+        Args:
+            kp: New proportional gain(s)
+            ki: New integral gain(s)
+            kd: New derivative gain(s)
+        """
+        if kp is not None:
+            self.kp[...] = kp
+        if ki is not None:
+            self.ki[...] = ki
+        if kd is not None:
+            self.kd[...] = kd
+        self._update_integral_limits()
+
+    def compute(self, setpoint, process_variable, dt: float = None) -> np.ndarray:
+        """
+        Compute PID outputs for every axis.
+
+        Args:
+            setpoint: Target values, broadcastable to the bank shape
+            process_variable: Current values, broadcastable to the bank shape
+            dt: Timestep in seconds. Pass explicitly in simulation for
+                deterministic results; if omitted, falls back to the time
+                between calls on the bank's clock.
+
+        Returns:
+            Control outputs with the bank's shape
+        """
+        if dt is None:
+            current_time = self.clock.time()
+            if self.last_time is None:
+                self.last_time = current_time
+                return np.zeros(self.shape)
+            dt = current_time - self.last_time
+            self.last_time = current_time
+
+        if dt <= 0:
+            return np.zeros(self.shape)
+
+        error = np.subtract(setpoint, process_variable, dtype=float)
+        error = np.broadcast_to(error, self.shape)
+        self.integral += error * dt
+        derivative = (error - self.previous_error) / dt
+
+        np.clip(self.integral, self._integral_lo, self._integral_hi, out=self.integral)
+
+        output = (self.kp * error +
+                  self.ki * self.integral +
+                  self.kd * derivative)
+
+        np.clip(output, self.output_limits[0], self.output_limits[1], out=output)
+
+        self.previous_error[...] = error
+
+        return output
+
+    def reset(self):
+        """Reset every controller's state."""
+        self.previous_error.fill(0.0)
+        self.integral.fill(0.0)
+        self.last_time = None
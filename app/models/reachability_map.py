@@ -0,0 +1,230 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional, Union
+import numpy as np
+
+
+class ReachabilityMap:
+    """
+    Voxelized map of the poses the arm's end effector can reach.
+
+    The workspace is divided into cubic voxels, and each voxel holds one
+    flag per approach-direction bin: the direction of the tool z-axis,
+    binned by azimuth and elevation. The flags are filled by sampling joint
+    configurations uniformly within the joint limits and running batched
+    forward kinematics. Lookups go to a copy dilated by one cell along
+    every axis, the 26 neighbouring voxels and the adjacent azimuth
+    (wrapping around) and elevation bins, so neither sampling gaps nor
+    poses on a bin boundary reject feasible poses. The map is therefore
+    optimistic: a False lookup means the pose is out of reach, a True
+    lookup means it is worth handing to IK. Lookups are a constant-time
+    array index.
+    """
+
+    def __init__(self, occupancy: np.ndarray, origin: np.ndarray, voxel_size: float,
+                 fingerprint: str = ""):
+        """
+        Wrap a precomputed occupancy grid.
+
+        Args:
+            occupancy: (nx, ny, nz, azimuth_bins, elevation_bins) boolean
+                grid of sampled poses
+            origin: Position of the grid's minimum corner (m)
+            voxel_size: Edge length of a voxel (m)
+            fingerprint: Hash of the arm kinematics the grid was built for
+        """
+        self.occupancy = np.asarray(occupancy, dtype=bool)
+        self.origin = np.asarray(origin, dtype=float)
+        self.voxel_size = float(voxel_size)
+        self.fingerprint = fingerprint
+        self.azimuth_bins, self.elevation_bins = self.occupancy.shape[3:]
+        self.dilated = self._dilate(self.occupancy)
+        # Any-orientation view so position-only lookups stay O(1) as well.
+        self.position_occupancy = self.dilated.any(axis=(3, 4))
+
+    @staticmethod
+    def arm_fingerprint(arm) -> str:
+        """Stable hash of an arm's DH parameters and joint limits."""
+        payload = json.dumps({
+            "dh_params": [[float(v) for v in p] for p in arm.dh_params],
+            "joint_limits": [[float(v) for v in lim] for lim in arm.joint_limits],
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @classmethod
+    def build(cls, arm, samples: int = 500_000, voxel_size: float = 0.08,
+              azimuth_bins: int = 8, elevation_bins: int = 4,
+              batch_size: int = 50_000, seed: int = 0) -> "ReachabilityMap":
+        """
+        Sample the arm's workspace into a new map.
+
+        Args:
+            arm: RoboticArm whose kinematics and joint limits are sampled
+            samples: Number of random joint configurations
+            voxel_size: Edge length of a voxel (m)
+            azimuth_bins: Number of approach-direction azimuth bins
+            elevation_bins: Number of approach-direction elevation bins
+            batch_size: Configurations per batched FK call
+            seed: Random seed, so a rebuilt map is identical
+
+        Returns:
+            ReachabilityMap for the arm
+        """
+        rng = np.random.default_rng(seed)
+        lo = np.array([l for l, _ in arm.joint_limits])
+        hi = np.array([h for _, h in arm.joint_limits])
+
+        # The end effector can never be further from the base than the sum
+        # of all link offsets, which bounds the grid.
+        reach = sum(abs(a) + abs(d) for a, _, d, _ in arm.dh_params)
+        origin = np.full(3, -reach - voxel_size)
+        n = int(np.ceil(2 * (reach + voxel_size) / voxel_size))
+        occupancy = np.zeros((n, n, n, azimuth_bins, elevation_bins), dtype=bool)
+        grid = cls(occupancy, origin, voxel_size)
+
+        for start in range(0, samples, batch_size):
+            count = min(batch_size, samples - start)
+            Q = rng.uniform(lo, hi, size=(count, len(lo)))
+            poses = arm.forward_kinematics_batch(Q)
+            idx = grid._indices(poses[:, :3, 3], poses[:, :3, 2])
+            occupancy[idx] = True
+        return cls(occupancy, origin, voxel_size, cls.arm_fingerprint(arm))
+
+    @staticmethod
+    def _dilate(occupancy: np.ndarray) -> np.ndarray:
+        """
+        Grow every flag by one cell along each axis of the grid.
+
+        Applied one axis at a time, the three position axes cover all 26
+        neighbouring voxels. Azimuth wraps around; elevation does not.
+        """
+        dilated = occupancy.copy()
+        for axis in range(5):
+            grown = dilated.copy()
+            if axis == 3:
+                grown |= np.roll(dilated, 1, axis=axis) | np.roll(dilated, -1, axis=axis)
+            else:
+                lead = (slice(None),) * axis
+                grown[lead + (slice(1, None),)] |= dilated[lead + (slice(None, -1),)]
+                grown[lead + (slice(None, -1),)] |= dilated[lead + (slice(1, None),)]
+            dilated = grown
+        return dilated
+
+    def _indices(self, positions: np.ndarray, approach: np.ndarray):
+        """Grid indices for (N, 3) positions and (N, 3) unit approach vectors."""
+        voxel = np.floor((positions - self.origin) / self.voxel_size).astype(int)
+        voxel = np.clip(voxel, 0, np.array(self.occupancy.shape[:3]) - 1)
+        azimuth = np.arctan2(approach[:, 1], approach[:, 0])
+        elevation = np.arcsin(np.clip(approach[:, 2], -1.0, 1.0))
+        az_bin = ((azimuth + np.pi) / (2 * np.pi) * self.azimuth_bins).astype(int) % self.azimuth_bins
+        el_bin = np.minimum(((elevation + np.pi / 2) / np.pi * self.elevation_bins).astype(int),
+                            self.elevation_bins - 1)
+        return voxel[:, 0], voxel[:, 1], voxel[:, 2], az_bin, el_bin
+
+    def _in_bounds(self, positions: np.ndarray) -> np.ndarray:
+        extent = self.origin + self.voxel_size * np.array(self.occupancy.shape[:3])
+        return np.all((positions >= self.origin) & (positions < extent), axis=1)
+
+    def is_reachable_batch(self, positions: np.ndarray,
+                           orientations: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Feasibility lookup for N poses.
+
+        Args:
+            positions: (N, 3) positions (m)
+            orientations: Optional (N, 3) [roll, pitch, yaw]; if omitted only
+                the position is checked
+
+        Returns:
+            (N,) boolean array
+        """
+        positions = np.atleast_2d(np.asarray(positions, dtype=float))
+        inside = self._in_bounds(positions)
+        if orientations is None:
+            approach = np.tile([0.0, 0.0, 1.0], (len(positions), 1))
+            ix, iy, iz, _, _ = self._indices(positions, approach)
+            return inside & self.position_occupancy[ix, iy, iz]
+        # Tool z-axis of Rz(yaw) Ry(pitch) Rx(roll), as in RoboticArm._rpy_to_matrix.
+        r, p, y = np.atleast_2d(np.asarray(orientations, dtype=float)).T
+        approach = np.stack([
+            np.cos(y) * np.sin(p) * np.cos(r) + np.sin(y) * np.sin(r),
+            np.sin(y) * np.sin(p) * np.cos(r) - np.cos(y) * np.sin(r),
+            np.cos(p) * np.cos(r),
+        ], axis=1)
+        return inside & self.dilated[self._indices(positions, approach)]
+
+    def is_reachable(self, position, orientation=None) -> bool:
+        """
+        Feasibility lookup for a single pose.
+
+        Args:
+            position: [x, y, z] position (m)
+            orientation: Optional [roll, pitch, yaw] (radians)
+
+        Returns:
+            bool: False if the pose is outside the sampled workspace
+        """
+        orientations = None if orientation is None else [orientation]
+        return bool(self.is_reachable_batch([position], orientations)[0])
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the map to a compressed .npz file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                occupancy=np.packbits(self.occupancy, axis=None),
+                shape=np.array(self.occupancy.shape),
+                origin=self.origin,
+                voxel_size=self.voxel_size,
+                fingerprint=self.fingerprint,
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, Path], arm=None) -> Optional["ReachabilityMap"]:
+        """
+        Read a map written by save().
+
+        Args:
+            path: File to read
+            arm: If given, the map is rejected when it was built for
+                different kinematics or joint limits
+
+        Returns:
+            ReachabilityMap, or None if the file is missing or stale
+        """
+        path = Path(path)
+        if not path.exists():
+            return None
+        with np.load(path) as data:
+            shape = tuple(data["shape"])
+            occupancy = np.unpackbits(data["occupancy"], count=int(np.prod(shape))).reshape(shape)
+            grid = cls(occupancy, data["origin"], float(data["voxel_size"]),
+                       str(data["fingerprint"]))
+        if arm is not None and grid.fingerprint != cls.arm_fingerprint(arm):
+            return None
+        return grid
+
+    @classmethod
+    def load_or_build(cls, path: Union[str, Path], arm, **build_kwargs) -> "ReachabilityMap":
+        """
+        Load the map at path, rebuilding and saving it if missing or stale.
+
+        Args:
+            path: Cache file location
+            arm: RoboticArm the map must match
+            **build_kwargs: Passed to build() when a rebuild is needed
+
+        Returns:
+            ReachabilityMap for the arm
+        """
+        grid = cls.load(path, arm)
+        if grid is None:
+            grid = cls.build(arm, **build_kwargs)
+            try:
+                grid.save(path)
+            except OSError as e:
+                print(f"Error saving reachability map: {str(e)}")
+        return grid
@@ -0,0 +1,78 @@
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+
+
+class RenderCache:
+    """
+    LRU cache of rendered base frames, bounded by memory.
+
+    Frames are stored as read-only copies keyed by a hash of the scene
+    description and the resolution. The least recently used frames are
+    dropped once the stored frames exceed max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Memory budget for the stored frames
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._frames: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    @staticmethod
+    def key(description: Dict[str, Any], resolution: Tuple[int, int]) -> str:
+        """Hash of a scene description (dict keys sorted) and a resolution."""
+        payload = json.dumps([description, list(resolution)], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """
+        Look up a frame.
+
+        Returns:
+            The read-only frame, or None on a miss
+        """
+        frame = self._frames.get(key)
+        if frame is None:
+            self.stats["misses"] += 1
+            return None
+        self._frames.move_to_end(key)
+        self.stats["hits"] += 1
+        return frame
+
+    def put(self, key: str, frame: np.ndarray) -> np.ndarray:
+        """
+        Store a read-only copy of a frame.
+
+        Frames larger than the whole budget are not stored.
+
+        Returns:
+            The stored copy (or the frame itself if it was not stored)
+        """
+        if frame.nbytes > self.max_bytes:
+            return frame
+        if key in self._frames:
+            self.nbytes -= self._frames.pop(key).nbytes
+        stored = frame.copy()
+        stored.flags.writeable = False
+        self._frames[key] = stored
+        self.nbytes += stored.nbytes
+        while self.nbytes > self.max_bytes:
+            _, evicted = self._frames.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+        return stored
+
+    def clear(self) -> None:
+        """Drop every stored frame."""
+        self._frames.clear()
+        self.nbytes = 0
@@ -1,10 +1,21 @@
 import numpy as np
-from typing import List, Tuple, Optional
-from .pid_controller import PIDController
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Tuple, Optional
+from .pid_controller import PIDBank
+from .ik_seed_index import IKSeedIndex
+from .kinematic_chain import KinematicChain
+from app.utils.clock import Clock, RealClock
 
 class RoboticArm:
-    def __init__(self):
-        """Initialize 6-DOF robotic arm with default parameters."""
+    def __init__(self, clock: Clock = None):
+        """
+        Initialize 6-DOF robotic arm with default parameters.
+
+        Args:
+            clock: Time source; control steps and moves advance it by their
+                simulated duration. Defaults to the wall clock.
+        """
+        self.clock = clock if clock is not None else RealClock()
         # DH parameters (a, alpha, d, theta) for each joint
         self.dh_params = [
             (0, 0, 0.1625, 0),      # Base
@@ -28,11 +39,57 @@ class RoboticArm:
         # Current joint angles
         self.joint_angles = np.zeros(6)
         
+        # Per-joint motion limits for trajectory timing; the velocity limit
+        # matches the PID output saturation used by step_towards
+        self.max_joint_velocity = np.full(6, 1.0)       # rad/s
+        self.max_joint_acceleration = np.full(6, 2.0)   # rad/s^2
+        self.max_joint_jerk = np.full(6, 10.0)          # rad/s^3
+        
         # PID controllers for each joint
-        self.pid_controllers = [
-            PIDController(kp=1.0, ki=0.1, kd=0.05, output_limits=(-1.0, 1.0))
-            for _ in range(6)
-        ]
+        self.pid_controllers = PIDBank(kp=1.0, ki=0.1, kd=0.05,
+                                       output_limits=(-1.0, 1.0), shape=(6,),
+                                       clock=self.clock)
+        
+        # Previously solved poses, used to warm-start iterative IK
+        self.ik_seed_index = IKSeedIndex()
+        
+        self._chain = KinematicChain(self.dh_params)
+        # Kinematic state cached for the current joint angles
+        self._state = None
+        
+    @property
+    def joint_angles(self) -> np.ndarray:
+        """Current joint angles in radians."""
+        return self._joint_angles
+    
+    @joint_angles.setter
+    def joint_angles(self, angles: np.ndarray):
+        self._joint_angles = np.array(angles, dtype=float)
+        
+    def _kinematic_state(self) -> dict:
+        """
+        Frames and end-effector pose for the current joint angles.
+
+        Computed by one FK pass on first use and reused until the joint
+        angles change, whether through move_joint, set_joint_angles,
+        step_towards, reset, IK or a direct write to joint_angles, so the
+        GUI and controllers can query the same configuration repeatedly
+        without walking the chain again.
+        """
+        state = self._state
+        chain = self.kinematic_chain
+        if (state is None or state["chain"] is not chain or
+                not np.array_equal(state["joint_angles"], self._joint_angles)):
+            frames = chain.frames(self._joint_angles).copy()
+            state = {
+                "chain": chain,
+                "joint_angles": self._joint_angles.copy(),
+                "frames": frames,
+                "position": frames[-1, :3, 3],
+                "orientation": self._matrix_to_rpy(frames[-1]),
+            }
+            self._state = state
+        return state
         
     def dh_transform(self, a: float, alpha: float, d: float, theta: float) -> np.ndarray:
         """Compute DH transformation matrix."""
@@ -48,6 +105,13 @@ class RoboticArm:
             [0, 0, 0, 1]
         ])
     
+    @property
+    def kinematic_chain(self) -> KinematicChain:
+        """Chain compiled from dh_params, recompiled if they have been edited."""
+        if self._chain.dh_params != self.dh_params:
+            self._chain = KinematicChain(self.dh_params)
+        return self._chain
+
     def forward_kinematics(self, joint_angles: np.ndarray) -> np.ndarray:
         """
         Compute forward kinematics to get end-effector pose.
@@ -58,14 +122,28 @@ class RoboticArm:
         Returns:
             4x4 transformation matrix representing end-effector pose
         """
-        T = np.eye(4)
-        
-        for i, (a, alpha, d, _) in enumerate(self.dh_params):
-            theta = joint_angles[i]
-            T = T @ self.dh_transform(a, alpha, d, theta)
-            
-        return T
-    
+        return self.kinematic_chain.forward_kinematics(joint_angles).copy()
+
+    def forward_kinematics_batch(self, joint_angles: np.ndarray,
+                                 return_frames: bool = False):
+        """
+        Vectorized forward kinematics over N joint configurations.
+
+        Builds all N x 6 DH link transforms at once and chains them with
+        stacked matrix products, so sweeping many configurations costs six
+        batched matmuls instead of a Python loop per configuration.
+
+        Args:
+            joint_angles: (N, 6) array of joint angles in radians
+            return_frames: If True, also return every intermediate frame
+
+        Returns:
+            (N, 4, 4) end-effector poses, or a tuple of (poses, frames) where
+            frames is (N, 7, 4, 4) holding the base frame followed by the
+            frame after each joint
+        """
+        return self.kinematic_chain.forward_kinematics_batch(joint_angles, return_frames)
+
     def get_end_effector_pose(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Get current end-effector position and orientation.
@@ -75,16 +153,16 @@ class RoboticArm:
             - position is [x, y, z]
             - orientation is [roll, pitch, yaw] in radians
         """
-        T = self.forward_kinematics(self.joint_angles)
-        
-        position = T[:3, 3]
-        
-        # Extract Euler angles from rotation matrix
+        state = self._kinematic_state()
+        return state["position"].copy(), state["orientation"].copy()
+    
+    @staticmethod
+    def _matrix_to_rpy(T: np.ndarray) -> np.ndarray:
+        """[roll, pitch, yaw] of a rotation or homogeneous transform matrix."""
         roll = np.arctan2(T[2, 1], T[2, 2])
         pitch = np.arctan2(-T[2, 0], np.sqrt(T[2, 1]**2 + T[2, 2]**2))
         yaw = np.arctan2(T[1, 0], T[0, 0])
-        
-        return position, np.array([roll, pitch, yaw])
+        return np.array([roll, pitch, yaw])
     
     def move_joint(self, joint_index: int, angle: float) -> bool:
         """
@@ -99,14 +177,30 @@ class RoboticArm:
             return True
         return False
     
+    def set_joint_angles(self, joint_angles: List[float]) -> bool:
+        """
+        Set all joint angles at once.
+        
+        Args:
+            joint_angles: List of 6 joint angles in radians
+            
+        Returns:
+            True if every angle is within its limits (and was applied),
+            False otherwise (the arm is left untouched)
+        """
+        if len(joint_angles) != len(self._joint_angles) or not self._check_joint_limits(joint_angles):
+            return False
+        self.joint_angles = joint_angles
+        return True
+    
     def step_towards(self, target_angles: np.ndarray, dt: float = 0.01) -> float:
         """
         Advance the simulated joints one control step toward target_angles.
 
-        Each joint's PID controller outputs a velocity command (rad/s,
+        The PID bank outputs a velocity command per joint (rad/s,
         saturated by its output limits) which is integrated over dt, so
         motion unfolds over multiple steps like a real servo axis instead
-        of teleporting.
+        of teleporting. All joints are stepped in one vectorized call.
 
         Args:
             target_angles: Array of 6 target joint angles in radians
@@ -116,17 +210,16 @@ class RoboticArm:
             Maximum absolute joint error after the step (radians)
         """
         target_angles = np.asarray(target_angles, dtype=float)
-        for i, controller in enumerate(self.pid_controllers):
-            velocity = controller.compute(target_angles[i], self.joint_angles[i], dt=dt)
-            new_angle = self.joint_angles[i] + velocity * dt
-            lo, hi = self.joint_limits[i]
-            self.joint_angles[i] = float(np.clip(new_angle, lo, hi))
+        velocity = self.pid_controllers.compute(target_angles, self.joint_angles, dt=dt)
+        limits = np.asarray(self.joint_limits, dtype=float)
+        self.joint_angles = np.clip(self.joint_angles + velocity * dt, limits[:, 0], limits[:, 1])
+        self.clock.advance(dt)
         return float(np.max(np.abs(target_angles - self.joint_angles)))
 
     def move_to_pose(self, target_position: np.ndarray, target_orientation: np.ndarray,
                     max_iterations: int = 100, tolerance: float = 0.001) -> bool:
         """
-        Move end-effector to a target pose via damped-least-squares inverse kinematics.
+        Move end-effector to a target pose via inverse kinematics.
         
         Args:
             target_position: [x, y, z] target position
@@ -150,29 +243,16 @@ class RoboticArm:
     def reset(self):
         """Reset arm to home position."""
         self.joint_angles = np.zeros(6)
-        for controller in self.pid_controllers:
-            controller.reset()
+        self.pid_controllers.reset()
     
     def get_joint_positions(self) -> List[np.ndarray]:
         """
         Get the positions of all joints for visualization.
         
         Returns:
-            List of [x, y, z] positions for each joint
+            List of [x, y, z] positions: the base followed by each joint
         """
-        positions = []
-        T = np.eye(4)
-        
-        # Add base position
-        positions.append(T[:3, 3])
-        
-        # Calculate positions for each joint
-        for i, (a, alpha, d, _) in enumerate(self.dh_params):
-            theta = self.joint_angles[i]
-            T = T @ self.dh_transform(a, alpha, d, theta)
-            positions.append(T[:3, 3])
-            
-        return positions
+        return list(self._kinematic_state()["frames"][:, :3, 3].copy())
     
     @staticmethod
     def _rpy_to_matrix(rpy: np.ndarray) -> np.ndarray:
@@ -200,9 +280,79 @@ class RoboticArm:
         ]) / (2.0 * np.sin(angle))
         return angle * axis
 
-    def jacobian(self, joint_angles: np.ndarray, eps: float = 1e-6) -> np.ndarray:
-        """Numerical 6x6 geometric Jacobian (position + orientation) via
-        central differences on the forward kinematics."""
+    @staticmethod
+    def _rpy_to_matrix_batch(rpy: np.ndarray) -> np.ndarray:
+        """(N, 3, 3) rotation matrices from (N, 3) [roll, pitch, yaw] rows."""
+        r, p, y = np.asarray(rpy, dtype=float).T
+        cr, sr = np.cos(r), np.sin(r)
+        cp, sp = np.cos(p), np.sin(p)
+        cy, sy = np.cos(y), np.sin(y)
+        R = np.empty((len(r), 3, 3))
+        R[:, 0, 0] = cy * cp
+        R[:, 0, 1] = cy * sp * sr - sy * cr
+        R[:, 0, 2] = cy * sp * cr + sy * sr
+        R[:, 1, 0] = sy * cp
+        R[:, 1, 1] = sy * sp * sr + cy * cr
+        R[:, 1, 2] = sy * sp * cr - cy * sr
+        R[:, 2, 0] = -sp
+        R[:, 2, 1] = cp * sr
+        R[:, 2, 2] = cp * cr
+        return R
+
+    @staticmethod
+    def _rotation_vector_batch(R: np.ndarray) -> np.ndarray:
+        """(N, 3) axis-angle vectors of (N, 3, 3) rotation matrices."""
+        trace = R[:, 0, 0] + R[:, 1, 1] + R[:, 2, 2]
+        angle = np.arccos(np.clip((trace - 1.0) / 2.0, -1.0, 1.0))
+        axis = np.stack([
+            R[:, 2, 1] - R[:, 1, 2],
+            R[:, 0, 2] - R[:, 2, 0],
+            R[:, 1, 0] - R[:, 0, 1],
+        ], axis=1)
+        sin_angle = np.sin(angle)
+        scale = np.where(angle < 1e-9, 0.0, angle / (2.0 * np.where(angle < 1e-9, 1.0, sin_angle)))
+        return axis * scale[:, None]
+
+    def jacobian(self, joint_angles: np.ndarray, eps: float = 1e-6,
+                 method: str = "analytic") -> np.ndarray:
+        """
+        6x6 geometric Jacobian (position + orientation) at joint_angles.
+
+        Args:
+            joint_angles: Array of 6 joint angles in radians
+            eps: Finite-difference step, used only by the numerical method
+            method: "analytic" builds each column from the joint frames in a
+                single pass over the DH chain (z_i x (p_e - o_i), z_i);
+                "numerical" uses central differences on the forward
+                kinematics and is kept as a reference implementation
+
+        Returns:
+            6x6 Jacobian mapping joint velocities to [v, omega] in the base frame
+        """
+        if method == "analytic":
+            return self._analytic_jacobian(joint_angles)
+        if method == "numerical":
+            return self._numerical_jacobian(joint_angles, eps)
+        raise ValueError(f"Unknown Jacobian method: {method}")
+
+    def _analytic_jacobian(self, joint_angles: np.ndarray) -> np.ndarray:
+        """Geometric Jacobian from the joint axes and origins of one FK pass."""
+        return self.kinematic_chain.jacobian(np.asarray(joint_angles, dtype=float)).copy()
+
+    def jacobian_batch(self, joint_angles: np.ndarray) -> np.ndarray:
+        """
+        Analytic geometric Jacobians for N configurations at once.
+
+        Args:
+            joint_angles: (N, 6) array of joint angles in radians
+
+        Returns:
+            (N, 6, 6) Jacobians, stacked like jacobian()
+        """
+        return self.kinematic_chain.jacobian_batch(joint_angles)
+
+    def _numerical_jacobian(self, joint_angles: np.ndarray, eps: float = 1e-6) -> np.ndarray:
+        """Numerical Jacobian via central differences on the forward kinematics."""
         q = np.asarray(joint_angles, dtype=float)
         J = np.zeros((6, 6))
         for i in range(6):
@@ -215,15 +365,114 @@ class RoboticArm:
             J[3:, i] = self._rotation_vector(dR) / (2.0 * eps)
         return J
 
+    @staticmethod
+    def _wrap_angle(angle):
+        """Wrap angle(s) into [-pi, pi)."""
+        return (np.asarray(angle) + np.pi) % (2.0 * np.pi) - np.pi
+
+    def calculate_analytic_ik(self, position: List[float], orientation: List[float],
+                              tolerance: float = 1e-3,
+                              seed: Optional[np.ndarray] = None) -> List[np.ndarray]:
+        """
+        Closed-form inverse kinematics for this arm's DH chain.
+
+        Joints 1 and 2 both rotate about the base's vertical axis and joints
+        3-5 are parallel, so a pose decomposes into a base yaw
+        psi = q1 + q2, a planar two-link elbow (q3, q4), a wrist pitch
+        phi = q3 + q4 + q5 and a tool roll q6. The two signs of sin(phi)
+        times the two elbow configurations give at most four branches. The
+        yaw is split between q1 and q2 by keeping q1 as close to the seed as
+        the shoulder limits allow. Because the chain has five independent
+        axes, poses off its reachable 5D manifold have no exact solution.
+
+        Args:
+            position: Target position [x, y, z]
+            orientation: Target orientation [roll, pitch, yaw] (radians)
+            tolerance: Acceptance threshold on position error (m); the
+                orientation error uses 10x this threshold in radians
+            seed: Joint angles used to resolve the base redundancy and to
+                order the branches (defaults to the current joint angles)
+
+        Returns:
+            List of joint-angle arrays within joint_limits that reach the
+            pose, nearest to the seed first (empty if none exist)
+        """
+        seed = np.asarray(self.joint_angles if seed is None else seed, dtype=float)
+        p = np.asarray(position, dtype=float)
+        R = self._rpy_to_matrix(np.asarray(orientation, dtype=float))
+
+        d1 = self.dh_params[0][2]
+        a3 = self.dh_params[2][0]
+        a4 = self.dh_params[3][0]
+        lateral = self.dh_params[3][2] + self.dh_params[4][2]
+        d6 = self.dh_params[5][2]
+        twist = self.dh_transform(0, -np.pi / 2, 0, 0)[:3, :3]
+
+        def rot_z(angle):
+            return self.dh_transform(0, 0, 0, angle)[:3, :3]
+
+        # Strip the constant tool twist: M = Rz(psi) X Rz(phi) X Rz(q6).
+        M = R @ twist
+        approach = M[:, 2]
+        cos_phi = -approach[2]
+        sin_phi = np.hypot(approach[0], approach[1])
+        if sin_phi < 1e-9:
+            # Wrist singularity: base yaw and tool roll share an axis, so
+            # keep the seed's yaw and let q6 absorb the rest.
+            wrist_branches = [(seed[0] + seed[1], np.arctan2(0.0, cos_phi))]
+        else:
+            wrist_branches = [
+                (np.arctan2(-approach[1] / s, -approach[0] / s), np.arctan2(s, cos_phi))
+                for s in (sin_phi, -sin_phi)
+            ]
+
+        solutions = []
+        for psi, phi in wrist_branches:
+            R_base = rot_z(psi) @ twist
+            N = (R_base @ rot_z(phi) @ twist).T @ M
+            q6 = np.arctan2(N[1, 0], N[0, 0])
+
+            # Work in the plane swept by the parallel joints.
+            local = R_base.T @ (p - np.array([0.0, 0.0, d1]))
+            if abs(local[2] - lateral) > tolerance:
+                continue
+            x = local[0] + d6 * np.sin(phi)
+            y = local[1] - d6 * np.cos(phi)
+            cos_q4 = (x * x + y * y - a3 * a3 - a4 * a4) / (2.0 * a3 * a4)
+            if abs(cos_q4) > 1.0 + 1e-9:
+                continue
+            elbow = np.arccos(np.clip(cos_q4, -1.0, 1.0))
+            for q4 in ((elbow, -elbow) if elbow > 1e-9 else (elbow,)):
+                q3 = np.arctan2(y, x) - np.arctan2(a4 * np.sin(q4), a3 + a4 * np.cos(q4))
+                q5 = phi - q3 - q4
+                q2 = np.clip(self._wrap_angle(psi - seed[0]), *self.joint_limits[1])
+                q = self._wrap_angle(np.array([psi - q2, q2, q3, q4, q5, q6]))
+                if not self._check_joint_limits(q):
+                    continue
+                T = self.kinematic_chain.forward_kinematics(q)
+                if (np.linalg.norm(p - T[:3, 3]) < tolerance and
+                        np.linalg.norm(self._rotation_vector(R @ T[:3, :3].T)) < 10 * tolerance):
+                    solutions.append(q)
+
+        solutions.sort(key=lambda q: np.linalg.norm(self._wrap_angle(q - seed)))
+        return solutions
+
     def calculate_inverse_kinematics(self, position: List[float], orientation: List[float],
                                      max_iterations: int = 200, tolerance: float = 1e-3,
-                                     damping: float = 0.05) -> Optional[List[float]]:
+                                     damping: float = 0.05,
+                                     use_analytic: bool = True,
+                                     use_seed_index: bool = True) -> Optional[List[float]]:
         """
-        Damped-least-squares (Levenberg-Marquardt) inverse kinematics.
+        Inverse kinematics: closed form first, damped least squares as fallback.
 
-        Iterates dq = J^T (J J^T + lambda^2 I)^-1 e over the 6D pose error
-        (position + axis-angle orientation), clipping to joint limits each
-        step. The damping term keeps steps bounded near singularities.
+        The closed-form solver (calculate_analytic_ik) is tried first and the
+        branch nearest the current joint angles is returned. Only when it
+        finds no valid branch does the damped-least-squares (Levenberg-
+        Marquardt) loop run, warm-started from the nearest pose solved
+        before when there is one: it iterates dq = J^T (J J^T + lambda^2 I)^-1 e
+        over the 6D pose error (position + axis-angle orientation), clipping
+        to joint limits each step. The damping term keeps steps bounded near
+        singularities.
 
         Args:
             position: Target position [x, y, z]
@@ -232,32 +481,409 @@ class RoboticArm:
             tolerance: Convergence threshold on position error (m); the
                 orientation error uses 10x this threshold in radians
             damping: DLS damping factor lambda
+            use_analytic: Try the closed-form solver before iterating
+            use_seed_index: Start the iteration from the nearest previously
+                solved pose in ik_seed_index instead of the current joint
+                angles, and record the result there
 
         Returns:
             List of joint angles if converged within limits, None otherwise
         """
+        if use_analytic:
+            solutions = self.calculate_analytic_ik(position, orientation, tolerance=tolerance)
+            if solutions:
+                if use_seed_index:
+                    self.ik_seed_index.insert(position, orientation, solutions[0])
+                return [float(a) for a in solutions[0]]
+
+        seed = self.ik_seed_index.nearest(position, orientation) if use_seed_index else None
+        if seed is None:
+            seed = self.joint_angles
+        q, converged, _, _ = self._dls_solve(position, orientation, seed,
+                                             max_iterations, tolerance, damping)
+        if not converged:
+            return None
+        if use_seed_index:
+            self.ik_seed_index.insert(position, orientation, q)
+        return [float(a) for a in q]
+
+    def _dls_solve(self, position: List[float], orientation: List[float], seed: np.ndarray,
+                   max_iterations: int, tolerance: float,
+                   damping: float) -> Tuple[np.ndarray, bool, int, float]:
+        """
+        Damped-least-squares iteration from a single seed.
+
+        Returns:
+            Tuple of (joint_angles, converged, iterations, residual) where
+            residual is the norm of the final 6D pose error
+        """
         target_pos = np.asarray(position, dtype=float)
         R_target = self._rpy_to_matrix(np.asarray(orientation, dtype=float))
         lam_sq = damping ** 2
         lo = np.array([l for l, _ in self.joint_limits])
         hi = np.array([h for _, h in self.joint_limits])
 
-        q = np.asarray(self.joint_angles, dtype=float).copy()
-        for _ in range(max_iterations):
-            T = self.forward_kinematics(q)
+        chain = self.kinematic_chain
+        q = np.asarray(seed, dtype=float).copy()
+        for iteration in range(max_iterations):
+            # Pose and Jacobian come from the same FK pass, computed into the
+            # chain's own buffers.
+            frames = chain.frames(q)
+            T = frames[-1]
             pos_err = target_pos - T[:3, 3]
             ori_err = self._rotation_vector(R_target @ T[:3, :3].T)
-            if np.linalg.norm(pos_err) < tolerance and np.linalg.norm(ori_err) < 10 * tolerance:
-                return [float(a) for a in q]
             e = np.concatenate([pos_err, ori_err])
-            J = self.jacobian(q)
+            if np.linalg.norm(pos_err) < tolerance and np.linalg.norm(ori_err) < 10 * tolerance:
+                return q, True, iteration, float(np.linalg.norm(e))
+            J = chain.jacobian(q, frames=frames)
             dq = J.T @ np.linalg.solve(J @ J.T + lam_sq * np.eye(6), e)
             # Bound the step so a bad linearization cannot fling the arm.
             step = np.linalg.norm(dq)
             if step > 0.5:
                 dq *= 0.5 / step
             q = np.clip(q + dq, lo, hi)
-        return None
+
+        T = chain.forward_kinematics(q)
+        e = np.concatenate([target_pos - T[:3, 3],
+                            self._rotation_vector(R_target @ T[:3, :3].T)])
+        return q, False, max_iterations, float(np.linalg.norm(e))
+
+    def calculate_inverse_kinematics_lm(self, position: List[float], orientation: List[float],
+                                        max_iterations: int = 200, tolerance: float = 1e-3,
+                                        initial_damping: float = 0.1,
+                                        seed: Optional[np.ndarray] = None
+                                        ) -> Tuple[Optional[List[float]], Dict[str, Any]]:
+        """
+        Levenberg-Marquardt IK with adaptive damping.
+
+        Each iteration solves the Levenberg system (J^T J + lambda I) dq = J^T e
+        and evaluates the FK once at the trial point. The gain ratio between
+        the actual and the linearly predicted error reduction decides whether
+        the step is accepted and how lambda moves (Nielsen's rule): good
+        steps shrink it toward Gauss-Newton, rejected steps grow it toward
+        gradient descent, so no fixed damping or step clamp is needed. The
+        analytic Jacobian of an accepted point reuses the frames of the FK
+        pass that scored it, and a rejected step keeps the current one, so
+        no iteration pays for more than one FK pass. The solve gives up
+        early once ten accepted steps in a row have cut the error by less
+        than 1% in total, which is where a seed pinned against the joint
+        limits ends up; the damped-least-squares loop would spend its whole
+        budget there (see scripts/benchmark_ik.py).
+
+        Args:
+            position: Target position [x, y, z]
+            orientation: Target orientation [roll, pitch, yaw] (radians)
+            max_iterations: Iteration budget
+            tolerance: Convergence threshold on position error (m); the
+                orientation error uses 10x this threshold in radians
+            initial_damping: Starting lambda
+            seed: Initial joint angles (defaults to the current joint angles)
+
+        Returns:
+            Tuple of (solution, stats). solution is the joint angles or None
+            if not converged; stats holds converged, stalled, iterations,
+            fk_evaluations, jacobian_evaluations, residuals (6D error norm
+            per accepted iterate) and the final damping
+        """
+        target_pos = np.asarray(position, dtype=float)
+        R_target = self._rpy_to_matrix(np.asarray(orientation, dtype=float))
+        lo = np.array([l for l, _ in self.joint_limits])
+        hi = np.array([h for _, h in self.joint_limits])
+        chain = self.kinematic_chain
+        stall_steps, stall_improvement = 10, 0.01
+
+        def pose_error(frames):
+            T = frames[-1]
+            return np.concatenate([target_pos - T[:3, 3],
+                                   self._rotation_vector(R_target @ T[:3, :3].T)])
+
+        def is_converged(e):
+            return np.linalg.norm(e[:3]) < tolerance and np.linalg.norm(e[3:]) < 10 * tolerance
+
+        q = np.array(self.joint_angles if seed is None else seed, dtype=float)
+        frames = chain.frames(q)
+        e = pose_error(frames)
+        J = chain.jacobian(q, frames=frames).copy()
+        fk_evaluations, jacobian_evaluations = 1, 1
+        lam, nu = initial_damping, 2.0
+        residuals = [float(np.linalg.norm(e))]
+
+        iteration = 0
+        converged = is_converged(e)
+        stalled = False
+        while not (converged or stalled) and iteration < max_iterations:
+            iteration += 1
+            dq = np.linalg.solve(J.T @ J + lam * np.eye(6), J.T @ e)
+            q_trial = np.clip(q + dq, lo, hi)
+            dq = q_trial - q
+            frames = chain.frames(q_trial)
+            e_trial = pose_error(frames)
+            fk_evaluations += 1
+
+            predicted_e = e - J @ dq
+            predicted = e @ e - predicted_e @ predicted_e
+            actual = e @ e - e_trial @ e_trial
+            rho = actual / predicted if predicted > 0 else -1.0
+            if rho > 0:
+                q, e = q_trial, e_trial
+                lam *= max(1.0 / 3.0, 1.0 - (2.0 * rho - 1.0) ** 3)
+                nu = 2.0
+                residuals.append(float(np.linalg.norm(e)))
+                converged = is_converged(e)
+                stalled = (not converged and len(residuals) > stall_steps and
+                           residuals[-1 - stall_steps] - residuals[-1] <
+                           stall_improvement * residuals[-1])
+                if not (converged or stalled):
+                    J = chain.jacobian(q, frames=frames).copy()
+                    jacobian_evaluations += 1
+            else:
+                lam = min(lam * nu, 1e6)
+                nu *= 2.0
+
+        stats = {
+            "converged": bool(converged),
+            "stalled": stalled,
+            "iterations": iteration,
+            "fk_evaluations": fk_evaluations,
+            "jacobian_evaluations": jacobian_evaluations,
+            "residuals": residuals,
+            "damping": lam,
+        }
+        if not converged:
+            return None, stats
+        self.ik_seed_index.insert(position, orientation, q)
+        return [float(a) for a in q], stats
+
+    def calculate_inverse_kinematics_multistart(self, position: List[float],
+                                                orientation: List[float],
+                                                num_starts: int = 8,
+                                                executor: str = "batch",
+                                                max_workers: Optional[int] = None,
+                                                max_iterations: int = 200,
+                                                tolerance: float = 1e-3,
+                                                damping: float = 0.05,
+                                                random_seed: Optional[int] = None,
+                                                chunk_size: int = 4
+                                                ) -> Tuple[Optional[List[float]], Dict[str, Any]]:
+        """
+        Damped-least-squares IK from several diverse seeds, for hard targets.
+
+        The first start is the usual warm start (nearest solved pose, else
+        the current joint angles); the others are spread over the joint
+        ranges by Latin-hypercube sampling so a seed stuck near a singularity
+        or joint limit does not doom the solve. With executor="batch" the
+        starts iterate chunk_size at a time in calculate_inverse_kinematics_batch;
+        once a chunk has a converged start, its lowest-numbered one wins and
+        the remaining chunks are never run. With executor="process" the
+        starts run in a ProcessPoolExecutor; the first start to converge
+        wins and the remaining work is cancelled.
+
+        Args:
+            position: Target position [x, y, z]
+            orientation: Target orientation [roll, pitch, yaw] (radians)
+            num_starts: Number of seeds K
+            executor: "batch" (vectorized, in-process) or "process"
+            max_workers: Process pool size for executor="process"
+            max_iterations: Iteration budget per start
+            tolerance: Convergence threshold on position error (m); the
+                orientation error uses 10x this threshold in radians
+            damping: DLS damping factor lambda
+            random_seed: Seed for the start sampler, for repeatable runs
+            chunk_size: Starts solved together per batch for executor="batch"
+
+        Returns:
+            Tuple of (solution, stats). solution is the converged joint
+            angles, or the lowest-residual iterate if no start converged;
+            stats holds converged, winning_start, starts_launched,
+            starts_completed, starts_converged and residual
+        """
+        seeds = self._multistart_seeds(position, orientation, num_starts, random_seed)
+        if executor == "batch":
+            results, completed = self._run_multistart_chunks(
+                position, orientation, seeds, chunk_size, max_iterations, tolerance, damping)
+            # Chunks after the first converged one are never started.
+            launched = completed
+        elif executor == "process":
+            results, completed = self._run_multistart_processes(
+                position, orientation, seeds, max_workers, max_iterations, tolerance, damping)
+            launched = num_starts
+        else:
+            raise ValueError(f"Unknown multistart executor: {executor}")
+
+        converged_starts = [i for i, r in enumerate(results) if r is not None and r[1]]
+        if converged_starts:
+            winner = converged_starts[0]
+        else:
+            winner = min((i for i, r in enumerate(results) if r is not None),
+                         key=lambda i: results[i][2])
+        q, ok, residual = results[winner]
+        if ok:
+            self.ik_seed_index.insert(position, orientation, q)
+        stats = {
+            "converged": bool(ok),
+            "winning_start": winner,
+            "starts_launched": launched,
+            "starts_completed": completed,
+            "starts_converged": len(converged_starts),
+            "residual": float(residual),
+        }
+        return [float(a) for a in q], stats
+
+    def _multistart_seeds(self, position: List[float], orientation: List[float],
+                          num_starts: int, random_seed: Optional[int]) -> np.ndarray:
+        """Warm start followed by Latin-hypercube samples over the joint limits."""
+        rng = np.random.default_rng(random_seed)
+        lo = np.array([l for l, _ in self.joint_limits])
+        hi = np.array([h for _, h in self.joint_limits])
+        strata = np.stack([rng.permutation(num_starts) for _ in range(len(lo))], axis=1)
+        seeds = lo + (strata + rng.random(strata.shape)) / num_starts * (hi - lo)
+        warm = self.ik_seed_index.nearest(position, orientation)
+        seeds[0] = self.joint_angles if warm is None else warm
+        return seeds
+
+    def _pose_residuals(self, joint_angles: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """Norm of the 6D pose error of each row of joint_angles against targets."""
+        T = self.kinematic_chain.forward_kinematics_batch(joint_angles)
+        pos_err = targets[:, :3] - T[:, :3, 3]
+        ori_err = self._rotation_vector_batch(
+            self._rpy_to_matrix_batch(targets[:, 3:]) @ T[:, :3, :3].transpose(0, 2, 1))
+        return np.linalg.norm(np.concatenate([pos_err, ori_err], axis=1), axis=1)
+
+    def _run_multistart_chunks(self, position, orientation, seeds, chunk_size,
+                               max_iterations, tolerance, damping):
+        """Run batched DLS solves chunk_size seeds at a time until a chunk converges."""
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        target = np.concatenate([np.asarray(position, dtype=float),
+                                 np.asarray(orientation, dtype=float)])
+        results = [None] * len(seeds)
+        completed = 0
+        for start in range(0, len(seeds), chunk_size):
+            chunk = seeds[start:start + chunk_size]
+            targets = np.tile(target, (len(chunk), 1))
+            Q, converged = self.calculate_inverse_kinematics_batch(
+                targets, max_iterations=max_iterations, tolerance=tolerance, damping=damping,
+                seeds=chunk, use_analytic=False, use_seed_index=False)
+            residuals = self._pose_residuals(Q, targets)
+            results[start:start + len(chunk)] = zip(Q, converged, residuals)
+            completed += len(chunk)
+            if converged.any():
+                break
+        return results, completed
+
+    def _run_multistart_processes(self, position, orientation, seeds, max_workers,
+                                  max_iterations, tolerance, damping):
+        """Run one DLS solve per seed in a process pool until one converges."""
+        results = [None] * len(seeds)
+        completed = 0
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                pool.submit(_solve_from_seed, self.dh_params, self.joint_limits,
+                            list(position), list(orientation), seed,
+                            max_iterations, tolerance, damping): i
+                for i, seed in enumerate(seeds)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                q, ok, _, residual = future.result()
+                results[i] = (q, ok, residual)
+                completed += 1
+                if ok:
+                    break
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return results, completed
+
+    def calculate_inverse_kinematics_batch(self, targets: np.ndarray,
+                                           max_iterations: int = 200,
+                                           tolerance: float = 1e-3,
+                                           damping: float = 0.05,
+                                           seeds: Optional[np.ndarray] = None,
+                                           use_analytic: bool = True,
+                                           use_seed_index: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Solve inverse kinematics for N target poses together.
+
+        Rows the closed-form solver handles are settled first; the rest run
+        the same damped-least-squares update as calculate_inverse_kinematics,
+        but all at once: one batched FK pass gives the poses and Jacobians of
+        every unconverged row, and the N 6x6 damped systems are solved with a
+        single stacked np.linalg.solve. Converged rows drop out of the active
+        set so later iterations only pay for the stragglers.
+
+        Args:
+            targets: (N, 6) array of [x, y, z, roll, pitch, yaw] poses
+            max_iterations: Iteration budget shared by all rows
+            tolerance: Convergence threshold on position error (m); the
+                orientation error uses 10x this threshold in radians
+            damping: DLS damping factor lambda
+            seeds: Optional (N, 6) initial joint angles (defaults to the
+                nearest entry in ik_seed_index, else the current joint angles)
+            use_analytic: Try the closed-form solver before iterating
+            use_seed_index: Draw default seeds from ik_seed_index and record
+                converged rows there
+
+        Returns:
+            Tuple of (solutions, converged): (N, 6) joint angles and an (N,)
+            boolean mask; rows with converged False hold the last iterate
+        """
+        targets = np.atleast_2d(np.asarray(targets, dtype=float))
+        n = targets.shape[0]
+        if seeds is None:
+            Q = np.tile(np.asarray(self.joint_angles, dtype=float), (n, 1))
+            if use_seed_index:
+                for i, target in enumerate(targets):
+                    seed = self.ik_seed_index.nearest(target[:3], target[3:])
+                    if seed is not None:
+                        Q[i] = seed
+        else:
+            Q = np.array(seeds, dtype=float).reshape(n, 6)
+        converged = np.zeros(n, dtype=bool)
+
+        if use_analytic:
+            for i, target in enumerate(targets):
+                solutions = self.calculate_analytic_ik(target[:3], target[3:],
+                                                       tolerance=tolerance, seed=Q[i])
+                if solutions:
+                    Q[i] = solutions[0]
+                    converged[i] = True
+
+        target_pos = targets[:, :3]
+        R_target = self._rpy_to_matrix_batch(targets[:, 3:])
+        lam_sq_eye = damping ** 2 * np.eye(6)
+        lo = np.array([l for l, _ in self.joint_limits])
+        hi = np.array([h for _, h in self.joint_limits])
+
+        chain = self.kinematic_chain
+        active = np.flatnonzero(~converged)
+        for _ in range(max_iterations):
+            if active.size == 0:
+                break
+            T, frames = chain.forward_kinematics_batch(Q[active], return_frames=True)
+            pos_err = target_pos[active] - T[:, :3, 3]
+            ori_err = self._rotation_vector_batch(
+                R_target[active] @ T[:, :3, :3].transpose(0, 2, 1))
+            done = ((np.linalg.norm(pos_err, axis=1) < tolerance) &
+                    (np.linalg.norm(ori_err, axis=1) < 10 * tolerance))
+            converged[active[done]] = True
+            keep = ~done
+            active = active[keep]
+            if active.size == 0:
+                break
+            e = np.concatenate([pos_err[keep], ori_err[keep]], axis=1)
+            J = chain.jacobian_batch(None, frames=frames[keep])
+            Jt = J.transpose(0, 2, 1)
+            dq = (Jt @ np.linalg.solve(J @ Jt + lam_sq_eye, e[:, :, None]))[:, :, 0]
+            # Same per-row step bound as the single-target solver.
+            step = np.linalg.norm(dq, axis=1)
+            dq *= np.minimum(1.0, 0.5 / np.maximum(step, 1e-12))[:, None]
+            Q[active] = np.clip(Q[active] + dq, lo, hi)
+
+        if use_seed_index:
+            for i in np.flatnonzero(converged):
+                self.ik_seed_index.insert(targets[i, :3], targets[i, 3:], Q[i])
+        return Q, converged
 
     def _check_joint_limits(self, joint_angles: List[float]) -> bool:
         """
@@ -272,4 +898,13 @@ class RoboticArm:
         for i, angle in enumerate(joint_angles):
             if not self.joint_limits[i][0] <= angle <= self.joint_limits[i][1]:
                 return False
-        return True 
\ No newline at end of file
+        return True
+
+
+def _solve_from_seed(dh_params, joint_limits, position, orientation, seed,
+                     max_iterations, tolerance, damping):
+    """Process-pool entry point: one DLS solve on a fresh arm with the given kinematics."""
+    arm = RoboticArm()
+    arm.dh_params = list(dh_params)
+    arm.joint_limits = list(joint_limits)
+    return arm._dls_solve(position, orientation, seed, max_iterations, tolerance, damping)
@@ -1,6 +1,6 @@
 from enum import Enum
 from typing import List, Dict, Any, Optional
-import time
+from app.utils.clock import Clock, RealClock
 
 class SafetyState(Enum):
     """Enumeration of possible safety system states."""
@@ -24,8 +24,14 @@ class SafetySystem:
     RESET_REQUIRED, and only an explicit system reset returns it to NORMAL.
     """
 
-    def __init__(self):
-        """Initialize the safety system."""
+    def __init__(self, clock: Clock = None):
+        """
+        Initialize the safety system.
+
+        Args:
+            clock: Time source for event timestamps; defaults to the wall clock
+        """
+        self.clock = clock if clock is not None else RealClock()
         self.state = SafetyState.NORMAL
         self.emergency_stop_pressed = False
         self.light_curtain_status = True   # True = clear/intact
@@ -35,7 +41,7 @@ class SafetySystem:
     # --- internal helpers -------------------------------------------------
 
     def _log_event(self, event_type: str, **details):
-        self.events.append(SafetyEvent(event_type, time.time(), details))
+        self.events.append(SafetyEvent(event_type, self.clock.time(), details))
 
     def _update_state_after_fault(self):
         """Set state to the highest-priority active fault."""
@@ -0,0 +1,151 @@
+from typing import Optional, Tuple
+import numpy as np
+import cv2
+
+
+class SensorNoise:
+    """
+    Image sensor noise applied in place to uint8 frames.
+
+    Three sources are modelled, all in digital numbers (DN) and all scaled
+    by the analog gain:
+
+    - read noise: zero-mean Gaussian, sigma = read_noise * gain
+    - shot noise: Poisson, approximated as Gaussian with a variance
+      proportional to the signal, sigma = shot_noise * sqrt(gain * value)
+    - fixed-pattern noise: a per-pixel offset that is the same on every
+      frame, sigma = fixed_pattern_noise * gain
+
+    Random numbers are drawn once per resolution rather than per frame:
+    the read and shot noise come from unit-normal tiles a margin larger
+    than the frame, and each frame uses a window at a random offset. The
+    read noise and fixed pattern are kept pre-scaled as int16, and a stack
+    of frames gets its noise with a single saturating add.
+    """
+
+    # Frames whose noise is gathered for one add; bounds the int16 buffer
+    stack_frames = 4
+
+    def __init__(self, read_noise: float = 10.0, shot_noise: float = 0.0,
+                 fixed_pattern_noise: float = 0.0, gain: float = 1.0,
+                 seed: Optional[int] = None, margin: int = 64):
+        """
+        Initialize the noise model.
+
+        Args:
+            read_noise: Read noise sigma at unit gain (DN)
+            shot_noise: Shot noise scale; sigma is shot_noise * sqrt(gain * value)
+            fixed_pattern_noise: Fixed-pattern sigma at unit gain (DN)
+            gain: Analog gain
+            seed: Seed for the noise generator
+            margin: Extra rows and columns of the tiles, i.e. the range of
+                the random window offsets
+        """
+        self.rng = np.random.default_rng(seed)
+        self.margin = margin
+        self.read_noise = read_noise
+        self.shot_noise = shot_noise
+        self.fixed_pattern_noise = fixed_pattern_noise
+        self.gain = gain
+        self.shape: Optional[Tuple[int, ...]] = None
+        # Parameters the scaled tiles were built for
+        self._scaled_for = None
+
+    def _parameters(self) -> Tuple[float, float, float, float]:
+        return (self.read_noise, self.shot_noise, self.fixed_pattern_noise, self.gain)
+
+    def configure(self, shape: Tuple[int, ...]) -> None:
+        """
+        Draw the noise tiles for a frame shape; a no-op if unchanged.
+
+        Args:
+            shape: Frame shape (height, width, channels)
+        """
+        shape = tuple(shape)
+        if shape == self.shape:
+            return
+        self.shape = shape
+        height, width = shape[:2]
+        padded = (height + self.margin, width + self.margin) + shape[2:]
+        self._unit_read = self.rng.standard_normal(padded, dtype=np.float32)
+        self._unit_shot = self.rng.standard_normal(padded, dtype=np.float32)
+        self._unit_fixed = self.rng.standard_normal(shape, dtype=np.float32)
+        self._total = np.empty((1,) + shape, dtype=np.int16)
+        self._shot = np.empty(shape, dtype=np.float32)
+        self._scaled_for = None
+
+    def _rescale(self) -> None:
+        """Rebuild the pre-scaled int16 tiles and the shot-noise lookup table."""
+        self._read = np.rint(self._unit_read * (self.read_noise * self.gain)).astype(np.int16)
+        self._fixed = np.rint(self._unit_fixed * (self.fixed_pattern_noise * self.gain)).astype(np.int16)
+        self._shot_sigma = (self.shot_noise *
+                            np.sqrt(self.gain * np.arange(256, dtype=np.float32))).astype(np.float32)
+        self._scaled_for = self._parameters()
+
+    def _window(self, tile: np.ndarray, dy: int, dx: int) -> np.ndarray:
+        """Frame-sized view of a tile at an offset."""
+        return tile[dy:dy + self.shape[0], dx:dx + self.shape[1]]
+
+    def _stack(self, count: int) -> np.ndarray:
+        """int16 noise stack for count frames, reused across calls."""
+        if len(self._total) != count:
+            self._total = np.empty((count,) + self.shape, dtype=np.int16)
+        return self._total
+
+    def apply(self, image: np.ndarray) -> np.ndarray:
+        """
+        Add noise to a uint8 frame in place, saturating at 0 and 255.
+
+        Args:
+            image: (height, width, channels) uint8 frame
+
+        Returns:
+            The same array
+        """
+        self.apply_batch(image[None])
+        return image
+
+    def apply_batch(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Add independent noise to a stack of uint8 frames in place.
+
+        Every frame draws its own tile offsets. The noise of up to
+        stack_frames frames is gathered into one int16 stack and added
+        with a single saturating add over it.
+
+        Args:
+            frames: (N, height, width, channels) uint8 frames
+
+        Returns:
+            The same array
+        """
+        self.configure(frames.shape[1:])
+        if self._scaled_for != self._parameters():
+            self._rescale()
+        for start in range(0, len(frames), self.stack_frames):
+            self._apply_stack(frames[start:start + self.stack_frames])
+        return frames
+
+    def _apply_stack(self, frames: np.ndarray) -> None:
+        count = len(frames)
+        total, shot = self._stack(count), self._shot
+        offsets = self.rng.integers(0, self.margin + 1, size=(count, 4))
+        for k, (dy, dx, shot_dy, shot_dx) in enumerate(offsets):
+            if self.fixed_pattern_noise:
+                np.add(self._window(self._read, dy, dx), self._fixed, out=total[k])
+            else:
+                np.copyto(total[k], self._window(self._read, dy, dx))
+            if self.shot_noise:
+                # Shot noise follows the clean signal, so it is drawn first.
+                np.take(self._shot_sigma, frames[k], out=shot)
+                shot *= self._window(self._unit_shot, shot_dy, shot_dx)
+                np.add(total[k], np.rint(shot, out=shot), out=total[k], casting="unsafe")
+        if frames.flags.c_contiguous:
+            # One saturating add over the stack viewed as a single 2-D image.
+            rows = count * self.shape[0]
+            cv2.add(frames.reshape(rows, -1), total.reshape(rows, -1),
+                    dst=frames.reshape(rows, -1), dtype=cv2.CV_8U)
+        else:
+            np.add(total, frames, out=total)
+            np.clip(total, 0, 255, out=total)
+            np.copyto(frames, total, casting="unsafe")
@@ -0,0 +1,483 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+
+class MotionProfile:
+    """
+    Rest-to-rest 1D motion of a path parameter s from 0 to 1.
+
+    The profile is stored as segments of constant jerk, each with its
+    duration and the acceleration at its start, so trapezoidal
+    (piecewise-constant acceleration) and S-curve (piecewise-constant
+    jerk) profiles share one vectorized sampler.
+    """
+
+    def __init__(self, durations: List[float], start_accelerations: List[float],
+                 jerks: List[float]):
+        self.durations = np.asarray(durations, dtype=float)
+        self.start_accelerations = np.asarray(start_accelerations, dtype=float)
+        self.jerks = np.asarray(jerks, dtype=float)
+        self.start_times = np.concatenate([[0.0], np.cumsum(self.durations)[:-1]])
+        self.duration = float(self.durations.sum())
+
+        # Position and velocity at each segment start.
+        n = len(self.durations)
+        self.start_positions = np.zeros(n)
+        self.start_velocities = np.zeros(n)
+        for k in range(1, n):
+            t = self.durations[k - 1]
+            a0, j = self.start_accelerations[k - 1], self.jerks[k - 1]
+            v0, s0 = self.start_velocities[k - 1], self.start_positions[k - 1]
+            self.start_velocities[k] = v0 + a0 * t + j * t ** 2 / 2
+            self.start_positions[k] = s0 + v0 * t + a0 * t ** 2 / 2 + j * t ** 3 / 6
+
+    @classmethod
+    def trapezoidal(cls, max_velocity: float, max_acceleration: float) -> "MotionProfile":
+        """
+        Minimum-time trapezoidal (or triangular) profile over s in [0, 1].
+
+        Args:
+            max_velocity: Limit on ds/dt
+            max_acceleration: Limit on d2s/dt2
+        """
+        t_acc = max_velocity / max_acceleration
+        if max_velocity * t_acc >= 1.0:
+            # Never reaches cruise speed: triangular profile.
+            t_acc = np.sqrt(1.0 / max_acceleration)
+            t_cruise = 0.0
+        else:
+            t_cruise = 1.0 / max_velocity - t_acc
+        a = max_acceleration
+        return cls([t_acc, t_cruise, t_acc], [a, 0.0, -a], [0.0, 0.0, 0.0])
+
+    @classmethod
+    def s_curve(cls, max_velocity: float, max_acceleration: float,
+                max_jerk: float) -> "MotionProfile":
+        """
+        Minimum-time jerk-limited (double-S, seven-segment) profile over s in [0, 1].
+
+        Follows the rest-to-rest case of the double-S planner: reduce the
+        peak acceleration if the jerk phases alone would overshoot the
+        velocity limit, then drop the cruise phase and re-solve for the
+        peak acceleration if the distance is too short to reach cruise.
+
+        Args:
+            max_velocity: Limit on ds/dt
+            max_acceleration: Limit on d2s/dt2
+            max_jerk: Limit on d3s/dt3
+        """
+        v, a, j = max_velocity, max_acceleration, max_jerk
+        if v * j >= a * a:
+            t_jerk = a / j
+            t_acc = t_jerk + v / a
+        else:
+            t_jerk = np.sqrt(v / j)
+            t_acc = 2 * t_jerk
+        t_cruise = 1.0 / v - t_acc
+
+        if t_cruise < 0:
+            t_cruise = 0.0
+            t_jerk = a / j
+            t_acc = (a * a / j + np.sqrt((a * a / j) ** 2 + 4 * a)) / (2 * a)
+            if t_acc < 2 * t_jerk:
+                # Acceleration limit is never reached.
+                t_jerk = (1.0 / (2 * j)) ** (1.0 / 3.0)
+                t_acc = 2 * t_jerk
+        a_peak = j * t_jerk
+        t_const = t_acc - 2 * t_jerk
+        return cls(
+            [t_jerk, t_const, t_jerk, t_cruise, t_jerk, t_const, t_jerk],
+            [0.0, a_peak, a_peak, 0.0, 0.0, -a_peak, -a_peak],
+            [j, 0.0, -j, 0.0, -j, 0.0, j],
+        )
+
+    def sample(self, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluate the profile at any number of times.
+
+        Args:
+            times: Array of times in seconds; values outside
+                [0, duration] are clamped
+
+        Returns:
+            Tuple of (s, ds/dt, d2s/dt2) arrays shaped like times
+        """
+        t = np.clip(np.asarray(times, dtype=float), 0.0, self.duration)
+        k = np.clip(np.searchsorted(self.start_times, t, side="right") - 1,
+                    0, len(self.durations) - 1)
+        tau = t - self.start_times[k]
+        a0, j = self.start_accelerations[k], self.jerks[k]
+        v0, s0 = self.start_velocities[k], self.start_positions[k]
+        s = s0 + v0 * tau + a0 * tau ** 2 / 2 + j * tau ** 3 / 6
+        ds = v0 + a0 * tau + j * tau ** 2 / 2
+        dds = a0 + j * tau
+        # The final sample lands exactly on the goal.
+        s = np.where(t >= self.duration, 1.0, s)
+        return s, ds, dds
+
+
+def synchronized_move_durations(delta: np.ndarray, max_velocity: np.ndarray,
+                                max_acceleration: np.ndarray) -> np.ndarray:
+    """
+    Durations of synchronized trapezoidal moves without building trajectories.
+
+    Closed form of JointTrajectory(...).duration for the trapezoidal
+    profile, vectorized over any number of moves, e.g. every pair of
+    configurations in a cost matrix.
+
+    Args:
+        delta: (..., n_joints) joint displacements (radians)
+        max_velocity: Per-joint velocity limits (rad/s)
+        max_acceleration: Per-joint acceleration limits (rad/s^2)
+
+    Returns:
+        Array of durations in seconds with shape delta.shape[:-1]
+    """
+    distance = np.abs(np.asarray(delta, dtype=float))
+    with np.errstate(divide="ignore"):
+        velocity = np.min(np.asarray(max_velocity, dtype=float) / distance, axis=-1)
+        acceleration = np.min(np.asarray(max_acceleration, dtype=float) / distance, axis=-1)
+    moving = np.isfinite(velocity)
+    velocity = np.where(moving, velocity, 1.0)
+    acceleration = np.where(moving, acceleration, 1.0)
+    # Triangular when cruise speed is never reached, trapezoidal otherwise.
+    durations = np.where(velocity * velocity >= acceleration,
+                         2.0 / np.sqrt(acceleration),
+                         1.0 / velocity + velocity / acceleration)
+    return np.where(moving, durations, 0.0)
+
+
+class JointTrajectory:
+    """
+    Synchronized point-to-point joint-space motion.
+
+    Every joint follows the straight line from start to goal in joint
+    space, driven by one shared path profile s(t). The profile's limits
+    are the tightest per-joint limits scaled by each joint's displacement
+    (v_i / |dq_i| and so on), so all joints start and stop together and
+    the joint that needs the longest time runs at its limits. For a
+    straight joint-space path this is also the minimum synchronized
+    duration.
+    """
+
+    PROFILES = ("trapezoidal", "s_curve")
+
+    def __init__(self, start: np.ndarray, goal: np.ndarray,
+                 max_velocity: np.ndarray, max_acceleration: np.ndarray,
+                 max_jerk: Optional[np.ndarray] = None, profile: str = "trapezoidal"):
+        """
+        Plan a trajectory.
+
+        Args:
+            start: Start joint angles (radians)
+            goal: Goal joint angles (radians)
+            max_velocity: Per-joint velocity limits (rad/s)
+            max_acceleration: Per-joint acceleration limits (rad/s^2)
+            max_jerk: Per-joint jerk limits (rad/s^3); required for "s_curve"
+            profile: "trapezoidal" or "s_curve"
+        """
+        if profile not in self.PROFILES:
+            raise ValueError(f"Unknown profile: {profile}")
+        if profile == "s_curve" and max_jerk is None:
+            raise ValueError("s_curve profile needs max_jerk")
+        self.start = np.asarray(start, dtype=float)
+        self.goal = np.asarray(goal, dtype=float)
+        self.delta = self.goal - self.start
+        self.profile_type = profile
+
+        moving = np.abs(self.delta) > 1e-12
+        if not moving.any():
+            self.profile = None
+            self.duration = 0.0
+            return
+
+        def path_limit(limit):
+            return float(np.min(np.broadcast_to(np.asarray(limit, dtype=float), self.delta.shape)[moving]
+                                / np.abs(self.delta[moving])))
+
+        if profile == "trapezoidal":
+            self.profile = MotionProfile.trapezoidal(path_limit(max_velocity),
+                                                     path_limit(max_acceleration))
+        else:
+            self.profile = MotionProfile.s_curve(path_limit(max_velocity),
+                                                 path_limit(max_acceleration),
+                                                 path_limit(max_jerk))
+        self.duration = self.profile.duration
+
+    def sample(self, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Joint positions, velocities and accelerations at the given times.
+
+        Args:
+            times: (M,) array of times in seconds
+
+        Returns:
+            Tuple of three (M, n_joints) arrays
+        """
+        times = np.atleast_1d(np.asarray(times, dtype=float))
+        if self.profile is None:
+            zeros = np.zeros((len(times), len(self.start)))
+            return zeros + self.start, zeros.copy(), zeros.copy()
+        s, ds, dds = self.profile.sample(times)
+        return (self.start + s[:, None] * self.delta,
+                ds[:, None] * self.delta,
+                dds[:, None] * self.delta)
+
+    def sample_uniform(self, dt: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Positions on a fixed control period, ending exactly at the goal.
+
+        Args:
+            dt: Sample period in seconds
+
+        Returns:
+            Tuple of (times, positions) with shapes (M,) and (M, n_joints)
+        """
+        count = max(int(np.ceil(self.duration / dt)), 0) + 1
+        times = np.minimum(np.arange(count) * dt, self.duration)
+        return times, self.sample(times)[0]
+
+
+class TimeOptimalTrajectory:
+    """
+    Fastest timing of a fixed joint-space path under per-joint limits.
+
+    The waypoints are joined by a cubic spline q(s) parameterized by
+    normalized joint-space arc length. Along the path, joint velocity is
+    q'(s) sdot and joint acceleration is q'(s) sddot + q''(s) sdot^2, so
+    with x = sdot^2 every limit becomes a bound that is linear in x and
+    in u = sddot. On a grid of path samples this gives:
+
+    - the maximum velocity curve, the largest x at each sample for which
+      some u satisfies every velocity and acceleration limit, and
+    - the admissible range [u_min(x), u_max(x)] at each sample.
+
+    The time-optimal profile is bang-bang. A backward pass integrates
+    maximum braking from rest at the goal, clipped to the maximum velocity
+    curve, which gives the fastest speed at each sample from which the
+    goal is still reachable. A forward pass then integrates maximum
+    acceleration x_{k+1} = x_k + 2 ds u_max from rest, clipped to the
+    backward pass. Each step respects the limits at both ends of its
+    interval. The limits are evaluated vectorized over all samples and
+    joints. Only the two integration passes step through the grid. The
+    acceleration is constant between samples, so limits hold at the
+    samples and to within the grid resolution in between.
+    """
+
+    def __init__(self, waypoints: np.ndarray, max_velocity: np.ndarray,
+                 max_acceleration: np.ndarray, grid_points: int = 200):
+        """
+        Time-parameterize a path.
+
+        Args:
+            waypoints: (K, n_joints) joint-space path (radians), K >= 2
+            max_velocity: Per-joint velocity limits (rad/s)
+            max_acceleration: Per-joint acceleration limits (rad/s^2)
+            grid_points: Number of path samples used for the optimization
+        """
+        waypoints = np.atleast_2d(np.asarray(waypoints, dtype=float))
+        # Repeated waypoints would give zero-length spline intervals.
+        keep = np.concatenate([[True], np.linalg.norm(np.diff(waypoints, axis=0), axis=1) > 1e-12])
+        waypoints = waypoints[keep]
+        self.waypoints = waypoints
+        self.start = waypoints[0]
+        self.goal = waypoints[-1]
+
+        if len(waypoints) < 2:
+            self.path = None
+            self.duration = 0.0
+            return
+
+        knots = np.concatenate([[0.0], np.cumsum(np.linalg.norm(np.diff(waypoints, axis=0), axis=1))])
+        self.path = CubicSpline(knots / knots[-1], waypoints, axis=0)
+        self._dpath = self.path.derivative(1)
+        self._ddpath = self.path.derivative(2)
+
+        v_max = np.broadcast_to(np.asarray(max_velocity, dtype=float), self.start.shape)
+        a_max = np.broadcast_to(np.asarray(max_acceleration, dtype=float), self.start.shape)
+        self.grid = np.linspace(0.0, 1.0, grid_points)
+        ds = self.grid[1] - self.grid[0]
+        dq = self._dpath(self.grid)
+        ddq = self._ddpath(self.grid)
+
+        x_limit = self._max_velocity_curve(dq, ddq, v_max, a_max)
+
+        # The acceleration of an interval must respect the limits at both of
+        # its samples. At the far sample x = x_near +/- 2 ds u, which folds
+        # into an effective path derivative q' +/- 2 ds q''.
+        ahead = dq + 2 * ds * ddq
+        behind = dq - 2 * ds * ddq
+
+        # Backward pass: the fastest speed at each sample from which the
+        # arm can still brake into rest at the goal without leaving the
+        # maximum velocity curve.
+        backward = np.empty(grid_points)
+        backward[-1] = 0.0
+        for k in range(grid_points - 1, 0, -1):
+            u_near, _ = self._acceleration_bounds(dq[k], ddq[k], a_max, backward[k])
+            u_far, _ = self._acceleration_bounds(behind[k - 1], ddq[k - 1], a_max, backward[k])
+            backward[k - 1] = np.clip(backward[k] - 2 * ds * max(u_near, u_far), 0.0, x_limit[k - 1])
+
+        # Forward pass: accelerate as hard as possible from rest, never past
+        # the speeds the backward pass can still brake from.
+        x = np.empty(grid_points)
+        x[0] = 0.0
+        for k in range(grid_points - 1):
+            _, u_near = self._acceleration_bounds(dq[k], ddq[k], a_max, x[k])
+            _, u_far = self._acceleration_bounds(ahead[k + 1], ddq[k + 1], a_max, x[k])
+            x[k + 1] = np.clip(x[k] + 2 * ds * min(u_near, u_far), 0.0, backward[k + 1])
+
+        self.path_speed = np.sqrt(x)
+        self.path_acceleration = np.diff(x) / (2 * ds)
+        # Constant acceleration per interval: dt = 2 ds / (sdot_k + sdot_k+1).
+        speed_sum = self.path_speed[:-1] + self.path_speed[1:]
+        intervals = np.divide(2 * ds, speed_sum, out=np.zeros_like(speed_sum), where=speed_sum > 0)
+        self.times = np.concatenate([[0.0], np.cumsum(intervals)])
+        self.duration = float(self.times[-1])
+
+    @staticmethod
+    def _acceleration_bounds(dq: np.ndarray, ddq: np.ndarray, a_max: np.ndarray,
+                             x) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Range of sddot allowed by the acceleration limits at path speed x.
+
+        Works on a single sample ((n,) arrays, scalar x) or on many samples
+        at once ((N, n) arrays, (N,) or (N, 1) x).
+        """
+        x = np.asarray(x, dtype=float)
+        if x.ndim == 1:
+            x = x[:, None]
+        moving = np.abs(dq) > 1e-9
+        safe = np.where(moving, dq, 1.0)
+        upper = (a_max - ddq * x) / safe
+        lower = (-a_max - ddq * x) / safe
+        hi = np.where(moving, np.where(dq > 0, upper, lower), np.inf)
+        lo = np.where(moving, np.where(dq > 0, lower, upper), -np.inf)
+        return lo.max(axis=-1), hi.min(axis=-1)
+
+    def _max_velocity_curve(self, dq: np.ndarray, ddq: np.ndarray, v_max: np.ndarray,
+                            a_max: np.ndarray) -> np.ndarray:
+        """Largest feasible x = sdot^2 at every grid sample."""
+        moving = np.abs(dq) > 1e-9
+        x_velocity = np.where(moving, (v_max / np.where(moving, dq, 1.0)) ** 2, np.inf).min(axis=1)
+        # Joints that are momentarily still still see q'' sdot^2.
+        curving = ~moving & (np.abs(ddq) > 1e-9)
+        x_still = np.where(curving, a_max / np.where(curving, np.abs(ddq), 1.0), np.inf).min(axis=1)
+        upper = np.minimum(x_velocity, x_still)
+
+        # The acceleration range shrinks linearly in x and is non-empty at
+        # x = 0, so the feasible x form an interval: bisect all samples at once.
+        lo = np.zeros(len(dq))
+        hi = np.where(np.isfinite(upper), upper, 1e6)
+        for _ in range(60):
+            mid = (lo + hi) / 2
+            u_lo, u_hi = self._acceleration_bounds(dq, ddq, a_max, mid)
+            ok = u_lo <= u_hi
+            lo = np.where(ok, mid, lo)
+            hi = np.where(ok, hi, mid)
+        return lo
+
+    def sample(self, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Joint positions, velocities and accelerations at the given times.
+
+        Args:
+            times: (M,) array of times in seconds
+
+        Returns:
+            Tuple of three (M, n_joints) arrays
+        """
+        times = np.atleast_1d(np.asarray(times, dtype=float))
+        if self.path is None:
+            zeros = np.zeros((len(times), len(self.start)))
+            return zeros + self.start, zeros.copy(), zeros.copy()
+        t = np.clip(times, 0.0, self.duration)
+        k = np.clip(np.searchsorted(self.times, t, side="right") - 1, 0, len(self.grid) - 2)
+        tau = t - self.times[k]
+        u = self.path_acceleration[k]
+        s_dot = self.path_speed[k] + u * tau
+        s = np.minimum(self.grid[k] + self.path_speed[k] * tau + u * tau ** 2 / 2, 1.0)
+        s = np.where(t >= self.duration, 1.0, s)
+        dq = self._dpath(s)
+        return (self.path(s),
+                dq * s_dot[:, None],
+                dq * u[:, None] + self._ddpath(s) * (s_dot ** 2)[:, None])
+
+    def sample_uniform(self, dt: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Positions on a fixed control period, ending exactly at the goal.
+
+        Args:
+            dt: Sample period in seconds
+
+        Returns:
+            Tuple of (times, positions) with shapes (M,) and (M, n_joints)
+        """
+        count = max(int(np.ceil(self.duration / dt)), 0) + 1
+        times = np.minimum(np.arange(count) * dt, self.duration)
+        return times, self.sample(times)[0]
+
+
+class SampledTrajectory:
+    """
+    Trajectory stored as joint positions at sample times.
+
+    Used to replay precomputed moves: positions are interpolated linearly
+    between samples, so replaying needs no planning.
+    """
+
+    def __init__(self, times: np.ndarray, positions: np.ndarray):
+        """
+        Wrap samples.
+
+        Args:
+            times: (M,) increasing sample times starting at 0 (seconds)
+            positions: (M, n_joints) joint positions (radians)
+        """
+        self.times = np.asarray(times, dtype=float)
+        self.positions = np.atleast_2d(np.asarray(positions, dtype=float))
+        self.start = self.positions[0]
+        self.goal = self.positions[-1]
+        self.duration = float(self.times[-1]) if len(self.times) else 0.0
+
+    @classmethod
+    def from_trajectory(cls, trajectory, dt: float) -> "SampledTrajectory":
+        """Sample any trajectory with sample_uniform() on a fixed period."""
+        return cls(*trajectory.sample_uniform(dt))
+
+    def sample(self, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Joint positions, velocities and accelerations at the given times.
+
+        Args:
+            times: (M,) array of times in seconds
+
+        Returns:
+            Tuple of three (M, n_joints) arrays; velocities and
+            accelerations are finite differences of the samples
+        """
+        times = np.atleast_1d(np.asarray(times, dtype=float))
+        if len(self.times) < 2:
+            zeros = np.zeros((len(times), self.positions.shape[1]))
+            return zeros + self.goal, zeros.copy(), zeros.copy()
+        pos = np.stack([np.interp(times, self.times, column) for column in self.positions.T], axis=1)
+        vel_samples = np.gradient(self.positions, self.times, axis=0)
+        acc_samples = np.gradient(vel_samples, self.times, axis=0)
+        vel = np.stack([np.interp(times, self.times, column) for column in vel_samples.T], axis=1)
+        acc = np.stack([np.interp(times, self.times, column) for column in acc_samples.T], axis=1)
+        return pos, vel, acc
+
+    def sample_uniform(self, dt: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Positions on a fixed control period, ending exactly at the goal.
+
+        Args:
+            dt: Sample period in seconds
+
+        Returns:
+            Tuple of (times, positions) with shapes (M,) and (M, n_joints)
+        """
+        count = max(int(np.ceil(self.duration / dt)), 0) + 1
+        times = np.minimum(np.arange(count) * dt, self.duration)
+        return times, self.sample(times)[0]
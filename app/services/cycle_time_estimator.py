@@ -0,0 +1,165 @@
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+from app.config.camera_config import CAMERA_CONFIG
+from app.models.trajectory import synchronized_move_durations
+
+# Default timing model for the non-motion parts of a step
+DEFAULT_TIMING_MODEL = {
+    "settle_time": 0.15,       # s, vibration settling before each capture
+    "exposure_time": 0.01,     # s
+    "readout_rate": 120e6,     # pixels/s sensor readout
+    "resolution": (CAMERA_CONFIG["resolution"]["width"],
+                   CAMERA_CONFIG["resolution"]["height"]),
+    # s of image analysis per step, by inspection type
+    "analysis_time": {
+        "scratches_small": 0.12,
+        "scratches_large": 0.08,
+        "fingerprints": 0.10,
+        "surface_quality": 0.15,
+        "edge_quality": 0.09,
+    },
+    "default_analysis_time": 0.10,
+}
+
+
+class CycleTimeEstimator:
+    """
+    Predicts how long an inspection takes without executing it.
+
+    Uses the inspection service's planning (grid, reachability, batch IK
+    and sequence ordering) and the controller's trajectory model, so the
+    predicted motion time is what executing the same plan would record.
+    Capture and analysis times come from a timing model. Steps without an
+    IK solution would fail during execution, so they are reported but
+    add no time; a plan in which no step can be timed is an error rather
+    than a zero-second estimate.
+    """
+
+    def __init__(self, service, timing_model: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the estimator.
+
+        Args:
+            service: InspectionService whose configuration, arm and
+                controller are used for planning
+            timing_model: Overrides for DEFAULT_TIMING_MODEL entries
+        """
+        self.service = service
+        self.timing_model = dict(DEFAULT_TIMING_MODEL)
+        if timing_model:
+            self.timing_model.update(timing_model)
+
+    def capture_time(self) -> float:
+        """Seconds from arriving at a point to having the image: settle, expose, read out."""
+        width, height = self.timing_model["resolution"]
+        return (self.timing_model["settle_time"] +
+                self.timing_model["exposure_time"] +
+                width * height / self.timing_model["readout_rate"])
+
+    def analysis_time(self, inspection_type: str) -> float:
+        """Seconds of image analysis per step for an inspection type."""
+        return self.timing_model["analysis_time"].get(
+            inspection_type, self.timing_model["default_analysis_time"])
+
+    def motion_times(self, configurations: np.ndarray,
+                     start: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Durations of the moves through a sequence of joint configurations.
+
+        Args:
+            configurations: (N, 6) joint angles in visiting order
+            start: Joint angles before the first move (defaults to the
+                arm's current joint angles)
+
+        Returns:
+            (N,) move durations in seconds
+        """
+        controller = self.service.arm_controller
+        arm = self.service.arm
+        if start is None:
+            start = arm.joint_angles
+        Q = np.vstack([np.asarray(start, dtype=float),
+                       np.asarray(configurations, dtype=float).reshape(-1, len(start))])
+        if controller.motion_profile == "trapezoidal":
+            return synchronized_move_durations(np.diff(Q, axis=0), arm.max_joint_velocity,
+                                               arm.max_joint_acceleration)
+        return np.array([controller.plan_joint_motion(goal, start=begin).duration
+                         for begin, goal in zip(Q[:-1], Q[1:])])
+
+    def estimate_plan(self, plan: Dict[str, Any], inspection_type: str) -> Dict[str, Any]:
+        """
+        Predict the durations of an already planned inspection.
+
+        Args:
+            plan: Plan from InspectionService.plan_inspection
+            inspection_type: Type of inspection, for the analysis time
+
+        Returns:
+            dict with 'steps' (per-step motion, capture, analysis and
+            total seconds), 'totals' (the same keys summed over steps),
+            'unsolved_steps' (indices of steps that would fail),
+            'unreachable_steps' (the subset outside the arm's workspace)
+            and 'timed_step_count'
+            
+        Raises:
+            ValueError: If no step of the plan has an IK solution
+        """
+        solved = np.asarray(plan["ik_converged"], dtype=bool)
+        unreachable = [i for i, point in enumerate(plan["sequence"])
+                       if not point.get("reachable", True)]
+        if not solved.any():
+            raise ValueError(
+                f"No step of the inspection can be timed: {len(unreachable)} of "
+                f"{len(solved)} points are outside the arm's workspace and the rest "
+                f"have no inverse kinematics solution")
+        motion = np.zeros(len(solved))
+        motion[solved] = self.motion_times(plan["ik_solutions"][solved])
+        capture = self.capture_time()
+        analysis = self.analysis_time(inspection_type)
+
+        steps: List[Dict[str, Any]] = []
+        for i, point in enumerate(plan["sequence"]):
+            ok = bool(solved[i])
+            step = {
+                "step": i,
+                "description": point.get("description", ""),
+                "solved": ok,
+                "motion": float(motion[i]),
+                "capture": capture if ok else 0.0,
+                "analysis": analysis if ok else 0.0,
+            }
+            step["total"] = step["motion"] + step["capture"] + step["analysis"]
+            steps.append(step)
+
+        totals = {key: float(sum(step[key] for step in steps))
+                  for key in ("motion", "capture", "analysis", "total")}
+        return {
+            "steps": steps,
+            "totals": totals,
+            "unsolved_steps": [i for i in range(len(solved)) if not solved[i]],
+            "unreachable_steps": unreachable,
+            "timed_step_count": int(solved.sum()),
+        }
+
+    def estimate(self, part_type: str, inspection_type: str) -> Dict[str, Any]:
+        """
+        Plan an inspection from the configuration and predict its cycle time.
+
+        Args:
+            part_type: Type of part to inspect
+            inspection_type: Type of inspection to perform
+
+        Returns:
+            dict as returned by estimate_plan, plus 'part_type' and
+            'inspection_type'
+
+        Raises:
+            ValueError: If the part or inspection type is unknown, or if
+                no step can be timed
+        """
+        plan = self.service.plan_inspection(part_type, inspection_type)
+        estimate = self.estimate_plan(plan, inspection_type)
+        estimate["part_type"] = part_type
+        estimate["inspection_type"] = inspection_type
+        return estimate
@@ -9,31 +9,90 @@ from datetime import datetime
 from app.models.robotic_arm import RoboticArm
 from app.models.camera import Camera
 from app.models.safety_system import SafetySystem
+from app.models.reachability_map import ReachabilityMap
 from app.controllers.robotic_arm_controller import RoboticArmController
 from app.controllers.camera_controller import CameraController
 from app.controllers.safety_controller import SafetyController
+from app.services.sequence_optimizer import optimize_sequence
+from app.services.plan_compiler import InspectionPlan, plan_fingerprint
+from app.services.plan_cache import PlanCache, grid_key, ik_key
 from app.config.camera_config import calculate_inspection_grid, CAMERA_CONFIG
+from app.utils.clock import Clock, RealClock
+
+# Inspection grids are laid out in millimetres; the arm model works in metres.
+MM_TO_M = 1e-3
+
+def select_inspection_points(inspection_points: List[Dict[str, Any]],
+                             inspection_type: str) -> List[Dict[str, Any]]:
+    """
+    Keep the inspection points an inspection type needs.
+    
+    Args:
+        inspection_points: Points from calculate_inspection_grid
+        inspection_type: Type of inspection to perform
+        
+    Returns:
+        List of the selected points, in grid order
+    """
+    if inspection_type == "scratches_small":
+        # For small scratches, we need high-resolution top views
+        return [p for p in inspection_points if p["type"] == "top_view"]
+    elif inspection_type == "scratches_large":
+        # For large scratches, we can use fewer points with wider spacing
+        return [p for p in inspection_points if p["type"] in ["top_view", "front_view", "back_view"]]
+    elif inspection_type == "fingerprints":
+        # For fingerprints, we need good lighting angles
+        return [p for p in inspection_points if p["type"] in ["front_view", "back_view"]]
+    elif inspection_type == "surface_quality":
+        # For surface quality, we need comprehensive coverage
+        return inspection_points
+    elif inspection_type == "edge_quality":
+        # For edge quality, we focus on the edges
+        return [p for p in inspection_points if p["type"] in ["front_view", "back_view"]]
+    return []
 
 class InspectionService:
     """Service for coordinating inspection operations."""
     
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None,
+                 reachability_map_path: Optional[Path] = None,
+                 clock: Optional[Clock] = None,
+                 plan_cache_path: Optional[Path] = None):
         """
         Initialize the inspection service.
         
         Args:
             config_path: Path to inspection configuration file
+            reachability_map_path: Where the arm's reachability map is
+                cached; it is built on first use if missing or stale
+            clock: Time source shared by the arm, PID loops and safety
+                system. Pass a VirtualClock to run inspections in simulated
+                time; defaults to the wall clock.
+            plan_cache_path: Directory where inspection grids and IK
+                results are cached across restarts
         """
+        self.clock = clock if clock is not None else RealClock()
+        
         # Set default config path if none provided
         if config_path is None:
             self.config_path = Path("data/configs/parts_inspection_config.json")
         else:
             self.config_path = config_path
             
+        if reachability_map_path is None:
+            self.reachability_map_path = Path("data/reachability_map.npz")
+        else:
+            self.reachability_map_path = reachability_map_path
+        self._reachability_map = None
+        
+        if plan_cache_path is None:
+            plan_cache_path = Path("data/plan_cache")
+        self.plan_cache = PlanCache(plan_cache_path)
+            
         # Initialize models
-        self.arm = RoboticArm()
+        self.arm = RoboticArm(clock=self.clock)
         self.camera = Camera()
-        self.safety_system = SafetySystem()
+        self.safety_system = SafetySystem(clock=self.clock)
         
         # Initialize controllers
         self.arm_controller = RoboticArmController(self.arm)
@@ -45,6 +104,19 @@ class InspectionService:
         self.current_step = 0
         self.results = []
         
+        # Joint solutions precomputed for the active sequence
+        self.ik_solutions = None
+        self.ik_converged = None
+        self._ik_sequence = None
+        
+        # Reorder solved points to minimize joint travel; the report holds
+        # the optimized and naive travel times of the active sequence
+        self.sequence_optimization = True
+        self.sequence_report = None
+        
+        # Compiled plan being replayed by start_planned_inspection
+        self.active_plan = None
+        
         # Load configuration
         self._load_config()
         
@@ -99,6 +171,104 @@ class InspectionService:
             return self.config[part_id]["inspection_points"]
         return []
     
+    def plan_inspection(self, part_type: str, inspection_type: str,
+                        camera_config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Plan an inspection sequence without executing it.
+        
+        Lays out the inspection grid for the part, keeps the points the
+        inspection type needs, flags points outside the arm's workspace,
+        solves IK for the rest from the current joint angles and orders
+        the solved points to minimize travel time. The grid and the IK
+        results are served from the plan cache when the part dimensions,
+        camera configuration, inspection type and arm kinematics match an
+        earlier plan; only the ordering, which depends on where the arm
+        currently is, is redone every time.
+        
+        Args:
+            part_type: Type of part to inspect
+            inspection_type: Type of inspection to perform
+            camera_config: Camera configuration for the grid layout
+                (defaults to CAMERA_CONFIG)
+            
+        Returns:
+            dict with 'sequence' (inspection points in execution order),
+            'ik_solutions' ((N, 6) joint angles), 'ik_converged' ((N,)
+            mask) and 'sequence_report' (travel times, or None)
+            
+        Raises:
+            ValueError: If the part or inspection type is unknown
+        """
+        # Validate part type and inspection type
+        if part_type not in self.config:
+            raise ValueError(f"Unknown part type: {part_type}")
+            
+        if inspection_type not in self.config[part_type]["inspection_types"]:
+            raise ValueError(f"Invalid inspection type {inspection_type} for part {part_type}")
+        
+        # Get part dimensions
+        part_dimensions = self.config[part_type]["dimensions"]
+        
+        camera_config = CAMERA_CONFIG if camera_config is None else camera_config
+        
+        key = ik_key(part_dimensions, camera_config, inspection_type, self.arm)
+        solved = self.plan_cache.get(key)
+        if solved is None:
+            solved = self._solve_inspection_points(
+                select_inspection_points(self._inspection_grid(part_dimensions, camera_config),
+                                         inspection_type))
+            self.plan_cache.put(key, solved)
+        plan = {
+            "sequence": solved["sequence"],
+            "ik_solutions": solved["ik_solutions"],
+            "ik_converged": solved["ik_converged"],
+            "sequence_report": None,
+        }
+        if self.sequence_optimization and plan["ik_converged"].sum() > 1:
+            self._optimize_step_order(plan)
+        return plan
+        
+    def _inspection_grid(self, part_dimensions: Dict[str, Any],
+                         camera_config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Inspection points for a part, memoized in the plan cache."""
+        key = grid_key(part_dimensions, camera_config)
+        cached = self.plan_cache.get(key)
+        if cached is not None:
+            return cached["points"]
+        # Calculate inspection points based on part dimensions and camera specs
+        points = calculate_inspection_grid(part_dimensions, camera_config)
+        self.plan_cache.put(key, {"points": points})
+        return points
+        
+    def _solve_inspection_points(self, sequence: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Flag unreachable points and solve IK for the rest.
+        
+        Args:
+            sequence: Inspection points, updated with a 'reachable' flag
+            
+        Returns:
+            dict with 'sequence', 'ik_solutions' ((N, 6) joint angles) and
+            'ik_converged' ((N,) mask)
+        """
+        # Flag points outside the arm's workspace so IK never spends its
+        # iteration budget on them
+        targets = self._ik_targets(sequence)
+        reachable = self.get_reachability_map().is_reachable_batch(targets[:, :3], targets[:, 3:])
+        for point, ok in zip(sequence, reachable):
+            point["reachable"] = bool(ok)
+        if not reachable.all():
+            print(f"{int((~reachable).sum())} of {len(reachable)} inspection points are outside the arm's workspace")
+        
+        # Solve IK for every reachable point at once so execute_step
+        # only has to command joints
+        solutions = np.tile(self.arm.joint_angles, (len(targets), 1))
+        converged = np.zeros(len(targets), dtype=bool)
+        if reachable.any():
+            solutions[reachable], converged[reachable] = \
+                self.arm_controller.solve_poses(targets[reachable])
+        return {"sequence": sequence, "ik_solutions": solutions, "ik_converged": converged}
+        
     def start_inspection(self, part_type: str, inspection_type: str) -> bool:
         """
         Start a new inspection sequence.
@@ -116,35 +286,13 @@ class InspectionService:
                 print("Safety check failed - cannot start inspection")
                 return False
                 
-            # Validate part type and inspection type
-            if part_type not in self.config:
-                raise ValueError(f"Unknown part type: {part_type}")
-                
-            if inspection_type not in self.config[part_type]["inspection_types"]:
-                raise ValueError(f"Invalid inspection type {inspection_type} for part {part_type}")
-            
-            # Get part dimensions
-            part_dimensions = self.config[part_type]["dimensions"]
-            
-            # Calculate inspection points based on part dimensions and camera specs
-            inspection_points = calculate_inspection_grid(part_dimensions, CAMERA_CONFIG)
-            
-            # Filter inspection points based on inspection type
-            if inspection_type == "scratches_small":
-                # For small scratches, we need high-resolution top views
-                self.inspection_sequence = [p for p in inspection_points if p["type"] == "top_view"]
-            elif inspection_type == "scratches_large":
-                # For large scratches, we can use fewer points with wider spacing
-                self.inspection_sequence = [p for p in inspection_points if p["type"] in ["top_view", "front_view", "back_view"]]
-            elif inspection_type == "fingerprints":
-                # For fingerprints, we need good lighting angles
-                self.inspection_sequence = [p for p in inspection_points if p["type"] in ["front_view", "back_view"]]
-            elif inspection_type == "surface_quality":
-                # For surface quality, we need comprehensive coverage
-                self.inspection_sequence = inspection_points
-            elif inspection_type == "edge_quality":
-                # For edge quality, we focus on the edges
-                self.inspection_sequence = [p for p in inspection_points if p["type"] in ["front_view", "back_view"]]
+            plan = self.plan_inspection(part_type, inspection_type)
+            self.inspection_sequence = plan["sequence"]
+            self.ik_solutions = plan["ik_solutions"]
+            self.ik_converged = plan["ik_converged"]
+            self.sequence_report = plan["sequence_report"]
+            self._ik_sequence = self.inspection_sequence
+            self.active_plan = None
             
             print(f"Starting inspection for part: {part_type}, type: {inspection_type}")
             print(f"Inspection sequence created with {len(self.inspection_sequence)} steps")
@@ -159,6 +307,60 @@ class InspectionService:
             print(f"Error starting inspection: {str(e)}")
             return False
         
+    def start_planned_inspection(self, plan) -> bool:
+        """
+        Start an inspection from a compiled plan.
+        
+        The plan's order, joint solutions and trajectories are used as they
+        are: executing its steps does no grid layout, IK or motion planning.
+        A plan whose fingerprint no longer matches the part configuration,
+        camera configuration, arm kinematics or motion limits is rejected;
+        recompile it with PlanCompiler.
+        
+        Args:
+            plan: InspectionPlan or path to a plan file written by
+                InspectionPlan.save
+            
+        Returns:
+            bool: True if inspection started successfully
+        """
+        try:
+            if not self.arm_controller.check_safety_status():
+                print("Safety check failed - cannot start inspection")
+                return False
+                
+            if not isinstance(plan, InspectionPlan):
+                plan = InspectionPlan.load(plan)
+                if plan is None:
+                    print("Inspection plan not found or in an unsupported format")
+                    return False
+                    
+            expected = plan_fingerprint(self, plan.part_type, plan.inspection_type, plan.camera_config)
+            if plan.fingerprint != expected:
+                print("Inspection plan was compiled for a different part, camera or arm "
+                      "configuration - recompile it before running")
+                return False
+            
+            self.active_plan = plan
+            self.inspection_sequence = plan.sequence
+            self.ik_solutions = plan.ik_solutions
+            self.ik_converged = plan.ik_converged
+            self.sequence_report = None
+            self._ik_sequence = self.inspection_sequence
+            
+            print(f"Starting planned inspection for part: {plan.part_type}, type: {plan.inspection_type}")
+            print(f"Inspection sequence loaded with {len(plan)} steps, "
+                  f"expected duration {plan.total_time:.2f} s")
+            
+            self.current_step = 0
+            self.results = []
+            self.inspection_type = plan.inspection_type
+            return True
+            
+        except Exception as e:
+            print(f"Error starting planned inspection: {str(e)}")
+            return False
+        
     def execute_step(self) -> bool:
         """
         Execute the current inspection step.
@@ -194,7 +396,7 @@ class InspectionService:
             
             # Move arm to inspection position
             print(f"Moving arm to position: {step['position']}, orientation: {step['orientation']}")
-            if not self.arm_controller.move_to_pose(step["position"], step["orientation"]):
+            if not self._move_to_step(self.current_step, step):
                 print(f"Failed to move arm to position for step {self.current_step}")
                 return False
                 
@@ -212,12 +414,15 @@ class InspectionService:
             # Analyze image
             print("Analyzing image...")
             result = self._analyze_image(image, self.inspection_type)
+            # The frame buffer goes back to the camera's pool once analyzed
+            self.camera_controller.release_image(image[0])
             
             # Store result
             self.results.append({
                 "step": self.current_step,
                 "type": step["type"],
-                "result": result
+                "result": result,
+                "timestamp": self.clock.time()
             })
             
             # Move to next step
@@ -229,6 +434,90 @@ class InspectionService:
             print(f"Error executing step: {str(e)}")
             return False
         
+    def get_reachability_map(self) -> ReachabilityMap:
+        """
+        Get the arm's reachability map, loading or building it on first use.
+        
+        Returns:
+            ReachabilityMap matching the current arm kinematics
+        """
+        if (self._reachability_map is None or
+                self._reachability_map.fingerprint != ReachabilityMap.arm_fingerprint(self.arm)):
+            self._reachability_map = ReachabilityMap.load_or_build(self.reachability_map_path, self.arm)
+        return self._reachability_map
+        
+    def _ik_targets(self, points: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Build IK targets for inspection points.
+        
+        Args:
+            points: Inspection points with position (mm) and orientation
+            
+        Returns:
+            (N, 6) array of [x, y, z, rx, ry, rz] with positions in metres
+        """
+        return np.array([
+            [*(np.asarray(p["position"], dtype=float) * MM_TO_M), *p["orientation"]]
+            for p in points
+        ], dtype=float).reshape(-1, 6)
+        
+    def _optimize_step_order(self, plan: Dict[str, Any]):
+        """
+        Reorder a plan's sequence to minimize joint-space travel time.
+        
+        Points with an IK solution are ordered by the sequence optimizer,
+        starting from the current joint angles; points without one keep
+        their relative order at the end. The IK solutions are permuted
+        with the sequence.
+        
+        Args:
+            plan: Plan from plan_inspection, updated in place
+        """
+        converged = plan["ik_converged"]
+        solved = np.flatnonzero(converged)
+        report = optimize_sequence(plan["ik_solutions"][solved], self.arm.max_joint_velocity,
+                                   self.arm.max_joint_acceleration, start=self.arm.joint_angles)
+        order = np.concatenate([solved[report["order"]], np.flatnonzero(~converged)])
+        plan["sequence"] = [plan["sequence"][i] for i in order]
+        plan["ik_solutions"] = plan["ik_solutions"][order]
+        plan["ik_converged"] = converged[order]
+        plan["sequence_report"] = report
+        print(f"Sequence optimized: travel time {report['naive_travel_time']:.2f} s "
+              f"-> {report['travel_time']:.2f} s")
+        
+    def _move_to_step(self, index: int, step: Dict[str, Any]) -> bool:
+        """
+        Move the arm to an inspection point.
+        
+        Uses the joint solution precomputed by start_inspection when it
+        belongs to the active sequence; otherwise solves this pose alone.
+        
+        Args:
+            index: Index of the step in the inspection sequence
+            step: Inspection point data
+            
+        Returns:
+            bool: True if the arm reached the point
+        """
+        if self.ik_solutions is not None and self._ik_sequence is self.inspection_sequence:
+            if not step.get("reachable", True):
+                print(f"Step {index} is outside the arm's workspace")
+                return False
+            if not self.ik_converged[index]:
+                print(f"No inverse kinematics solution for step {index}")
+                return False
+            if self.active_plan is not None:
+                trajectory = self.active_plan.trajectories[index]
+                if trajectory is not None and np.allclose(
+                        self.arm.joint_angles, trajectory.start, atol=1e-5):
+                    return self.arm_controller.execute_trajectory(
+                        trajectory, goal=self.ik_solutions[index])
+                # Off the compiled path (e.g. a step was retried or skipped)
+                print(f"Arm is off the compiled path at step {index}; replanning the move")
+            return self.arm_controller.move_to_joint_angles(list(self.ik_solutions[index]))
+        target = self._ik_targets([step])[0]
+        return self.arm_controller.move_to_pose(list(target[:3]), list(target[3:]))
+        
     def get_inspection_status(self) -> Dict:
         """
         Get current inspection status.
@@ -247,6 +536,11 @@ class InspectionService:
         """Stop the current inspection sequence."""
         self.inspection_sequence = None
         self.current_step = 0
+        self.ik_solutions = None
+        self.ik_converged = None
+        self._ik_sequence = None
+        self.sequence_report = None
+        self.active_plan = None
         
     def _analyze_image(self, image: np.ndarray, inspection_type: str) -> Dict:
         """
@@ -0,0 +1,154 @@
+import copy
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+import numpy as np
+
+from app.models.reachability_map import ReachabilityMap
+
+
+def grid_key(dimensions: Dict[str, Any], camera_config: Dict[str, Any]) -> str:
+    """
+    Cache key of an inspection grid.
+
+    Args:
+        dimensions: Part dimensions (mm)
+        camera_config: Camera configuration the grid is laid out with
+
+    Returns:
+        Hex digest
+    """
+    return PlanCache.key("grid", dimensions, camera_config)
+
+
+def ik_key(dimensions: Dict[str, Any], camera_config: Dict[str, Any],
+           inspection_type: str, arm) -> str:
+    """
+    Cache key of the IK results for an inspection.
+
+    Includes the arm's fingerprint, so editing the DH parameters or joint
+    limits makes every earlier entry miss.
+
+    Args:
+        dimensions: Part dimensions (mm)
+        camera_config: Camera configuration the grid is laid out with
+        inspection_type: Type of inspection to perform
+        arm: RoboticArm the poses are solved for
+
+    Returns:
+        Hex digest
+    """
+    return PlanCache.key("ik", dimensions, camera_config, inspection_type,
+                         ReachabilityMap.arm_fingerprint(arm))
+
+
+class PlanCache:
+    """
+    Content-addressed cache of planning results.
+
+    Entries are dicts of JSON-serializable values and numpy arrays, stored
+    under the SHA-256 of their inputs. The most recently used entries are
+    kept in memory; every entry is also written to one .npz file per key
+    in the cache directory, so a restarted service starts warm. Since keys
+    are hashes of the inputs, a changed configuration simply misses and
+    stale entries are never returned.
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None, max_entries: int = 64):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Where entries are persisted; None keeps them in
+                memory only
+            max_entries: Entries held in memory before the least recently
+                used one is dropped
+        """
+        self.directory = Path(directory) if directory is not None else None
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries or (self._path(key) is not None and self._path(key).exists())
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """SHA-256 of the JSON encoding of parts (dict keys sorted)."""
+        payload = json.dumps(parts, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> Optional[Path]:
+        return self.directory / f"{key}.npz" if self.directory is not None else None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an entry.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            A copy of the entry (safe to modify), or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return copy.deepcopy(entry)
+        entry = self._load(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["disk_hits"] += 1
+        self._remember(key, entry)
+        return copy.deepcopy(entry)
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store an entry in memory and, if a directory is set, on disk.
+
+        Args:
+            key: Entry key
+            entry: dict of JSON-serializable values and numpy arrays
+        """
+        entry = copy.deepcopy(entry)
+        self._remember(key, entry)
+        if self.directory is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        arrays = {k: v for k, v in entry.items() if isinstance(v, np.ndarray)}
+        values = {k: v for k, v in entry.items() if not isinstance(v, np.ndarray)}
+        # Write next to the target and rename, so readers never see a partial file.
+        tmp = self._path(key).with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            np.savez_compressed(f, __values__=json.dumps(values), **arrays)
+        tmp.replace(self._path(key))
+
+    def clear(self) -> None:
+        """Drop the in-memory entries (files on disk are kept)."""
+        self._entries.clear()
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                entry = json.loads(str(data["__values__"]))
+                entry.update({k: data[k] for k in data.files if k != "__values__"})
+            return entry
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Ignoring unreadable plan cache entry {path.name}: {str(e)}")
+            return None
@@ -0,0 +1,249 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+import numpy as np
+
+from app.config.camera_config import CAMERA_CONFIG
+from app.models.motion_planner import MotionPlanner
+from app.models.reachability_map import ReachabilityMap
+from app.models.trajectory import SampledTrajectory
+from app.services.cycle_time_estimator import CycleTimeEstimator
+
+# Format version written into plan files; bump when the layout changes.
+PLAN_FORMAT_VERSION = 1
+
+
+def plan_fingerprint(service, part_type: str, inspection_type: str,
+                     camera_config: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Stable hash of everything a compiled plan depends on.
+
+    Covers the part dimensions, camera configuration and inspection type,
+    the arm's kinematics, joint and motion limits, and the controller's
+    motion profile, so a plan is stale exactly when one of them changes.
+
+    Args:
+        service: InspectionService holding the configuration and arm
+        part_type: Type of part to inspect
+        inspection_type: Type of inspection to perform
+        camera_config: Camera configuration (defaults to CAMERA_CONFIG)
+
+    Returns:
+        Hex digest
+    """
+    arm = service.arm
+    payload = json.dumps({
+        "format": PLAN_FORMAT_VERSION,
+        "dimensions": service.config.get(part_type, {}).get("dimensions"),
+        "camera_config": CAMERA_CONFIG if camera_config is None else camera_config,
+        "inspection_type": inspection_type,
+        "arm": ReachabilityMap.arm_fingerprint(arm),
+        "max_joint_velocity": [float(v) for v in arm.max_joint_velocity],
+        "max_joint_acceleration": [float(v) for v in arm.max_joint_acceleration],
+        "max_joint_jerk": [float(v) for v in arm.max_joint_jerk],
+        "motion_profile": service.arm_controller.motion_profile,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class InspectionPlan:
+    """
+    Compiled inspection: everything needed to run it without solving.
+
+    Holds the ordered inspection points, their IK solutions, one sampled
+    trajectory per step (None where the step cannot be reached) and the
+    expected per-step motion, capture and analysis times. Plans are saved
+    as compressed .npz files: the per-step trajectories are packed into
+    flat sample arrays with offsets, and the metadata is JSON.
+    """
+
+    def __init__(self, part_type: str, inspection_type: str, camera_config: Dict[str, Any],
+                 sequence: List[Dict[str, Any]], start: np.ndarray,
+                 ik_solutions: np.ndarray, ik_converged: np.ndarray,
+                 trajectories: List[Optional[SampledTrajectory]],
+                 timing: Dict[str, np.ndarray], fingerprint: str = ""):
+        """
+        Assemble a plan.
+
+        Args:
+            part_type: Type of part to inspect
+            inspection_type: Type of inspection to perform
+            camera_config: Camera configuration the grid was laid out with
+            sequence: Inspection points in execution order
+            start: Joint angles the first move starts from
+            ik_solutions: (N, 6) joint angles per step
+            ik_converged: (N,) mask of steps with a solution
+            trajectories: Per-step move into the step, or None
+            timing: 'motion', 'capture' and 'analysis' arrays of (N,) seconds
+            fingerprint: plan_fingerprint() of the inputs
+        """
+        self.part_type = part_type
+        self.inspection_type = inspection_type
+        self.camera_config = camera_config
+        self.sequence = sequence
+        self.start = np.asarray(start, dtype=float)
+        self.ik_solutions = np.asarray(ik_solutions, dtype=float)
+        self.ik_converged = np.asarray(ik_converged, dtype=bool)
+        self.trajectories = trajectories
+        self.timing = {key: np.asarray(value, dtype=float) for key, value in timing.items()}
+        self.fingerprint = fingerprint
+
+    def __len__(self) -> int:
+        return len(self.sequence)
+
+    @property
+    def total_time(self) -> float:
+        """Expected duration of the whole inspection in seconds."""
+        return float(sum(values.sum() for values in self.timing.values()))
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the plan to a compressed .npz file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lengths = [0 if t is None else len(t.times) for t in self.trajectories]
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        present = [t for t in self.trajectories if t is not None]
+        n_joints = self.ik_solutions.shape[1] if self.ik_solutions.ndim == 2 else 6
+        metadata = {
+            "version": PLAN_FORMAT_VERSION,
+            "part_type": self.part_type,
+            "inspection_type": self.inspection_type,
+            "camera_config": self.camera_config,
+            "sequence": self.sequence,
+            "has_trajectory": [t is not None for t in self.trajectories],
+            "fingerprint": self.fingerprint,
+        }
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                metadata=json.dumps(metadata),
+                start=self.start,
+                ik_solutions=self.ik_solutions,
+                ik_converged=self.ik_converged,
+                trajectory_offsets=offsets,
+                trajectory_times=np.concatenate([t.times for t in present]) if present else np.zeros(0),
+                trajectory_positions=(np.concatenate([t.positions for t in present]).astype(np.float32)
+                                      if present else np.zeros((0, n_joints), dtype=np.float32)),
+                **{f"timing_{key}": value for key, value in self.timing.items()},
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Optional["InspectionPlan"]:
+        """
+        Read a plan written by save().
+
+        Args:
+            path: File to read
+
+        Returns:
+            InspectionPlan, or None if the file is missing or was written
+            in another format version
+        """
+        path = Path(path)
+        if not path.exists():
+            return None
+        with np.load(path) as data:
+            metadata = json.loads(str(data["metadata"]))
+            if metadata.get("version") != PLAN_FORMAT_VERSION:
+                return None
+            offsets = data["trajectory_offsets"]
+            times = data["trajectory_times"]
+            positions = data["trajectory_positions"].astype(float)
+            trajectories = [
+                SampledTrajectory(times[lo:hi], positions[lo:hi]) if present else None
+                for present, lo, hi in zip(metadata["has_trajectory"], offsets[:-1], offsets[1:])
+            ]
+            timing = {key[len("timing_"):]: data[key] for key in data.files if key.startswith("timing_")}
+            return cls(metadata["part_type"], metadata["inspection_type"], metadata["camera_config"],
+                       metadata["sequence"], data["start"], data["ik_solutions"],
+                       data["ik_converged"], trajectories, timing, metadata["fingerprint"])
+
+
+class PlanCompiler:
+    """
+    Compiles (part type, inspection type, camera config) into an InspectionPlan.
+
+    Runs the service's planning (grid, reachability, batch IK and sequence
+    ordering) and then plans every move from the previous solved step: the
+    straight joint-space move when it is clear, otherwise a path from the
+    motion planner timed with the time-optimal parameterization. Moves
+    are sampled at the control period, and the expected timing adds the
+    cycle-time model's capture and analysis times.
+    """
+
+    def __init__(self, service, dt: float = 0.01, planning_time_budget: float = 1.0):
+        """
+        Initialize the compiler.
+
+        Args:
+            service: InspectionService whose configuration, arm and
+                controller are used
+            dt: Sample period of the stored trajectories (seconds)
+            planning_time_budget: Time budget per move for the motion
+                planner, when a collision checker is configured
+        """
+        self.service = service
+        self.dt = dt
+        self.planning_time_budget = planning_time_budget
+
+    def _plan_move(self, start: np.ndarray, goal: np.ndarray):
+        """Trajectory from start to goal, or None if no clear move exists."""
+        controller = self.service.arm_controller
+        trajectory = controller.plan_joint_motion(goal, start=start)
+        if controller.trajectory_is_clear(trajectory):
+            return trajectory
+        if controller.motion_planner is None:
+            controller.motion_planner = MotionPlanner(self.service.arm, controller.collision_checker)
+        path, _ = controller.motion_planner.plan(start, goal, time_budget=self.planning_time_budget)
+        if path is None:
+            return None
+        trajectory = controller.plan_path_motion(path)
+        return trajectory if controller.trajectory_is_clear(trajectory) else None
+
+    def compile(self, part_type: str, inspection_type: str,
+                camera_config: Optional[Dict[str, Any]] = None) -> InspectionPlan:
+        """
+        Compile a plan.
+
+        Args:
+            part_type: Type of part to inspect
+            inspection_type: Type of inspection to perform
+            camera_config: Camera configuration (defaults to CAMERA_CONFIG)
+
+        Returns:
+            InspectionPlan starting from the arm's current joint angles
+
+        Raises:
+            ValueError: If the part or inspection type is unknown
+        """
+        camera_config = CAMERA_CONFIG if camera_config is None else camera_config
+        plan = self.service.plan_inspection(part_type, inspection_type, camera_config)
+        start = self.service.arm.joint_angles.copy()
+        estimator = CycleTimeEstimator(self.service)
+        capture = estimator.capture_time()
+        analysis = estimator.analysis_time(inspection_type)
+
+        n = len(plan["sequence"])
+        converged = plan["ik_converged"].copy()
+        trajectories: List[Optional[SampledTrajectory]] = []
+        current = start
+        for i in range(n):
+            trajectory = None
+            if converged[i]:
+                move = self._plan_move(current, plan["ik_solutions"][i])
+                if move is None:
+                    converged[i] = False
+                else:
+                    trajectory = SampledTrajectory.from_trajectory(move, self.dt)
+                    current = plan["ik_solutions"][i]
+            trajectories.append(trajectory)
+
+        timing = {
+            "motion": np.array([0.0 if t is None else t.duration for t in trajectories]),
+            "capture": np.where(converged, capture, 0.0),
+            "analysis": np.where(converged, analysis, 0.0),
+        }
+        return InspectionPlan(part_type, inspection_type, camera_config, plan["sequence"], start,
+                              plan["ik_solutions"], converged, trajectories, timing,
+                              plan_fingerprint(self.service, part_type, inspection_type, camera_config))
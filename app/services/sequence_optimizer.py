@@ -0,0 +1,193 @@
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+from app.models.trajectory import synchronized_move_durations
+
+
+def travel_time_matrix(configurations: np.ndarray, max_velocity: np.ndarray,
+                       max_acceleration: np.ndarray) -> np.ndarray:
+    """
+    Pairwise move times between joint configurations.
+
+    Args:
+        configurations: (N, n_joints) joint angles (radians)
+        max_velocity: Per-joint velocity limits (rad/s)
+        max_acceleration: Per-joint acceleration limits (rad/s^2)
+
+    Returns:
+        (N, N) matrix whose entry [i, j] is the synchronized trapezoidal
+        move time from configuration i to configuration j (seconds)
+    """
+    Q = np.atleast_2d(np.asarray(configurations, dtype=float))
+    return synchronized_move_durations(Q[None, :, :] - Q[:, None, :],
+                                       max_velocity, max_acceleration)
+
+
+def tour_cost(tour: List[int], cost: np.ndarray) -> float:
+    """Total cost of visiting the nodes in order, without returning."""
+    tour = np.asarray(tour)
+    return float(cost[tour[:-1], tour[1:]].sum())
+
+
+def nearest_neighbor_tour(cost: np.ndarray, start: int = 0) -> List[int]:
+    """
+    Greedy tour: always move to the cheapest unvisited node.
+
+    Args:
+        cost: (N, N) cost matrix
+        start: Node the tour starts from
+
+    Returns:
+        List of all N node indices starting with start
+    """
+    n = len(cost)
+    visited = np.zeros(n, dtype=bool)
+    tour = [start]
+    visited[start] = True
+    for _ in range(n - 1):
+        row = np.where(visited, np.inf, cost[tour[-1]])
+        nxt = int(np.argmin(row))
+        tour.append(nxt)
+        visited[nxt] = True
+    return tour
+
+
+def two_opt(tour: List[int], cost: np.ndarray, max_passes: int = 100) -> List[int]:
+    """
+    Improve an open tour by reversing segments (2-opt).
+
+    The first node stays fixed. Reversing tour[i:j + 1] replaces the edges
+    into tour[i] and out of tour[j]; all candidate j for a given i are
+    scored at once and the best improving move is applied. The cost
+    matrix must be symmetric for the reversed interior to keep its cost.
+
+    Args:
+        tour: Node order; tour[0] is the fixed start
+        cost: (N, N) symmetric cost matrix
+        max_passes: Upper bound on full sweeps over i
+
+    Returns:
+        Improved node order
+    """
+    tour = np.array(tour)
+    n = len(tour)
+    for _ in range(max_passes):
+        improved = False
+        for i in range(1, n - 1):
+            j = np.arange(i + 1, n)
+            a, b = tour[i - 1], tour[i]
+            c = tour[j]
+            # Past the last node there is no outgoing edge to replace.
+            d = tour[np.minimum(j + 1, n - 1)]
+            tail = j < n - 1
+            delta = (cost[a, c] - cost[a, b] +
+                     np.where(tail, cost[b, d] - cost[c, d], 0.0))
+            best = int(np.argmin(delta))
+            if delta[best] < -1e-12:
+                tour[i:j[best] + 1] = tour[i:j[best] + 1][::-1]
+                improved = True
+        if not improved:
+            break
+    return tour.tolist()
+
+
+def or_opt(tour: List[int], cost: np.ndarray, max_segment: int = 3,
+           max_passes: int = 100) -> List[int]:
+    """
+    Improve an open tour by relocating short segments (Or-opt).
+
+    Segments of 1 to max_segment consecutive nodes are cut out and
+    reinserted, in their original direction, at the cheapest other
+    position; every insertion point for a segment is scored at once.
+
+    Args:
+        tour: Node order; tour[0] is the fixed start
+        cost: (N, N) cost matrix
+        max_segment: Longest segment to relocate
+        max_passes: Upper bound on full sweeps
+
+    Returns:
+        Improved node order
+    """
+    tour = list(tour)
+    n = len(tour)
+    for _ in range(max_passes):
+        improved = False
+        for length in range(1, max_segment + 1):
+            i = 1
+            while i + length <= n:
+                segment = tour[i:i + length]
+                rest = tour[:i] + tour[i + length:]
+                first, last = segment[0], segment[-1]
+                prev = tour[i - 1]
+                nxt = tour[i + length] if i + length < n else None
+                removed = cost[prev, first] + (cost[last, nxt] - cost[prev, nxt] if nxt is not None else 0.0)
+
+                # Insert after rest[k]: edges (rest[k], first) and (last, rest[k + 1]).
+                rest_arr = np.array(rest)
+                u = rest_arr
+                v = np.append(rest_arr[1:], -1)
+                has_next = v >= 0
+                v_safe = np.where(has_next, v, 0)
+                added = cost[u, first] + np.where(has_next, cost[last, v_safe] - cost[u, v_safe], 0.0)
+                added[i - 1] = np.inf  # the original position
+                k = int(np.argmin(added))
+                if added[k] < removed - 1e-12:
+                    tour = rest[:k + 1] + segment + rest[k + 1:]
+                    improved = True
+                else:
+                    i += 1
+        if not improved:
+            break
+    return tour
+
+
+def optimize_sequence(configurations: np.ndarray, max_velocity: np.ndarray,
+                      max_acceleration: np.ndarray,
+                      start: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    """
+    Order joint configurations to minimize total move time.
+
+    Builds the travel-time matrix (including the start configuration),
+    seeds a tour with nearest neighbor and alternates 2-opt and Or-opt
+    until neither improves it.
+
+    Args:
+        configurations: (N, n_joints) joint angles to visit (radians)
+        max_velocity: Per-joint velocity limits (rad/s)
+        max_acceleration: Per-joint acceleration limits (rad/s^2)
+        start: Joint angles the arm starts from; if omitted the tour
+            starts at the first configuration
+
+    Returns:
+        dict with 'order' (indices into configurations), 'travel_time'
+        and 'naive_travel_time' (seconds, for the optimized and the
+        given order)
+    """
+    Q = np.atleast_2d(np.asarray(configurations, dtype=float))
+    n = len(Q)
+    if n == 0:
+        return {"order": [], "travel_time": 0.0, "naive_travel_time": 0.0}
+    if start is not None:
+        Q = np.vstack([np.asarray(start, dtype=float), Q])
+    cost = travel_time_matrix(Q, max_velocity, max_acceleration)
+    naive = list(range(len(Q)))
+
+    tour = nearest_neighbor_tour(cost)
+    best = tour_cost(tour, cost)
+    while True:
+        tour = or_opt(two_opt(tour, cost), cost)
+        current = tour_cost(tour, cost)
+        if current >= best - 1e-12:
+            break
+        best = current
+    # Local search can, rarely, end above the given order.
+    if tour_cost(naive, cost) < best:
+        tour, best = naive, tour_cost(naive, cost)
+
+    offset = 1 if start is not None else 0
+    return {
+        "order": [node - offset for node in tour[offset:]],
+        "travel_time": best,
+        "naive_travel_time": tour_cost(naive, cost),
+    }
@@ -0,0 +1,73 @@
+import time
+from abc import ABC, abstractmethod
+
+
+class Clock(ABC):
+    """
+    Source of time shared by the simulation components.
+
+    Everything that timestamps events or measures elapsed time reads it
+    from an injected clock instead of calling time.time() directly, so the
+    same code runs against the wall clock or against simulated time.
+    """
+
+    @abstractmethod
+    def time(self) -> float:
+        """Current time in seconds."""
+
+    @abstractmethod
+    def sleep(self, seconds: float):
+        """Wait for the given number of seconds."""
+
+    @abstractmethod
+    def advance(self, seconds: float):
+        """
+        Account for simulated work that took the given number of seconds,
+        such as a control step or an arm move.
+        """
+
+
+class RealClock(Clock):
+    """Wall-clock time. Simulated work takes no extra time."""
+
+    def time(self) -> float:
+        return time.time()
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def advance(self, seconds: float):
+        # Real time passes on its own.
+        pass
+
+
+class VirtualClock(Clock):
+    """
+    Simulated time that only moves when the simulation advances it.
+
+    Control steps and moves advance the clock by their simulated duration
+    and sleep() returns immediately, so a full shift runs as fast as the
+    computation allows while every timestamp stays consistent with the
+    simulated motion.
+    """
+
+    def __init__(self, start: float = 0.0):
+        """
+        Initialize the virtual clock.
+
+        Args:
+            start: Initial time in seconds
+        """
+        self._now = float(start)
+
+    def time(self) -> float:
+        return self._now
+
+    def sleep(self, seconds: float):
+        self.advance(seconds)
+
+    def advance(self, seconds: float):
+        if seconds < 0:
+            raise ValueError("Cannot move a clock backwards")
+        self._now += float(seconds)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Compare the IK solvers on a fixed set of reachable poses.
+
+Each solver starts from the home position (closed-form IK and the seed
+index are bypassed) and is scored on success rate, FK and Jacobian
+evaluations per solve, and wall-clock time per solve. The batch solver
+is then timed on the same poses, with and without closed-form IK.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import numpy as np
+from app.models.robotic_arm import RoboticArm
+
+
+def standard_pose_set(arm: RoboticArm, count: int = 200, seed: int = 0) -> np.ndarray:
+    """(count, 6) [x, y, z, roll, pitch, yaw] poses from FK over half the joint ranges."""
+    rng = np.random.default_rng(seed)
+    lo = np.array([l for l, _ in arm.joint_limits]) / 2
+    hi = np.array([h for _, h in arm.joint_limits]) / 2
+    poses = arm.forward_kinematics_batch(rng.uniform(lo, hi, size=(count, 6)))
+    return np.array([np.concatenate([T[:3, 3], arm._matrix_to_rpy(T)]) for T in poses])
+
+
+def run_dls(arm, target):
+    _, ok, iterations, _ = arm._dls_solve(target[:3], target[3:], np.zeros(6),
+                                          max_iterations=200, tolerance=1e-3, damping=0.05)
+    # One FK pass per iteration plus the final check; the Jacobian reuses it.
+    return ok, iterations + 1, iterations
+
+
+def run_lm(arm, target):
+    _, stats = arm.calculate_inverse_kinematics_lm(target[:3], target[3:], seed=np.zeros(6))
+    return stats["converged"], stats["fk_evaluations"], stats["jacobian_evaluations"]
+
+
+def main():
+    arm = RoboticArm()
+    targets = standard_pose_set(arm)
+    solvers = [
+        ("DLS (fixed damping)", run_dls),
+        ("LM (adaptive damping)", run_lm),
+    ]
+    print(f"{len(targets)} poses, seeded from home")
+    print(f"{'solver':<26}{'success':>9}{'FK mean':>9}{'FK med':>8}{'Jac mean':>10}{'ms/solve':>10}")
+    for name, solve in solvers:
+        results = []
+        start = time.perf_counter()
+        for target in targets:
+            results.append(solve(arm, target))
+        elapsed = time.perf_counter() - start
+        ok, fk, jac = (np.array(col) for col in zip(*results))
+        print(f"{name:<26}{ok.mean():>9.1%}{fk.mean():>9.1f}{np.median(fk):>8.1f}"
+              f"{jac.mean():>10.1f}{1000 * elapsed / len(targets):>10.2f}")
+
+    print(f"\n{'batch solver':<26}{'success':>9}{'ms total':>10}")
+    for name, options in [("closed form + DLS", {}),
+                          ("DLS only", {"use_analytic": False})]:
+        batch_arm = RoboticArm()
+        start = time.perf_counter()
+        _, converged = batch_arm.calculate_inverse_kinematics_batch(
+            targets, use_seed_index=False, **options)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<26}{converged.mean():>9.1%}{1000 * elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
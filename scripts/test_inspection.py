@@ -8,12 +8,20 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.services.inspection_service import InspectionService
-import time
+from app.utils.clock import RealClock, VirtualClock
+import argparse
 
-def simulate_inspection():
-    """Simulate a complete inspection process."""
+def simulate_inspection(real_time: bool = False):
+    """
+    Simulate a complete inspection process.
+
+    Args:
+        real_time: Run against the wall clock instead of simulated time
+    """
     # Initialize the inspection service
-    service = InspectionService()
+    clock = RealClock() if real_time else VirtualClock()
+    service = InspectionService(clock=clock)
+    start_time = clock.time()
     
     # Start inspection for a small part with scratches inspection
     print("\n=== Starting Inspection ===")
@@ -51,11 +59,12 @@ def simulate_inspection():
             break
             
         # Add a small delay to simulate real inspection time
-        time.sleep(1)
+        service.clock.sleep(1)
     
     # Print final results
     print("\n=== Inspection Complete ===")
     print(f"Total steps executed: {len(service.results)}")
+    print(f"Elapsed {'wall-clock' if real_time else 'simulated'} time: {clock.time() - start_time:.1f} s")
     print("\nResults summary:")
     for result in service.results:
         print(f"\nStep {result['step'] + 1}:")
@@ -66,4 +75,7 @@ def simulate_inspection():
             print(f"  Defects found: {result['result']['defects']}")
 
 if __name__ == "__main__":
-    simulate_inspection() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--real-time", action="store_true",
+                        help="pace the simulation with the wall clock")
+    simulate_inspection(parser.parse_args().real_time)
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from app.controllers.camera_controller import CameraController
+from app.models.camera import Camera
+
+SCENES = [
+    {"type": "color_check"},
+    {"type": "text_reading", "expected_text": "A1"},
+    {"type": "shape_detection", "seed": 3},
+    {"type": "color_check"},
+    {"type": "shape_detection", "seed": 4},
+]
+
+
+def _camera():
+    camera = Camera(resolution=(640, 480), noise_seed=0)
+    camera.noise.read_noise = 0.0
+    return camera
+
+
+def test_batch_matches_single_captures():
+    poses = np.zeros((len(SCENES), 6))
+    frames, results = CameraController(_camera()).capture_batch(poses, SCENES)
+    assert frames.shape == (len(SCENES), 480, 640, 3) and frames.flags.c_contiguous
+    assert len(results) == len(SCENES)
+
+    single = _camera()
+    for frame, scene in zip(frames, SCENES):
+        image, _ = single.capture_image(np.zeros(3), np.zeros(3), scene)
+        np.testing.assert_array_equal(frame, image)
+        single.release_frame(image)
+
+
+def test_threaded_drawing_and_preallocated_output():
+    camera = _camera()
+    out = np.empty((len(SCENES), 480, 640, 3), dtype=np.uint8)
+    frames, _ = camera.capture_batch(np.zeros((len(SCENES), 6)), SCENES, out=out, workers=4)
+    assert frames is out
+    serial, _ = _camera().capture_batch(np.zeros((len(SCENES), 6)), SCENES)
+    np.testing.assert_array_equal(frames, serial)
+    # The repeated color check is drawn once.
+    assert len(camera.render_cache) == 4
+
+    with pytest.raises(ValueError):
+        camera.capture_batch(np.zeros((2, 6)), SCENES[:2], out=out)
+
+
+def test_each_frame_gets_its_own_noise():
+    camera = Camera(resolution=(64, 48), noise_seed=0)
+    frames, _ = camera.capture_batch(np.zeros((2, 6)), [{"type": "color_check"}] * 2)
+    assert not np.array_equal(frames[0], frames[1])
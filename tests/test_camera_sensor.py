@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from app.controllers.camera_controller import CameraController
+from app.models.camera import Camera
+
+GRAY = {"type": "color_check", "expected_colors": [(100, 100, 100)] * 4}
+
+
+def _capture(camera, scene=GRAY):
+    image, _ = camera.capture_image(np.zeros(3), np.zeros(3), scene)
+    frame = image.astype(float)
+    camera.release_frame(image)
+    return frame
+
+
+def _quiet_camera():
+    camera = Camera(resolution=(64, 48), noise_seed=0)
+    camera.noise.read_noise = 0.0
+    return camera
+
+
+def test_default_settings_leave_the_scene_unchanged():
+    camera = _quiet_camera()
+    assert camera.sensor_lut() is None
+    assert _capture(camera)[0, 0, 0] == 100
+
+
+def test_exposure_gain_black_level_and_gamma():
+    camera = _quiet_camera()
+    camera.set_exposure(20.0)
+    assert _capture(camera)[0, 0, 0] == 200
+    camera.set_gain(2.0)
+    assert _capture(camera)[0, 0, 0] == 255  # clipped at full scale
+    camera.set_exposure(10.0)
+    camera.set_gain(1.0)
+    camera.black_level = 16
+    assert _capture(camera)[0, 0, 0] == round(16 + 239 * 100 / 255)
+    camera.black_level = 0
+    camera.gamma = 2.2
+    assert _capture(camera)[0, 0, 0] == round(255 * (100 / 255) ** (1 / 2.2))
+    # Dark parts of the scene stay at the black level.
+    assert _capture(camera)[-1, -1, 0] == 0
+
+    with pytest.raises(ValueError):
+        camera.set_exposure(-1.0)
+    with pytest.raises(ValueError):
+        camera.set_gain(0.0)
+
+
+def test_lut_is_rebuilt_only_on_changes():
+    camera = _quiet_camera()
+    camera.set_gain(1.5)
+    lut = camera.sensor_lut()
+    assert camera.sensor_lut() is lut
+    camera.set_gain(1.6)
+    assert camera.sensor_lut() is not lut
+
+
+def test_gain_scales_the_noise():
+    camera = Camera(resolution=(160, 120), noise_seed=0)
+    flat = {"type": "color_check", "expected_colors": [(100, 100, 100)] * 4}
+    low = _capture(camera, flat)[:60].std()
+    camera.set_gain(2.0)
+    camera.set_exposure(5.0)  # same brightness, twice the gain
+    high = _capture(camera, flat)[:60]
+    assert high.mean() == pytest.approx(100, abs=1)
+    assert high.std() == pytest.approx(2 * low, rel=0.1)
+
+
+def test_controller_settings_and_status():
+    controller = CameraController(Camera(resolution=(64, 48)))
+    controller.set_exposure(5.0)
+    controller.set_gain(2.0)
+    controller.set_resolution(32, 24)
+    status = controller.get_status()
+    assert status["exposure_time"] == 5.0 and status["gain"] == 2.0
+    assert status["resolution"] == (32, 24)
+    camera = controller.camera
+    assert camera.principal_point == (16, 12)
+    assert camera.frame_pool.shape == (24, 32, 3) and camera.noise.shape == (24, 32, 3)
+    image, _ = controller.capture_image(np.zeros(3), np.zeros(3), {"type": "color_check"})
+    assert image.shape == (24, 32, 3)
+    with pytest.raises(ValueError):
+        controller.set_resolution(0, 24)
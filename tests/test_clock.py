@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from app.controllers.robotic_arm_controller import RoboticArmController
+from app.controllers.safety_controller import SafetyController
+from app.models.pid_controller import PIDController
+from app.models.robotic_arm import RoboticArm
+from app.models.safety_system import SafetySystem
+from app.utils.clock import Clock, RealClock, VirtualClock
+
+
+def test_virtual_clock_only_moves_when_advanced():
+    clock = VirtualClock(start=100.0)
+    assert clock.time() == 100.0
+    clock.sleep(2.5)
+    clock.advance(0.5)
+    assert clock.time() == pytest.approx(103.0)
+    with pytest.raises(ValueError):
+        clock.advance(-1.0)
+
+
+def test_real_clock_ignores_simulated_work():
+    clock = RealClock()
+    before = clock.time()
+    clock.advance(3600.0)
+    assert clock.time() - before < 1.0
+
+
+def test_incomplete_clocks_fail_at_construction():
+    class NoAdvance(Clock):
+        def time(self):
+            return 0.0
+
+        def sleep(self, seconds):
+            pass
+
+    with pytest.raises(TypeError):
+        Clock()
+    with pytest.raises(TypeError):
+        NoAdvance()
+
+
+def test_pid_without_dt_uses_injected_clock():
+    clock = VirtualClock()
+    pid = PIDController(kp=0.0, ki=1.0, kd=0.0, clock=clock)
+    assert pid.compute(1.0, 0.0) == 0.0  # first call only records the time
+    clock.advance(0.5)
+    assert pid.compute(1.0, 0.0) == pytest.approx(0.5)
+
+
+def test_arm_steps_and_moves_advance_virtual_time():
+    clock = VirtualClock()
+    arm = RoboticArm(clock=clock)
+    for _ in range(100):
+        arm.step_towards(np.full(6, 0.2), dt=0.01)
+    assert clock.time() == pytest.approx(1.0)
+
+    controller = RoboticArmController(arm)
+    assert controller.move_to_joint_angles([0.5, 0.0, 0.0, 0.0, 0.0, 0.0])
+    assert clock.time() == pytest.approx(1.0 + controller.last_trajectory.duration)
+
+
+def test_safety_timestamps_follow_the_clock():
+    clock = VirtualClock(start=10.0)
+    controller = SafetyController(SafetySystem(clock=clock))
+    controller.trigger_emergency_stop()
+    clock.advance(5.0)
+    controller.reset_emergency_stop()
+    assert [e.timestamp for e in controller.safety_system.get_events()] == [10.0, 15.0]
+    assert [e["timestamp"] for e in controller.get_safety_events()] == [10.0, 15.0]
+    controller.reset()
+    assert controller.safety_system.clock is clock
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from app.controllers.robotic_arm_controller import RoboticArmController
+from app.models.collision import (CollisionChecker, OrientedBox, TimeBVH,
+                                  segment_box_distance, segment_segment_distance)
+from app.models.robotic_arm import RoboticArm
+
+
+def _dense_min(points_a, points_b):
+    return np.linalg.norm(points_a[:, None] - points_b[None], axis=-1).min()
+
+
+def test_segment_distances_match_dense_sampling():
+    rng = np.random.default_rng(0)
+    p0, p1, q0, q1 = rng.uniform(-1, 1, (4, 50, 3))
+    t = np.linspace(0, 1, 1001)[:, None]
+    expected = [_dense_min(a + (b - a) * t, c + (d - c) * t) for a, b, c, d in zip(p0, p1, q0, q1)]
+    np.testing.assert_allclose(segment_segment_distance(p0, p1, q0, q1), expected, atol=2e-3)
+    # A degenerate segment is a point.
+    assert segment_segment_distance(np.zeros(3), np.array([2.0, 0, 0]),
+                                    np.array([1.0, 1, 0]), np.array([1.0, 1, 0])) == pytest.approx(1.0)
+
+    c, s = np.cos(0.4), np.sin(0.4)
+    box = OrientedBox([0.2, -0.1, 0.3], [0.1, 0.2, 0.05],
+                      np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]]))
+    expected = [box.signed_distance(a + (b - a) * t).min() for a, b in zip(p0, p1)]
+    np.testing.assert_allclose(segment_box_distance(p0, p1, box), expected, atol=2e-3)
+    # Through the center: negative, equal to minus the smallest half extent.
+    through = segment_box_distance(np.array([0.2, -0.1, 0.0]), np.array([0.2, -0.1, 0.6]), box)
+    assert through == pytest.approx(-0.05, abs=1e-6)
+
+
+def test_bvh_returns_every_overlapping_leaf():
+    rng = np.random.default_rng(1)
+    mins = rng.uniform(-1, 1, (37, 4, 3))
+    maxs = mins + rng.uniform(0, 0.3, (37, 4, 3))
+    box_min, box_max = np.full(3, -0.2), np.full(3, 0.2)
+    samples, items = TimeBVH(mins, maxs).query_box(box_min, box_max)
+    expected = np.argwhere(np.all((mins <= box_max) & (maxs >= box_min), axis=-1))
+    assert sorted(zip(samples, items)) == sorted(map(tuple, expected))
+
+
+def test_trajectory_check_matches_exact_clearances():
+    arm = RoboticArm()
+    part = OrientedBox.from_dimensions({"length": 200, "width": 200, "height": 100}, [0.45, 0.0, 0.05])
+    checker = CollisionChecker(arm, [part], margin=0.01)
+    Q = np.random.default_rng(2).uniform(*np.array(arm.joint_limits).T, (2000, 6))
+    clearances = checker.clearances(Q)
+    expected = (clearances["obstacles"].min(axis=(1, 2)) >= 0.01) & (clearances["self"].min(axis=1) >= 0)
+    np.testing.assert_array_equal(checker.check_trajectory(Q), expected)
+    assert 0 < expected.mean() < 1
+
+
+def test_part_blocks_the_arm():
+    arm = RoboticArm()
+    far_part = OrientedBox([0.0, 0.8, 0.05], [0.1, 0.1, 0.05])
+    assert CollisionChecker(arm, [far_part]).is_collision_free(np.zeros(6))
+    # At home the upper arm lies along x at the shoulder height.
+    blocking = OrientedBox([0.3, 0.0, 0.16], [0.05, 0.05, 0.05])
+    checker = CollisionChecker(arm, [blocking])
+    assert not checker.is_collision_free(np.zeros(6))
+    assert not checker.check_motion(np.array([0.0, -1.0, 0, 0, 0, 0]), np.array([0.0, 1.0, 0, 0, 0, 0]))
+
+
+def test_controller_rejects_colliding_moves():
+    arm = RoboticArm()
+    controller = RoboticArmController(arm)
+    controller.collision_checker = CollisionChecker(arm, [OrientedBox([0.0, 0.6, 0.16], [0.05, 0.05, 0.05])])
+    # Swinging the base a quarter turn sweeps the arm through the box.
+    assert not controller.move_to_joint_angles([np.pi / 2, 0, 0, 0, 0, 0])
+    np.testing.assert_allclose(arm.joint_angles, 0.0)
+    assert controller.move_to_joint_angles([-np.pi / 2, 0, 0, 0, 0, 0])
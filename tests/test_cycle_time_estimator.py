@@ -0,0 +1,106 @@
+import time
+
+import numpy as np
+import pytest
+
+from app.models.reachability_map import ReachabilityMap
+from app.services.cycle_time_estimator import CycleTimeEstimator
+from app.services.inspection_service import InspectionService
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = InspectionService(config_path=tmp_path / "config.json",
+                                reachability_map_path=tmp_path / "map.npz",
+                                plan_cache_path=tmp_path / "plans")
+    # A coarse map keeps the test fast; it matches the arm's fingerprint.
+    service._reachability_map = ReachabilityMap.build(service.arm, samples=20_000)
+    return service
+
+
+def _plan(solutions, converged):
+    return {
+        "sequence": [{"description": f"p{i}"} for i in range(len(solutions))],
+        "ik_solutions": np.asarray(solutions, dtype=float),
+        "ik_converged": np.asarray(converged, dtype=bool),
+        "sequence_report": None,
+    }
+
+
+def test_predicted_motion_matches_execution(service):
+    rng = np.random.default_rng(0)
+    solutions = rng.uniform(-1.0, 1.0, (6, 6))
+    estimator = CycleTimeEstimator(service)
+    estimate = estimator.estimate_plan(_plan(solutions, [True] * 6), "fingerprints")
+
+    controller = service.arm_controller
+    for q in solutions:
+        assert controller.move_to_joint_angles(list(q))
+    assert estimate["totals"]["motion"] == pytest.approx(controller.total_motion_time)
+
+    step = estimate["steps"][0]
+    assert step["capture"] == pytest.approx(estimator.capture_time())
+    assert step["analysis"] == pytest.approx(estimator.analysis_time("fingerprints"))
+    assert step["total"] == pytest.approx(step["motion"] + step["capture"] + step["analysis"])
+    assert estimate["totals"]["total"] == pytest.approx(sum(s["total"] for s in estimate["steps"]))
+
+
+def test_s_curve_profile_and_unsolved_steps(service):
+    service.arm_controller.motion_profile = "s_curve"
+    estimator = CycleTimeEstimator(service, timing_model={"settle_time": 0.0})
+    solutions = np.zeros((3, 6))
+    solutions[:, 0] = [0.5, 0.0, 1.0]
+    estimate = estimator.estimate_plan(_plan(solutions, [True, False, True]), "edge_quality")
+
+    assert estimate["unsolved_steps"] == [1]
+    assert estimate["timed_step_count"] == 2 and estimate["unreachable_steps"] == []
+    assert estimate["steps"][1]["total"] == 0.0
+    # The unsolved step is skipped: the arm moves 0.5 -> 1.0 directly.
+    expected = (service.arm_controller.plan_joint_motion(solutions[0]).duration +
+                service.arm_controller.plan_joint_motion(solutions[2], start=solutions[0]).duration)
+    assert estimate["totals"]["motion"] == pytest.approx(expected)
+
+
+def _reachable_grid(arm, count, seed=0):
+    """Inspection points (mm) at poses the arm reaches, from FK over half the joint ranges."""
+    rng = np.random.default_rng(seed)
+    lo = np.array([l for l, _ in arm.joint_limits]) / 2
+    hi = np.array([h for _, h in arm.joint_limits]) / 2
+    poses = arm.forward_kinematics_batch(rng.uniform(lo, hi, size=(count, 6)))
+    return [{"position": list(T[:3, 3] * 1000.0), "orientation": list(arm._matrix_to_rpy(T)),
+             "type": "top_view", "description": f"p{i}"} for i, T in enumerate(poses)]
+
+
+def test_estimate_from_config_is_fast(service, monkeypatch):
+    grid = _reachable_grid(service.arm, 200)
+    monkeypatch.setattr("app.services.inspection_service.calculate_inspection_grid",
+                        lambda *args: [dict(point) for point in grid])
+    estimator = CycleTimeEstimator(service)
+    start = time.perf_counter()
+    estimate = estimator.estimate("Large Part", "surface_quality")
+    assert time.perf_counter() - start < 1.0
+
+    assert len(estimate["steps"]) == 200
+    # Every point the reachability map lets through is solved and timed.
+    assert estimate["timed_step_count"] > 0
+    assert estimate["timed_step_count"] + len(estimate["unreachable_steps"]) >= 195
+    assert all(step["motion"] > 0 for step in estimate["steps"] if step["solved"])
+    assert estimate["totals"]["total"] == pytest.approx(sum(s["total"] for s in estimate["steps"]))
+    assert estimate["totals"]["total"] > estimate["timed_step_count"] * estimator.capture_time()
+
+
+def test_shipped_config_without_solvable_points_is_an_error(service):
+    estimator = CycleTimeEstimator(service)
+    start = time.perf_counter()
+    # No shipped part config has a solvable point on this arm, so the
+    # estimate must fail loudly instead of reporting 0 s.
+    with pytest.raises(ValueError, match="No step of the inspection can be timed"):
+        estimator.estimate("Large Part", "surface_quality")
+    assert time.perf_counter() - start < 1.0
+
+
+def test_plan_without_timed_steps_is_an_error(service):
+    plan = _plan(np.zeros((3, 6)), [False] * 3)
+    plan["sequence"][0]["reachable"] = False
+    with pytest.raises(ValueError, match="1 of 3 points are outside"):
+        CycleTimeEstimator(service).estimate_plan(plan, "fingerprints")
@@ -0,0 +1,63 @@
+import gc
+
+import numpy as np
+import pytest
+
+from app.models.camera import Camera
+from app.models.frame_pool import FramePool
+
+
+def test_released_frames_are_reused():
+    pool = FramePool((4, 5, 3), max_free=1)
+    a = pool.acquire()
+    b = pool.acquire()
+    assert a.shape == (4, 5, 3) and a.dtype == np.uint8
+    assert len(pool) == 2
+    pool.release(a)
+    pool.release(b)  # beyond max_free, dropped
+    assert pool.acquire() is a
+    assert pool.stats == {"allocated": 2, "reused": 1}
+
+
+def test_reference_counting():
+    pool = FramePool((2, 2, 3))
+    frame = pool.acquire()
+    pool.retain(frame)
+    pool.release(frame)
+    assert len(pool) == 1  # still held once
+    pool.release(frame)
+    assert len(pool) == 0
+    with pytest.raises(ValueError):
+        pool.release(frame)
+    with pytest.raises(ValueError):
+        pool.release(np.zeros((2, 2, 3), dtype=np.uint8))
+
+    with pool.frame() as scoped:
+        assert scoped is frame
+    assert len(pool) == 0
+
+
+def test_dropped_frames_do_not_leak():
+    pool = FramePool((2, 2, 3))
+    pool.acquire()
+    gc.collect()
+    assert len(pool) == 0
+
+
+def test_camera_reuses_frames_and_follows_resolution():
+    camera = Camera(resolution=(64, 48))
+    scene = {"type": "color_check"}
+    image, _ = camera.capture_image(np.zeros(3), np.zeros(3), scene)
+    assert image.shape == (48, 64, 3)
+    assert (image[:24, :16, 0] >= 200).all()  # red patch survives the noise
+    camera.release_frame(image)
+    again, _ = camera.capture_image(np.zeros(3), np.zeros(3), scene)
+    assert again is image
+    assert camera.frame_pool.stats["allocated"] == 1
+
+    camera.resolution = (32, 16)
+    small, _ = camera.capture_image(np.zeros(3), np.zeros(3), scene)
+    assert small.shape == (16, 32, 3)
+    camera.release_frame(again)  # old shape is not taken back
+    camera.release_frame(small)
+    assert camera.capture_image(np.zeros(3), np.zeros(3), scene)[0] is small
@@ -0,0 +1,47 @@
+import numpy as np
+
+from app.models.ik_seed_index import IKSeedIndex
+from app.models.robotic_arm import RoboticArm
+
+
+def test_nearest_returns_closest_solution():
+    index = IKSeedIndex(voxel_size=0.02)
+    index.insert([0.40, 0.00, 0.30], [0.0, 0.0, 0.0], np.full(6, 1.0))
+    index.insert([0.43, 0.00, 0.30], [0.0, 0.0, 0.0], np.full(6, 2.0))
+    index.insert([0.40, 0.00, 0.30], [0.0, 0.0, 2.0], np.full(6, 3.0))
+
+    np.testing.assert_array_equal(index.nearest([0.41, 0.0, 0.3], [0.0, 0.0, 0.0]), np.full(6, 1.0))
+    np.testing.assert_array_equal(index.nearest([0.40, 0.0, 0.3], [0.0, 0.0, 1.9]), np.full(6, 3.0))
+    # Nothing within a voxel of the query.
+    assert index.nearest([1.0, 1.0, 1.0], [0.0, 0.0, 0.0]) is None
+
+
+def test_lru_eviction_bounds_size():
+    index = IKSeedIndex(voxel_size=0.01, max_entries=3)
+    for i in range(3):
+        index.insert([0.1 * i, 0.0, 0.0], [0.0, 0.0, 0.0], np.full(6, float(i)))
+    # Touch the oldest entry so the second one becomes least recently used.
+    assert index.nearest([0.0, 0.0, 0.0], [0.0, 0.0, 0.0]) is not None
+    index.insert([0.3, 0.0, 0.0], [0.0, 0.0, 0.0], np.full(6, 3.0))
+
+    assert len(index) == 3
+    assert index.nearest([0.1, 0.0, 0.0], [0.0, 0.0, 0.0]) is None
+    assert index.nearest([0.0, 0.0, 0.0], [0.0, 0.0, 0.0]) is not None
+
+
+def test_arm_warm_start_converges_within_small_budget():
+    """A target next to a previously solved one converges in a few DLS steps."""
+    arm = RoboticArm()
+    q_far = np.array([1.2, -0.8, 1.5, -1.0, 0.9, 0.7])
+    arm.joint_angles = q_far.copy()
+    position, rpy = arm.get_end_effector_pose()
+    arm.reset()
+    assert arm.calculate_inverse_kinematics(position, rpy, use_analytic=False) is not None
+
+    arm.joint_angles = q_far + 0.01
+    nearby, nearby_rpy = arm.get_end_effector_pose()
+    arm.reset()
+    assert arm.calculate_inverse_kinematics(nearby, nearby_rpy, max_iterations=5,
+                                            use_analytic=False, use_seed_index=False) is None
+    assert arm.calculate_inverse_kinematics(nearby, nearby_rpy, max_iterations=5,
+                                            use_analytic=False) is not None
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from app.models.reachability_map import ReachabilityMap
+from app.services.inspection_service import InspectionService
+
+
+@pytest.fixture
+def service(tmp_path):
+    return InspectionService(config_path=tmp_path / "config.json",
+                             reachability_map_path=tmp_path / "map.npz",
+                             plan_cache_path=tmp_path / "plans")
+
+
+def _reachable_grid(arm, count, seed=0):
+    """Top-view inspection points (mm) at poses the arm reaches, from FK."""
+    rng = np.random.default_rng(seed)
+    lo = np.array([l for l, _ in arm.joint_limits]) / 2
+    hi = np.array([h for _, h in arm.joint_limits]) / 2
+    poses = arm.forward_kinematics_batch(rng.uniform(lo, hi, size=(count, 6)))
+    return [{"position": list(T[:3, 3] * 1000.0), "orientation": list(arm._matrix_to_rpy(T)),
+             "type": "top_view", "description": f"p{i}"} for i, T in enumerate(poses)]
+
+
+def _use_grid(monkeypatch, grid):
+    monkeypatch.setattr("app.services.inspection_service.calculate_inspection_grid",
+                        lambda *args: [dict(point) for point in grid])
+
+
+def test_batched_ik_drives_the_inspection(service, monkeypatch):
+    arm = service.arm
+    reach = sum(abs(a) + abs(d) for a, _, d, _ in arm.dh_params)
+    grid = _reachable_grid(arm, 4)
+    # Inside the map's bounds but further from the base than the arm reaches.
+    grid.insert(2, {"position": [900.0 * reach, 0.0, 900.0 * reach], "orientation": [0.0, 0.0, 0.0],
+                    "type": "top_view", "description": "out of reach"})
+    _use_grid(monkeypatch, grid)
+    # A map that lets every pose through, so only IK decides.
+    base = ReachabilityMap.build(arm, samples=1_000)
+    service._reachability_map = ReachabilityMap(np.ones_like(base.occupancy), base.origin,
+                                                base.voxel_size, base.fingerprint)
+
+    assert service.start_inspection("Small Part", "scratches_small")
+    assert service.ik_converged.sum() == 4
+    for index, step in enumerate(service.inspection_sequence):
+        before = arm.joint_angles.copy()
+        if service.ik_converged[index]:
+            assert service.execute_step()
+            # Grid positions are in mm, the arm works in m.
+            reached = arm.forward_kinematics(arm.joint_angles)[:3, 3]
+            np.testing.assert_allclose(reached * 1000.0, step["position"], atol=1.0)
+        else:
+            assert step["description"] == "out of reach" and step["reachable"]
+            assert not service.execute_step()
+            np.testing.assert_array_equal(arm.joint_angles, before)
+            assert service.current_step == index
+            service.current_step += 1
+    assert [r["step"] for r in service.results] == list(np.flatnonzero(service.ik_converged))
+
+
+def test_unreachable_points_are_reported_and_not_attempted(service, monkeypatch, capsys):
+    arm = service.arm
+    reach = sum(abs(a) + abs(d) for a, _, d, _ in arm.dh_params)
+    grid = _reachable_grid(arm, 20, seed=1)
+    # One point outside the map's bounds, one inside them but out of reach.
+    far = [{"position": [5000.0, 0.0, 0.0], "orientation": [0.0, 0.0, 0.0],
+            "type": "top_view", "description": "far"},
+           {"position": [900.0 * reach] * 3, "orientation": [0.0, 0.0, 0.0],
+            "type": "top_view", "description": "corner"}]
+    _use_grid(monkeypatch, grid[:10] + far + grid[10:])
+    service._reachability_map = ReachabilityMap.build(arm, samples=200_000, voxel_size=0.1)
+    attempted = []
+    solve_poses = service.arm_controller.solve_poses
+
+    def record(targets):
+        attempted.extend(targets.tolist())
+        return solve_poses(targets)
+
+    monkeypatch.setattr(service.arm_controller, "solve_poses", record)
+    assert service.start_inspection("Small Part", "scratches_small")
+    assert "2 of 22 inspection points are outside the arm's workspace" in capsys.readouterr().out
+
+    flagged = [step["description"] for step in service.inspection_sequence if not step["reachable"]]
+    assert sorted(flagged) == ["corner", "far"]
+    # Only the reachable points reach IK, and every one of them is solved.
+    assert len(attempted) == 20 and service.ik_converged.sum() == 20
+    assert not any(np.allclose(target[:3], [5.0, 0.0, 0.0]) for target in attempted)
+
+    service.current_step = next(i for i, step in enumerate(service.inspection_sequence)
+                                if step["description"] == "far")
+    assert not service.execute_step()
+    assert "outside the arm's workspace" in capsys.readouterr().out
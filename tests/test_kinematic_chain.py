@@ -0,0 +1,45 @@
+import numpy as np
+
+from app.models.kinematic_chain import KinematicChain
+from app.models.robotic_arm import RoboticArm
+
+
+def _reference_frames(arm, q):
+    frames = [np.eye(4)]
+    for (a, alpha, d, _), theta in zip(arm.dh_params, q):
+        frames.append(frames[-1] @ arm.dh_transform(a, alpha, d, theta))
+    return np.array(frames)
+
+
+def test_chain_matches_dh_product():
+    arm = RoboticArm()
+    chain = KinematicChain(arm.dh_params)
+    q = np.array([0.4, -0.2, 1.1, -0.7, 0.3, 0.9])
+    np.testing.assert_allclose(chain.frames(q), _reference_frames(arm, q), atol=1e-12)
+    np.testing.assert_allclose(chain.jacobian(q), arm.jacobian(q, method="numerical"), atol=1e-6)
+
+
+def test_chain_reuses_its_buffers():
+    """Single-configuration results live in buffers overwritten by the next call."""
+    chain = KinematicChain(RoboticArm().dh_params)
+    first = chain.forward_kinematics(np.zeros(6))
+    second = chain.forward_kinematics(np.full(6, 0.5))
+    assert np.shares_memory(first, second)
+    J_first = chain.jacobian(np.zeros(6))
+    assert J_first is chain.jacobian(np.full(6, 0.5))
+
+
+def test_batch_jacobian_matches_single():
+    chain = KinematicChain(RoboticArm().dh_params)
+    Q = np.random.default_rng(5).uniform(-1.0, 1.0, size=(8, 6))
+    J = chain.jacobian_batch(Q)
+    for q, J_row in zip(Q, J):
+        np.testing.assert_allclose(J_row, chain.jacobian(q), atol=1e-12)
+
+
+def test_arm_recompiles_after_dh_edit():
+    arm = RoboticArm()
+    before = arm.forward_kinematics(np.zeros(6))
+    arm.dh_params[0] = (0, 0, 0.2625, 0)
+    after = arm.forward_kinematics(np.zeros(6))
+    assert np.isclose(after[2, 3] - before[2, 3], 0.1)
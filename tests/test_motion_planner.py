@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from app.controllers.robotic_arm_controller import RoboticArmController
+from app.models.collision import CollisionChecker, OrientedBox
+from app.models.motion_planner import MotionPlanner, NearestNeighborIndex
+from app.models.robotic_arm import RoboticArm
+
+START = np.zeros(6)
+GOAL = np.array([0.9 * np.pi, 0.0, 0.0, 0.0, 0.0, 0.0])
+
+
+@pytest.fixture
+def walled_arm():
+    """The base swing from START to GOAL runs into a wall on the +y side."""
+    arm = RoboticArm()
+    checker = CollisionChecker(arm, [OrientedBox([0.0, 0.5, 0.3], [0.6, 0.05, 0.6])])
+    return arm, checker
+
+
+def test_nearest_neighbor_index_matches_brute_force():
+    rng = np.random.default_rng(0)
+    index = NearestNeighborIndex(6, rebuild_size=16)
+    points = rng.uniform(-3, 3, (300, 6))
+    for p in points:
+        index.add(p)
+    assert len(index) == 300
+    for query in rng.uniform(-3, 3, (50, 6)):
+        assert index.nearest(query) == int(np.argmin(np.linalg.norm(points - query, axis=1)))
+
+
+def test_planner_finds_collision_free_path(walled_arm):
+    arm, checker = walled_arm
+    assert not checker.check_motion(START, GOAL)
+    path, stats = MotionPlanner(arm, checker, seed=0).plan(START, GOAL, time_budget=5.0)
+    assert stats["success"]
+    np.testing.assert_allclose(path[[0, -1]], [START, GOAL])
+    assert all(checker.check_motion(a, b) for a, b in zip(path[:-1], path[1:]))
+    assert stats["path_length"] <= stats["raw_path_length"] + 1e-9
+    assert stats["waypoints"] == len(path)
+    assert stats["edge_samples_checked"] > 0
+
+
+def test_planner_reports_failures(walled_arm):
+    arm, checker = walled_arm
+    planner = MotionPlanner(arm, checker, seed=0)
+    blocked = np.array([np.pi / 2, 0.0, 0.0, 0.0, 0.0, 0.0])  # arm inside the wall
+    path, stats = planner.plan(START, blocked)
+    assert path is None and not stats["success"]
+
+    path, stats = planner.plan(START, GOAL, time_budget=0.0)
+    assert path is None and stats["budget_exhausted"]
+
+
+def test_controller_moves_around_obstacles(walled_arm):
+    arm, checker = walled_arm
+    controller = RoboticArmController(arm)
+    controller.collision_checker = checker
+    controller.motion_planner = MotionPlanner(arm, checker, seed=1)
+    assert not controller.move_to_joint_angles(list(GOAL))
+    assert controller.move_around_obstacles(list(GOAL), time_budget=5.0)
+    np.testing.assert_allclose(arm.joint_angles, GOAL)
+    assert controller.last_plan_stats["success"]
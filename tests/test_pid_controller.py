@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from app.models.pid_controller import PIDController
+from app.models.pid_controller import PIDBank, PIDController
 from app.models.robotic_arm import RoboticArm
 
 
@@ -71,3 +71,31 @@ def test_arm_step_towards_respects_joint_limits():
     for _ in range(5000):
         arm.step_towards(target, dt=0.01)
     assert arm.joint_angles[1] <= np.pi / 2 + 1e-9
+
+
+def test_pid_bank_matches_scalar_controllers():
+    """Every axis of the bank reproduces PIDController.compute, including saturation."""
+    kp = np.array([1.0, 2.0, 0.0, 5.0])
+    ki = np.array([0.1, 0.0, 1.0, 0.5])
+    kd = np.array([0.05, 0.1, 0.0, 0.0])
+    bank = PIDBank(kp, ki, kd, output_limits=(-1.0, 1.0))
+    scalars = [PIDController(kp[i], ki[i], kd[i], output_limits=(-1.0, 1.0)) for i in range(4)]
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        setpoint = rng.uniform(-3, 3, 4)
+        measured = rng.uniform(-3, 3, 4)
+        expected = [pid.compute(setpoint[i], measured[i], dt=0.01) for i, pid in enumerate(scalars)]
+        np.testing.assert_allclose(bank.compute(setpoint, measured, dt=0.01), expected, atol=1e-12)
+    np.testing.assert_allclose(bank.integral, [pid.integral for pid in scalars], atol=1e-12)
+
+
+def test_pid_bank_steps_many_arms_at_once():
+    bank = PIDBank(kp=2.0, ki=0.5, kd=0.0, output_limits=(-5.0, 5.0), shape=(100, 6))
+    setpoint = np.random.default_rng(1).uniform(-1, 1, (100, 6))
+    position = np.zeros((100, 6))
+    for _ in range(2000):
+        position += bank.compute(setpoint, position, dt=0.01) * 0.01
+    np.testing.assert_allclose(position, setpoint, atol=1e-3)
+    assert len(bank) == 100
+    bank.reset()
+    assert not bank.integral.any() and not bank.previous_error.any()
@@ -0,0 +1,86 @@
+import numpy as np
+
+from app.config.camera_config import CAMERA_CONFIG
+from app.models.reachability_map import ReachabilityMap
+from app.models.robotic_arm import RoboticArm
+from app.services.inspection_service import InspectionService
+from app.services.plan_cache import PlanCache, grid_key, ik_key
+
+
+def test_lru_eviction_and_copies():
+    cache = PlanCache(max_entries=2)
+    cache.put("a", {"points": [1, 2]})
+    cache.put("b", {"points": [3]})
+    cache.get("a")["points"].append(99)  # callers get copies
+    cache.put("c", {"points": [4]})      # evicts b, the least recently used
+
+    assert cache.get("a") == {"points": [1, 2]}
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    assert cache.stats == {"hits": 2, "disk_hits": 0, "misses": 1}
+
+
+def test_disk_store_survives_restart(tmp_path):
+    entry = {"sequence": [{"description": "p0"}], "ik_solutions": np.arange(12.0).reshape(2, 6),
+             "ik_converged": np.array([True, False])}
+    PlanCache(tmp_path).put("k", entry)
+
+    restarted = PlanCache(tmp_path)
+    loaded = restarted.get("k")
+    assert loaded["sequence"] == entry["sequence"]
+    np.testing.assert_array_equal(loaded["ik_solutions"], entry["ik_solutions"])
+    np.testing.assert_array_equal(loaded["ik_converged"], entry["ik_converged"])
+    assert restarted.stats["disk_hits"] == 1
+    restarted.get("k")
+    assert restarted.stats["hits"] == 1
+
+
+def test_keys_track_their_inputs():
+    arm = RoboticArm()
+    dims = {"length": 100, "width": 100, "height": 50}
+    assert grid_key(dims, CAMERA_CONFIG) == grid_key(dict(reversed(list(dims.items()))), CAMERA_CONFIG)
+    assert grid_key(dims, CAMERA_CONFIG) != grid_key({**dims, "height": 60}, CAMERA_CONFIG)
+    before = ik_key(dims, CAMERA_CONFIG, "fingerprints", arm)
+    assert before != ik_key(dims, CAMERA_CONFIG, "scratches_small", arm)
+    arm.dh_params[2] = (0.43, 0, 0, 0)
+    assert before != ik_key(dims, CAMERA_CONFIG, "fingerprints", arm)
+
+
+def _service(tmp_path):
+    service = InspectionService(config_path=tmp_path / "config.json",
+                                reachability_map_path=tmp_path / "map.npz",
+                                plan_cache_path=tmp_path / "plans")
+    service._reachability_map = ReachabilityMap.build(service.arm, samples=20_000)
+    return service
+
+
+def _count_solves(service, monkeypatch):
+    calls = []
+    solve = service._solve_inspection_points
+    monkeypatch.setattr(service, "_solve_inspection_points",
+                        lambda sequence: calls.append(len(sequence)) or solve(sequence))
+    return calls
+
+
+def test_service_plans_are_memoized(tmp_path, monkeypatch):
+    service = _service(tmp_path)
+    calls = _count_solves(service, monkeypatch)
+    first = service.plan_inspection("Small Part", "scratches_small")
+    second = service.plan_inspection("Small Part", "scratches_small")
+    assert len(calls) == 1
+    assert [p["description"] for p in first["sequence"]] == [p["description"] for p in second["sequence"]]
+    np.testing.assert_array_equal(first["ik_converged"], second["ik_converged"])
+
+    # A restarted service is served from disk.
+    restarted = _service(tmp_path)
+    restarted_calls = _count_solves(restarted, monkeypatch)
+    restarted.plan_inspection("Small Part", "scratches_small")
+    assert restarted_calls == [] and restarted.plan_cache.stats["disk_hits"] >= 1
+
+    # Changing the camera or the arm invalidates the entry.
+    service.plan_inspection("Small Part", "scratches_small",
+                            {**CAMERA_CONFIG, "working_distance": CAMERA_CONFIG["working_distance"] + 50})
+    service.arm.dh_params[2] = (0.43, 0, 0, 0)
+    service._reachability_map = ReachabilityMap.build(service.arm, samples=20_000)
+    service.plan_inspection("Small Part", "scratches_small")
+    assert len(calls) == 3
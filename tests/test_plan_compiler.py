@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+from app.models.collision import CollisionChecker, OrientedBox
+from app.models.motion_planner import MotionPlanner
+from app.services.inspection_service import InspectionService
+from app.services.plan_compiler import InspectionPlan, PlanCompiler, plan_fingerprint
+
+
+@pytest.fixture
+def service(tmp_path):
+    return InspectionService(config_path=tmp_path / "config.json",
+                             reachability_map_path=tmp_path / "map.npz",
+                             plan_cache_path=tmp_path / "plans")
+
+
+def _synthetic_plan(solutions, converged):
+    sequence = [{"position": [100.0 * i, 0.0, 50.0], "orientation": [0.0, 0.0, 0.0],
+                 "description": f"p{i}", "type": "surface"} for i in range(len(solutions))]
+    return {
+        "sequence": sequence,
+        "ik_solutions": np.asarray(solutions, dtype=float),
+        "ik_converged": np.asarray(converged, dtype=bool),
+        "sequence_report": None,
+    }
+
+
+@pytest.fixture
+def compiled(service, monkeypatch):
+    solutions = np.zeros((4, 6))
+    solutions[:, 0] = [0.4, -0.3, 0.0, 0.8]
+    solutions[:, 1] = [0.2, 0.1, 0.0, -0.2]
+    plan = _synthetic_plan(solutions, [True, True, False, True])
+    monkeypatch.setattr(service, "plan_inspection", lambda *args, **kwargs: plan)
+    return PlanCompiler(service).compile("Small Part", "fingerprints")
+
+
+def test_compiled_plan_timing(service, compiled):
+    assert len(compiled) == 4
+    assert compiled.trajectories[2] is None
+    assert compiled.timing["motion"][2] == 0.0 and compiled.timing["capture"][2] == 0.0
+    np.testing.assert_allclose(compiled.trajectories[0].start, compiled.start)
+    # Each move starts where the previous solved step ended.
+    np.testing.assert_allclose(compiled.trajectories[3].start, compiled.ik_solutions[1], atol=1e-9)
+    expected = sum(values.sum() for values in compiled.timing.values())
+    assert compiled.total_time == pytest.approx(expected)
+    assert compiled.fingerprint == plan_fingerprint(service, "Small Part", "fingerprints")
+
+
+def test_save_load_round_trip(tmp_path, compiled):
+    path = tmp_path / "plans" / "small.npz"
+    compiled.save(path)
+    loaded = InspectionPlan.load(path)
+
+    assert loaded.sequence == compiled.sequence
+    assert loaded.fingerprint == compiled.fingerprint
+    np.testing.assert_array_equal(loaded.ik_converged, compiled.ik_converged)
+    np.testing.assert_allclose(loaded.ik_solutions, compiled.ik_solutions)
+    assert loaded.trajectories[2] is None
+    for original, restored in zip(compiled.trajectories, loaded.trajectories):
+        if original is not None:
+            np.testing.assert_allclose(restored.positions, original.positions, atol=1e-6)
+            assert restored.duration == pytest.approx(original.duration)
+    assert loaded.total_time == pytest.approx(compiled.total_time)
+    assert InspectionPlan.load(tmp_path / "missing.npz") is None
+
+
+def test_replay_does_no_solving(tmp_path, service, compiled, monkeypatch):
+    path = tmp_path / "plan.npz"
+    compiled.save(path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("replay must not plan")
+
+    monkeypatch.setattr(service, "plan_inspection", fail)
+    monkeypatch.setattr(service.arm, "calculate_analytic_ik", fail)
+    monkeypatch.setattr(service.arm_controller, "plan_joint_motion", fail)
+
+    assert service.start_planned_inspection(str(path))
+    assert service.execute_step() and service.execute_step()
+    assert not service.execute_step()  # step 2 has no solution
+    service.current_step += 1
+    assert service.execute_step()
+
+    np.testing.assert_allclose(service.arm.joint_angles, compiled.ik_solutions[3])
+    assert service.arm_controller.total_motion_time == pytest.approx(compiled.timing["motion"].sum())
+    service.stop_inspection()
+    assert service.active_plan is None
+
+
+@pytest.mark.parametrize("change", ["arm", "part"])
+def test_stale_plan_is_refused(tmp_path, service, compiled, change):
+    path = tmp_path / "plan.npz"
+    compiled.save(path)
+    if change == "arm":
+        service.arm.dh_params[2] = (0.43, 0, 0, 0)
+    else:
+        service.config["Small Part"]["dimensions"]["height"] += 10
+
+    assert not service.start_planned_inspection(str(path))
+    assert service.active_plan is None and service.inspection_sequence is None
+
+
+def test_blocked_move_is_routed_around_obstacle(service, monkeypatch):
+    """The base swing to the goal runs into a wall on the +y side."""
+    goal = np.array([0.9 * np.pi, 0.0, 0.0, 0.0, 0.0, 0.0])
+    checker = CollisionChecker(service.arm, [OrientedBox([0.0, 0.5, 0.3], [0.6, 0.05, 0.6])])
+    controller = service.arm_controller
+    controller.collision_checker = checker
+    controller.motion_planner = MotionPlanner(service.arm, checker, seed=0)
+    monkeypatch.setattr(service, "plan_inspection",
+                        lambda *args, **kwargs: _synthetic_plan([goal], [True]))
+
+    plan = PlanCompiler(service, planning_time_budget=5.0).compile("Small Part", "fingerprints")
+    assert plan.ik_converged[0]
+    _, positions = plan.trajectories[0].sample_uniform(0.02)
+    assert checker.check_trajectory(positions).all()
+    np.testing.assert_allclose(plan.trajectories[0].goal, goal, atol=1e-6)
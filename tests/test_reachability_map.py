@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from app.models.reachability_map import ReachabilityMap
+from app.models.robotic_arm import RoboticArm
+
+
+@pytest.fixture(scope="module")
+def reach_map():
+    return ReachabilityMap.build(RoboticArm(), samples=200_000, voxel_size=0.1)
+
+
+def test_sampled_poses_are_reachable(reach_map):
+    arm = RoboticArm()
+    rng = np.random.default_rng(21)
+    lo = [l for l, _ in arm.joint_limits]
+    hi = [h for _, h in arm.joint_limits]
+    poses = arm.forward_kinematics_batch(rng.uniform(lo, hi, size=(500, 6)))
+    rpy = np.array([arm._matrix_to_rpy(T) for T in poses])
+    # The map is only a pre-filter: it must never reject a reachable pose.
+    assert reach_map.is_reachable_batch(poses[:, :3, 3], rpy).all()
+    assert reach_map.is_reachable_batch(poses[:, :3, 3]).all()
+
+
+def test_far_points_are_rejected(reach_map):
+    assert not reach_map.is_reachable([5.0, 0.0, 0.0])
+    assert not reach_map.is_reachable([0.0, 0.0, -3.0], [0.0, 0.0, 0.0])
+
+
+def test_save_load_roundtrip(reach_map, tmp_path):
+    path = tmp_path / "reach.npz"
+    reach_map.save(path)
+    arm = RoboticArm()
+    loaded = ReachabilityMap.load(path, arm)
+    assert loaded is not None
+    np.testing.assert_array_equal(loaded.occupancy, reach_map.occupancy)
+
+    # A map built for other kinematics is treated as stale.
+    arm.dh_params[2] = (0.5, 0, 0, 0)
+    assert ReachabilityMap.load(path, arm) is None
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from app.models.camera import Camera
+from app.models.render_cache import RenderCache
+
+
+def test_lru_eviction_by_memory():
+    frame = np.zeros((10, 10, 3), dtype=np.uint8)  # 300 bytes
+    cache = RenderCache(max_bytes=700)
+    for key in "abc":
+        cache.put(key, frame)
+    assert len(cache) == 2 and cache.nbytes == 600
+    assert cache.get("a") is None
+    cache.get("b")
+    cache.put("d", frame)  # evicts c, the least recently used
+    assert cache.get("c") is None and cache.get("b") is not None
+
+    stored = cache.get("d")
+    with pytest.raises(ValueError):
+        stored[0, 0, 0] = 1
+    assert cache.put("big", np.zeros((20, 20, 3), dtype=np.uint8)) is not None
+    assert cache.get("big") is None
+
+
+def test_key_depends_on_description_and_resolution():
+    a = RenderCache.key({"type": "text_reading", "expected_text": "A1"}, (64, 48))
+    assert a == RenderCache.key({"expected_text": "A1", "type": "text_reading"}, (64, 48))
+    assert a != RenderCache.key({"type": "text_reading", "expected_text": "B2"}, (64, 48))
+    assert a != RenderCache.key({"type": "text_reading", "expected_text": "A1"}, (32, 48))
+
+
+def _capture(camera, scene):
+    image, _ = camera.capture_image(np.zeros(3), np.zeros(3), scene)
+    frame = image.copy()
+    camera.release_frame(image)
+    return frame
+
+
+def test_camera_reuses_deterministic_scenes():
+    camera = Camera(resolution=(64, 48), noise_seed=0)
+    camera.noise.read_noise = 0.0
+    scene = {"type": "text_reading", "expected_text": "OK"}
+    first = _capture(camera, scene)
+    second = _capture(camera, scene)
+    np.testing.assert_array_equal(first, second)
+    assert camera.render_cache.stats == {"hits": 1, "misses": 1}
+
+    # Noise is applied to the copy, never to the cached base frame.
+    camera.noise.read_noise = 10.0
+    noisy = _capture(camera, scene)
+    assert not np.array_equal(noisy, first)
+    camera.noise.read_noise = 0.0
+    np.testing.assert_array_equal(_capture(camera, scene), first)
+
+
+def test_random_scenes_are_cached_only_when_seeded():
+    camera = Camera(resolution=(640, 480))
+    camera.noise.read_noise = 0.0
+    _capture(camera, {"type": "shape_detection"})
+    _capture(camera, {"type": "shape_detection"})
+    assert len(camera.render_cache) == 0
+
+    seeded = {"type": "shape_detection", "seed": 7}
+    first = _capture(camera, seeded)
+    np.testing.assert_array_equal(_capture(camera, seeded), first)
+    assert len(camera.render_cache) == 1
+    # A fresh camera draws the same seeded scene.
+    other = Camera(resolution=(640, 480))
+    other.noise.read_noise = 0.0
+    np.testing.assert_array_equal(_capture(other, seeded), first)
@@ -25,6 +25,23 @@ def test_forward_kinematics():
     assert np.allclose(np.dot(R, R.T), np.eye(3), atol=1e-6)
     assert np.isclose(np.linalg.det(R), 1.0, atol=1e-6)
 
+def test_forward_kinematics_batch_matches_single():
+    """Batched FK reproduces per-configuration FK and joint positions."""
+    arm = RoboticArm()
+    rng = np.random.default_rng(0)
+    Q = rng.uniform(-np.pi / 2, np.pi / 2, size=(25, 6))
+
+    poses = arm.forward_kinematics_batch(Q)
+    assert poses.shape == (25, 4, 4)
+    for q, T in zip(Q, poses):
+        np.testing.assert_allclose(T, arm.forward_kinematics(q), atol=1e-12)
+
+    poses, frames = arm.forward_kinematics_batch(Q, return_frames=True)
+    assert frames.shape == (25, 7, 4, 4)
+    arm.joint_angles = Q[3].copy()
+    np.testing.assert_allclose(frames[3, :, :3, 3], np.array(arm.get_joint_positions()),
+                               atol=1e-12)
+
 def test_move_joint():
     """move_joint sets angles inside limits and rejects out-of-limit targets."""
     arm = RoboticArm()
@@ -56,11 +73,158 @@ def test_ik_recovers_reachable_pose():
     assert np.linalg.norm(arm._rotation_vector(R_err)) < 1.5e-2
 
 
+def test_analytic_ik_branches_reach_pose():
+    """Every closed-form branch lies within limits and reproduces the FK pose."""
+    arm = RoboticArm()
+    rng = np.random.default_rng(7)
+    for _ in range(50):
+        q_true = np.array([rng.uniform(lo, hi) for lo, hi in arm.joint_limits])
+        arm.joint_angles = q_true.copy()
+        position, rpy = arm.get_end_effector_pose()
+        arm.reset()
+
+        solutions = arm.calculate_analytic_ik(position, rpy)
+        assert 1 <= len(solutions) <= 4
+        for q in solutions:
+            assert arm._check_joint_limits(q)
+            T = arm.forward_kinematics(q)
+            assert np.linalg.norm(T[:3, 3] - position) < 1e-6
+            R_err = arm._rpy_to_matrix(rpy) @ T[:3, :3].T
+            assert np.linalg.norm(arm._rotation_vector(R_err)) < 1e-6
+
+
+def test_analytic_ik_rejects_pose_off_manifold():
+    """A pose the 5-axis chain cannot realize exactly has no closed-form branch."""
+    arm = RoboticArm()
+    assert arm.calculate_analytic_ik([0.5, 0.0, 0.3], [0.0, 0.0, 0.0]) == []
+
+
 def test_ik_unreachable_returns_none():
     arm = RoboticArm()
     assert arm.calculate_inverse_kinematics([5.0, 0.0, 0.0], [0.0, 0.0, 0.0]) is None
 
 
+def test_ik_batch_matches_single_target_solver():
+    """Batched DLS converges on the same targets as the single-target loop."""
+    arm = RoboticArm()
+    rng = np.random.default_rng(11)
+    targets = []
+    for q in rng.uniform(-1.0, 1.0, size=(12, 6)):
+        arm.joint_angles = q.copy()
+        position, rpy = arm.get_end_effector_pose()
+        targets.append(np.concatenate([position, rpy]))
+    targets.append([5.0, 0.0, 0.0, 0.0, 0.0, 0.0])  # out of reach
+    targets = np.array(targets)
+    arm.reset()
+
+    solutions, converged = arm.calculate_inverse_kinematics_batch(targets, use_analytic=False)
+    assert solutions.shape == (13, 6)
+    assert converged.tolist() == [True] * 12 + [False]
+    poses = arm.forward_kinematics_batch(solutions[:12])
+    np.testing.assert_allclose(poses[:, :3, 3], targets[:12, :3], atol=1.5e-3)
+    for target, ok in zip(targets, converged):
+        single = arm.calculate_inverse_kinematics(list(target[:3]), list(target[3:]),
+                                                  use_analytic=False)
+        assert (single is not None) == ok
+
+
+def _hard_target(arm):
+    """A pose the single-seed DLS loop cannot reach from the home position."""
+    rng = np.random.default_rng(2)
+    q = rng.uniform([l for l, _ in arm.joint_limits], [h for _, h in arm.joint_limits])
+    T = arm.forward_kinematics(q)
+    return T[:3, 3], arm._matrix_to_rpy(T)
+
+
+def test_multistart_ik_solves_hard_target():
+    arm = RoboticArm()
+    position, rpy = _hard_target(arm)
+    assert arm.calculate_inverse_kinematics(position, rpy, use_analytic=False,
+                                            use_seed_index=False) is None
+
+    solution, stats = arm.calculate_inverse_kinematics_multistart(position, rpy, random_seed=0)
+    assert stats["converged"]
+    assert stats["starts_converged"] >= 1
+    assert stats["winning_start"] > 0
+    T = arm.forward_kinematics(np.array(solution))
+    assert np.linalg.norm(T[:3, 3] - position) < 1e-3
+
+
+def test_multistart_batch_stops_after_the_first_converged_chunk(monkeypatch):
+    arm = RoboticArm()
+    evaluated = []
+    solve = arm.calculate_inverse_kinematics_batch
+
+    def count(targets, **kwargs):
+        evaluated.append(len(targets))
+        return solve(targets, **kwargs)
+
+    monkeypatch.setattr(arm, "calculate_inverse_kinematics_batch", count)
+    # The warm start in the first chunk solves an easy target.
+    T = arm.forward_kinematics(np.array([0.1, -0.1, 0.2, 0.0, 0.1, 0.0]))
+    _, stats = arm.calculate_inverse_kinematics_multistart(
+        T[:3, 3], arm._matrix_to_rpy(T), num_starts=8, chunk_size=2, random_seed=0)
+    assert stats["converged"] and stats["winning_start"] == 0
+    assert evaluated == [2]
+    assert stats["starts_launched"] == stats["starts_completed"] == 2
+
+    # Unreachable: every chunk runs.
+    evaluated.clear()
+    _, stats = arm.calculate_inverse_kinematics_multistart(
+        [5.0, 0.0, 0.0], [0.0, 0.0, 0.0], num_starts=8, chunk_size=3, max_iterations=20)
+    assert not stats["converged"]
+    assert evaluated == [3, 3, 2] and stats["starts_completed"] == 8
+
+
+def test_multistart_ik_process_pool():
+    arm = RoboticArm()
+    position, rpy = _hard_target(arm)
+    solution, stats = arm.calculate_inverse_kinematics_multistart(
+        position, rpy, executor="process", max_workers=2, random_seed=0)
+    assert stats["converged"]
+    assert 1 <= stats["starts_completed"] <= stats["starts_launched"]
+
+    # Unreachable: every start runs and the best residual comes back.
+    solution, stats = arm.calculate_inverse_kinematics_multistart(
+        [5.0, 0.0, 0.0], [0.0, 0.0, 0.0], num_starts=4, executor="process", max_workers=2)
+    assert not stats["converged"]
+    assert stats["starts_completed"] == 4
+    assert len(solution) == 6
+
+
+def test_lm_ik_converges_and_reports_progress():
+    arm = RoboticArm()
+    q_true = np.array([0.3, -0.4, 0.5, 0.2, 0.3, -0.1])
+    T = arm.forward_kinematics(q_true)
+    rpy = arm._matrix_to_rpy(T)
+
+    solution, stats = arm.calculate_inverse_kinematics_lm(T[:3, 3], rpy)
+    assert solution is not None and stats["converged"]
+    assert np.linalg.norm(arm.forward_kinematics(np.array(solution))[:3, 3] - T[:3, 3]) < 1e-3
+    # Only accepted steps are recorded, so the residual never increases.
+    assert np.all(np.diff(stats["residuals"]) <= 0)
+
+    # One FK pass per iteration, and a Jacobian only for the points it
+    # accepted on the way (the seed included, the solution excluded).
+    assert stats["fk_evaluations"] == stats["iterations"] + 1
+    assert stats["jacobian_evaluations"] == len(stats["residuals"]) - 1
+
+    solution, stats = arm.calculate_inverse_kinematics_lm([5.0, 0.0, 0.0], [0.0, 0.0, 0.0],
+                                                          max_iterations=50)
+    assert solution is None and not stats["converged"]
+
+
+def test_lm_ik_gives_up_when_progress_stalls():
+    """Seeds pinned against the joint limits stop long before the budget."""
+    arm = RoboticArm()
+    position, rpy = _hard_target(arm)
+    solution, stats = arm.calculate_inverse_kinematics_lm(position, rpy, seed=np.zeros(6))
+    assert solution is None and stats["stalled"]
+    assert stats["iterations"] < 200
+    residuals = stats["residuals"]
+    assert residuals[-11] - residuals[-1] < 0.01 * residuals[-1]
+
+
 def test_jacobian_matches_fk_perturbation():
     """Jacobian position block predicts FK translation for a small joint step."""
     arm = RoboticArm()
@@ -75,6 +239,18 @@ def test_jacobian_matches_fk_perturbation():
     new_angle = arm.move_joint(0, 2*np.pi)  # Try to move beyond limits
     assert -np.pi <= new_angle <= np.pi
 
+def test_analytic_jacobian_matches_numerical():
+    """The analytic Jacobian agrees with central differences on the FK."""
+    arm = RoboticArm()
+    for q in (np.zeros(6), np.array([0.2, -0.3, 0.4, 0.1, -0.2, 0.3]),
+              np.array([-1.1, 0.7, -2.0, 1.3, 0.9, -0.4])):
+        J_analytic = arm.jacobian(q)
+        J_numerical = arm.jacobian(q, method="numerical")
+        np.testing.assert_allclose(J_analytic, J_numerical, atol=1e-6)
+
+    with pytest.raises(ValueError):
+        arm.jacobian(np.zeros(6), method="bogus")
+
 def test_move_to_pose():
     """Test moving to a target pose."""
     arm = RoboticArm()
@@ -109,6 +285,37 @@ def test_get_end_effector_pose():
     assert np.all(np.isfinite(position))
     assert np.all(np.isfinite(orientation))
 
+def test_kinematic_state_cached_until_joints_change():
+    """Pose queries reuse one FK pass per configuration and see every update."""
+    arm = RoboticArm()
+    calls = []
+    frames = arm.kinematic_chain.frames
+    arm.kinematic_chain.frames = lambda q: calls.append(1) or frames(q)
+
+    arm.get_end_effector_pose()
+    arm.get_joint_positions()
+    arm.get_end_effector_pose()
+    assert len(calls) == 1
+
+    arm.move_joint(0, 0.5)
+    position, _ = arm.get_end_effector_pose()
+    assert len(calls) == 2
+    np.testing.assert_allclose(position, arm.forward_kinematics(arm.joint_angles)[:3, 3])
+
+    # In-place writes are picked up as well.
+    arm.joint_angles[2] = 0.3
+    np.testing.assert_allclose(arm.get_joint_positions()[-1],
+                               arm.forward_kinematics(arm.joint_angles)[:3, 3])
+
+
+def test_set_joint_angles_is_atomic():
+    arm = RoboticArm()
+    assert arm.set_joint_angles([0.1, 0.2, 0.3, 0.4, 0.5, 0.6])
+    before = arm.joint_angles.copy()
+    assert not arm.set_joint_angles([0.0, np.pi, 0.0, 0.0, 0.0, 0.0])
+    np.testing.assert_array_equal(arm.joint_angles, before)
+
+
 def test_reset():
     """Test resetting the arm."""
     arm = RoboticArm()
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from app.models.camera import Camera
+from app.models.sensor_noise import SensorNoise
+
+SHAPE = (120, 160, 3)
+
+
+def _noisy(noise, value):
+    image = np.full(SHAPE, value, dtype=np.uint8)
+    return noise.apply(image).astype(float)
+
+
+def test_read_noise_statistics_and_gain():
+    noise = SensorNoise(read_noise=10.0, seed=0)
+    frame = _noisy(noise, 128)
+    assert frame.mean() == pytest.approx(128, abs=0.5)
+    assert frame.std() == pytest.approx(10, rel=0.05)
+
+    noise.gain = 2.0
+    assert _noisy(noise, 128).std() == pytest.approx(20, rel=0.05)
+
+
+def test_saturates_instead_of_wrapping():
+    noise = SensorNoise(read_noise=10.0, seed=0)
+    dark = _noisy(noise, 0)
+    # Negative noise clips to 0: the mean of max(0, N(0, 10)) is about 4.
+    assert dark.mean() == pytest.approx(10 / np.sqrt(2 * np.pi), rel=0.1)
+    bright = _noisy(noise, 255)
+    assert bright.mean() == pytest.approx(255 - 10 / np.sqrt(2 * np.pi), rel=0.01)
+
+
+def test_shot_noise_grows_with_signal():
+    noise = SensorNoise(read_noise=0.0, shot_noise=1.0, seed=0)
+    assert _noisy(noise, 0).std() == 0.0
+    assert _noisy(noise, 16).std() == pytest.approx(4.0, rel=0.1)
+    assert _noisy(noise, 100).std() == pytest.approx(10.0, rel=0.1)
+
+
+def test_fixed_pattern_repeats_across_frames():
+    noise = SensorNoise(read_noise=0.0, fixed_pattern_noise=5.0, seed=0)
+    first, second = _noisy(noise, 128), _noisy(noise, 128)
+    np.testing.assert_array_equal(first, second)
+    assert first.std() == pytest.approx(5, rel=0.1)
+
+
+def test_seeded_cameras_are_reproducible():
+    frames = []
+    for _ in range(2):
+        camera = Camera(resolution=(64, 48), noise_seed=3)
+        image, _ = camera.capture_image(np.zeros(3), np.zeros(3), {"type": "text_reading"})
+        frames.append(image.copy())
+    np.testing.assert_array_equal(*frames)
+
+
+def test_batch_noise_is_independent_per_frame():
+    noise = SensorNoise(read_noise=10.0, seed=0)
+    frames = np.full((10,) + SHAPE, 128, dtype=np.uint8)  # several stacks
+    noise.apply_batch(frames)
+    deltas = frames.reshape(len(frames), -1).astype(float) - 128
+    assert deltas.std(axis=1) == pytest.approx(np.full(10, 10.0), rel=0.1)
+    correlation = np.corrcoef(deltas)
+    assert np.abs(correlation[np.triu_indices(10, 1)]).max() < 0.1
+
+    # A non-contiguous stack takes the numpy path with the same saturation.
+    strided = np.zeros((4,) + SHAPE, dtype=np.uint8)[::2]
+    noise.apply_batch(strided)
+    assert strided.mean() == pytest.approx(10 / np.sqrt(2 * np.pi), rel=0.1)
@@ -0,0 +1,64 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from app.models.trajectory import JointTrajectory
+from app.services.inspection_service import InspectionService
+from app.services.sequence_optimizer import (nearest_neighbor_tour, optimize_sequence,
+                                             tour_cost, travel_time_matrix, two_opt)
+
+V_MAX = np.full(6, 1.0)
+A_MAX = np.full(6, 2.0)
+
+
+def test_travel_time_matrix_matches_planned_moves():
+    Q = np.random.default_rng(0).uniform(-2, 2, (5, 6))
+    cost = travel_time_matrix(Q, V_MAX, A_MAX)
+    np.testing.assert_allclose(np.diag(cost), 0.0)
+    np.testing.assert_allclose(cost, cost.T)
+    assert cost[1, 3] == pytest.approx(JointTrajectory(Q[1], Q[3], V_MAX, A_MAX).duration)
+
+
+def test_optimized_order_is_near_optimal_and_never_worse():
+    rng = np.random.default_rng(1)
+    for _ in range(5):
+        Q = rng.uniform(-2, 2, (7, 6))
+        report = optimize_sequence(Q, V_MAX, A_MAX, start=np.zeros(6))
+        assert sorted(report["order"]) == list(range(7))
+        assert report["travel_time"] <= report["naive_travel_time"] + 1e-12
+
+        cost = travel_time_matrix(np.vstack([np.zeros(6), Q]), V_MAX, A_MAX)
+        optimal = min(tour_cost([0, *perm], cost) for perm in itertools.permutations(range(1, 8)))
+        assert report["travel_time"] <= optimal * 1.05
+        assert tour_cost([0] + [i + 1 for i in report["order"]], cost) == pytest.approx(report["travel_time"])
+
+
+def test_two_opt_untangles_a_crossing():
+    """Points on a line visited out of order are straightened by 2-opt."""
+    Q = np.zeros((5, 6))
+    Q[:, 0] = [0.0, 2.0, 1.0, 3.0, 4.0]
+    cost = travel_time_matrix(Q, V_MAX, A_MAX)
+    assert two_opt([0, 1, 2, 3, 4], cost) == [0, 2, 1, 3, 4]
+    assert nearest_neighbor_tour(cost) == [0, 2, 1, 3, 4]
+
+
+def test_service_reorders_solved_steps(tmp_path):
+    service = InspectionService(config_path=tmp_path / "config.json",
+                                reachability_map_path=tmp_path / "map.npz",
+                                plan_cache_path=tmp_path / "plans")
+    angles = np.array([2.0, 0.5, 1.5, 1.0])
+    plan = {
+        "sequence": [{"description": f"p{i}"} for i in range(5)],
+        "ik_solutions": np.zeros((5, 6)),
+        "ik_converged": np.array([True, True, True, True, False]),
+        "sequence_report": None,
+    }
+    plan["ik_solutions"][:4, 0] = angles
+
+    service._optimize_step_order(plan)
+
+    assert [p["description"] for p in plan["sequence"]] == ["p1", "p3", "p2", "p0", "p4"]
+    np.testing.assert_allclose(plan["ik_solutions"][:4, 0], np.sort(angles))
+    assert not plan["ik_converged"][-1]
+    assert plan["sequence_report"]["travel_time"] < plan["sequence_report"]["naive_travel_time"]
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from app.controllers.robotic_arm_controller import RoboticArmController
+from app.models.robotic_arm import RoboticArm
+from app.models.trajectory import JointTrajectory, MotionProfile, TimeOptimalTrajectory
+
+
+WAYPOINTS = np.array([
+    [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    [0.5, 0.3, -0.4, 0.2, 0.1, 0.0],
+    [1.0, -0.2, 0.3, 0.6, -0.4, 0.2],
+    [1.4, 0.1, 0.8, 0.0, -1.0, 0.5],
+])
+START = np.zeros(6)
+GOAL = np.array([1.2, -0.4, 0.8, 0.1, -1.5, 0.0])
+V_MAX = np.full(6, 1.0)
+A_MAX = np.full(6, 2.0)
+J_MAX = np.full(6, 10.0)
+
+
+@pytest.mark.parametrize("profile", ["trapezoidal", "s_curve"])
+def test_trajectory_respects_limits_and_reaches_goal(profile):
+    traj = JointTrajectory(START, GOAL, V_MAX, A_MAX, J_MAX, profile=profile)
+    times = np.linspace(0.0, traj.duration, 2001)
+    pos, vel, acc = traj.sample(times)
+    np.testing.assert_allclose(pos[0], START)
+    np.testing.assert_allclose(pos[-1], GOAL)
+    np.testing.assert_allclose(vel[[0, -1]], 0.0, atol=1e-9)
+    assert np.all(np.abs(vel) <= V_MAX + 1e-9)
+    assert np.all(np.abs(acc) <= A_MAX + 1e-9)
+    if profile == "s_curve":
+        jerk = np.diff(acc, axis=0) / np.diff(times)[:, None]
+        assert np.all(np.abs(jerk) <= J_MAX + 1e-6)
+
+
+def test_joints_are_synchronized_by_the_slowest_joint():
+    """The largest move sets the duration; every joint stops at the same time."""
+    traj = JointTrajectory(START, GOAL, V_MAX, A_MAX, profile="trapezoidal")
+    alone = MotionProfile.trapezoidal(1.0 / 1.5, 2.0 / 1.5)
+    assert traj.duration == pytest.approx(alone.duration)
+    _, vel, _ = traj.sample(np.array([traj.duration / 2]))
+    # Velocities are proportional to displacement along the straight path.
+    np.testing.assert_allclose(vel[0] * 1.5 / np.abs(vel[0]).max(), np.abs(GOAL) * np.sign(vel[0]),
+                               atol=1e-12)
+
+
+def test_s_curve_is_slower_than_trapezoid_and_needs_jerk():
+    trap = JointTrajectory(START, GOAL, V_MAX, A_MAX, profile="trapezoidal")
+    scurve = JointTrajectory(START, GOAL, V_MAX, A_MAX, J_MAX, profile="s_curve")
+    assert scurve.duration > trap.duration
+    with pytest.raises(ValueError):
+        JointTrajectory(START, GOAL, V_MAX, A_MAX, profile="s_curve")
+    with pytest.raises(ValueError):
+        JointTrajectory(START, GOAL, V_MAX, A_MAX, profile="cubic")
+
+
+def test_uniform_sampling_and_zero_length_move():
+    traj = JointTrajectory(START, GOAL, V_MAX, A_MAX)
+    times, positions = traj.sample_uniform(0.01)
+    assert times[-1] == pytest.approx(traj.duration)
+    np.testing.assert_allclose(positions[-1], GOAL)
+    still = JointTrajectory(GOAL, GOAL, V_MAX, A_MAX)
+    assert still.duration == 0.0
+    np.testing.assert_allclose(still.sample(np.array([0.0, 1.0]))[0], [GOAL, GOAL])
+
+
+def test_controller_records_motion_duration():
+    controller = RoboticArmController(RoboticArm())
+    assert controller.move_to_joint_angles(list(GOAL))
+    assert controller.last_trajectory is not None
+    assert controller.total_motion_time == pytest.approx(controller.last_trajectory.duration)
+    assert controller.total_motion_time > 0
+
+
+def test_time_optimal_path_respects_limits_and_visits_waypoints():
+    traj = TimeOptimalTrajectory(WAYPOINTS, V_MAX, A_MAX)
+    times = np.linspace(0.0, traj.duration, 5001)
+    pos, vel, acc = traj.sample(times)
+    np.testing.assert_allclose(pos[[0, -1]], WAYPOINTS[[0, -1]], atol=1e-12)
+    np.testing.assert_allclose(vel[[0, -1]], 0.0, atol=1e-9)
+    assert np.all(np.abs(vel) <= V_MAX * 1.001)
+    assert np.all(np.abs(acc) <= A_MAX * 1.001)
+    # The spline passes through every waypoint.
+    np.testing.assert_allclose(traj.path(traj.path.x), WAYPOINTS, atol=1e-12)
+
+
+def test_time_optimal_matches_trapezoid_on_straight_path_and_beats_stopping():
+    straight = TimeOptimalTrajectory(WAYPOINTS[[0, -1]], V_MAX, A_MAX, grid_points=400)
+    trapezoid = JointTrajectory(WAYPOINTS[0], WAYPOINTS[-1], V_MAX, A_MAX)
+    assert straight.duration == pytest.approx(trapezoid.duration, rel=1e-3)
+
+    stop_at_each = sum(JointTrajectory(a, b, V_MAX, A_MAX).duration
+                       for a, b in zip(WAYPOINTS[:-1], WAYPOINTS[1:]))
+    assert TimeOptimalTrajectory(WAYPOINTS, V_MAX, A_MAX).duration < stop_at_each
+
+
+def test_controller_moves_along_path():
+    controller = RoboticArmController(RoboticArm())
+    assert controller.move_along_path(WAYPOINTS[1:])
+    np.testing.assert_allclose(controller.arm.joint_angles, WAYPOINTS[-1])
+    assert isinstance(controller.last_trajectory, TimeOptimalTrajectory)
+    assert not controller.move_along_path([[10.0, 0, 0, 0, 0, 0]])